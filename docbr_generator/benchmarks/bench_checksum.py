@@ -0,0 +1,77 @@
+"""Microbenchmark the scalar check-digit path: lookup tables vs the old zip/sum loop.
+
+Run from the project root after `pip install -e ".[dev]"`:
+
+    python benchmarks/bench_checksum.py --count 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import timeit
+from collections.abc import Callable
+
+from docbr_generator import cnpj, cpf
+
+_DIGITS_ONLY = re.compile(r"^\d+$")
+
+
+def _legacy_mod11(digits: str, weights: list[int]) -> int:
+    total = sum(int(d) * w for d, w in zip(digits, weights, strict=True))
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def _legacy_cpf_check_digits(base9: str) -> str:
+    if len(base9) != 9 or not _DIGITS_ONLY.fullmatch(base9):
+        raise ValueError("CPF base must be exactly 9 digits")
+    d1 = _legacy_mod11(base9, list(range(10, 1, -1)))
+    d2 = _legacy_mod11(base9 + str(d1), list(range(11, 1, -1)))
+    return f"{d1}{d2}"
+
+
+def _legacy_cpf_is_valid(value: str) -> bool:
+    if len(value) != 11 or not _DIGITS_ONLY.fullmatch(value):
+        return False
+    if value == value[0] * 11:
+        return False
+    return value[-2:] == _legacy_cpf_check_digits(value[:9])
+
+
+def _per_second(count: int, func: Callable[[], object]) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=3))
+    return count / best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    bases = [f"{rng.randrange(10**9):09d}" for _ in range(args.count)]
+    values = [cpf.generate(rng) for _ in range(args.count)]
+
+    cases = [
+        (
+            "cpf check digits (legacy)",
+            lambda: [_legacy_cpf_check_digits(b) for b in bases],
+        ),
+        (
+            "cpf check digits (tables)",
+            lambda: [cpf.calculate_check_digits(b) for b in bases],
+        ),
+        ("cpf is_valid (legacy)", lambda: [_legacy_cpf_is_valid(v) for v in values]),
+        ("cpf is_valid (tables)", lambda: [cpf.is_valid(v) for v in values]),
+        ("cpf generate (tables)", lambda: [cpf.generate(rng) for _ in bases]),
+        ("cnpj generate (tables)", lambda: [cnpj.generate(rng) for _ in bases]),
+    ]
+    for label, func in cases:
+        print(f"{label:<28} {_per_second(args.count, func):>12,.0f}/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
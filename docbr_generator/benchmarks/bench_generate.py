@@ -0,0 +1,88 @@
+"""Compare scalar generate() loops against the vectorized generate_many() batches.
+
+Run from the project root after `pip install -e ".[dev]"`:
+
+    python benchmarks/bench_generate.py --count 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from docbr_generator import cnpj, cpf
+
+# Rough population shares (millions) of the largest UFs, for the weighted case.
+_UF_WEIGHTS = {"SP": 46, "MG": 21, "RJ": 17, "BA": 15, "PR": 12, "RS": 11, "PE": 9}
+
+
+def _rate(label: str, count: int, func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    per_second = count / elapsed if elapsed else float("inf")
+    print(f"{label:<32} {count:>10,} in {elapsed:8.3f}s  ({per_second:>14,.0f}/s)")
+    return per_second
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    scalar = _rate(
+        "cpf.generate (loop)",
+        args.count,
+        lambda: [cpf.generate(rng) for _ in range(args.count)],
+    )
+    bulk = _rate(
+        "cpf.generate_many (str)",
+        args.count,
+        lambda: cpf.generate_many(args.count, rng=args.seed),
+    )
+    _rate(
+        "cpf.generate_many (array)",
+        args.count,
+        lambda: cpf.generate_many(args.count, rng=args.seed, output="array"),
+    )
+    _rate(
+        "cpf.generate_many (by UF)",
+        args.count,
+        lambda: cpf.generate_many(
+            args.count, rng=args.seed, output="array", region_weights=_UF_WEIGHTS
+        ),
+    )
+    print(f"cpf speedup (str output): {bulk / scalar:.1f}x")
+
+    scalar = _rate(
+        "cnpj.generate (loop)",
+        args.count,
+        lambda: [cnpj.generate(rng) for _ in range(args.count)],
+    )
+    bulk = _rate(
+        "cnpj.generate_many (str)",
+        args.count,
+        lambda: cnpj.generate_many(args.count, rng=args.seed),
+    )
+    _rate(
+        "cnpj.generate_many (bytes)",
+        args.count,
+        lambda: cnpj.generate_many(args.count, rng=args.seed, output="bytes"),
+    )
+    _rate(
+        "cnpj.generate_many (50 branches)",
+        args.count,
+        lambda: cnpj.generate_many(
+            args.count, branches=range(1, 51), rng=args.seed, output="array"
+        ),
+    )
+    print(f"cnpj speedup (str output): {bulk / scalar:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
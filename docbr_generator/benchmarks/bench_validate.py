@@ -0,0 +1,69 @@
+"""Compare scalar is_valid() rows/second against the bulk validate_many() mask.
+
+Run from the project root after `pip install -e ".[dev]"`:
+
+    python benchmarks/bench_validate.py --count 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from docbr_generator import cnpj, cpf, validate_many
+
+
+def _rate(label: str, count: int, func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    per_second = count / elapsed if elapsed else float("inf")
+    print(f"{label:<32} {count:>10,} in {elapsed:8.3f}s  ({per_second:>14,.0f} rows/s)")
+    return per_second
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for kind, module in (("cpf", cpf), ("cnpj", cnpj)):
+        values = module.generate_many(args.count, rng=args.seed)
+        as_bytes = np.array(values, dtype="S")
+        scalar = _rate(
+            f"{kind}.is_valid (loop)",
+            args.count,
+            lambda: [module.is_valid(value) for value in values],
+        )
+        bulk = _rate(
+            f"validate_many {kind} (list)",
+            args.count,
+            lambda: validate_many(values, kind=kind),
+        )
+        _rate(
+            f"validate_many {kind} (S array)",
+            args.count,
+            lambda: validate_many(as_bytes, kind=kind),
+        )
+        print(f"{kind} speedup (list input): {bulk / scalar:.1f}x")
+
+    half = args.count // 2
+    mixed = np.array(
+        cnpj.generate_many(half, rng=args.seed)
+        + cnpj.generate_many(args.count - half, rng=args.seed, alphanumeric=True),
+        dtype="S",
+    )
+    _rate(
+        "validate_many cnpj (mixed alnum)",
+        args.count,
+        lambda: validate_many(mixed, kind="cnpj", alphanumeric=True),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
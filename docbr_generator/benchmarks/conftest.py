@@ -0,0 +1,16 @@
+"""Keep pytest-benchmark baselines in benchmarks/baselines, whatever the cwd."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+_BASELINES = Path(__file__).resolve().parent / "baselines"
+_DEFAULT_STORAGE = "file://./.benchmarks"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Runs before pytest-benchmark's own (trylast) hook opens the storage.
+    if getattr(config.option, "benchmark_storage", None) == _DEFAULT_STORAGE:
+        config.option.benchmark_storage = f"file://{_BASELINES}"
@@ -0,0 +1,145 @@
+"""Load-test the `docbr-generator serve` HTTP endpoint with keep-alive clients.
+
+Run from the project root after `pip install -e ".[dev]"`; without --port a
+server is started on a free local port for the duration of the run:
+
+    python benchmarks/load_server.py --connections 64 --duration 10
+    python benchmarks/load_server.py --path "/cnpj?count=100&masked=1"
+    python benchmarks/load_server.py --port 8080 --pipeline 16
+
+The client shares the machine (and with one core, the CPU) with the server, so
+pipelining several requests per connection gives a truer server-side figure.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+
+_VALIDATE_BODY = b"529.982.247-25\n52998224726\n" * 50
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response (Content-Length or chunked); return its status."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = dict(
+        (name.strip().lower(), value.strip())
+        for name, _, value in (line.partition(":") for line in lines[1:] if line)
+    )
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    else:
+        while size := int(await reader.readline(), 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    return int(lines[0].split(" ")[1])
+
+
+async def _client(
+    host: str,
+    port: int,
+    request: bytes,
+    pipeline: int,
+    deadline: float,
+    latencies: list[float],
+) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+    failures = 0
+    batch = request * pipeline
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(batch)
+            for _ in range(pipeline):
+                if await _read_response(reader) != 200:
+                    failures += 1
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+    return failures
+
+
+async def _load(args: argparse.Namespace, port: int) -> None:
+    method = "POST" if args.path.startswith("/validate") else "GET"
+    body = _VALIDATE_BODY if method == "POST" else b""
+    request = (
+        f"{method} {args.path} HTTP/1.1\r\nHost: {args.host}\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+    latencies: list[float] = []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    failures = await asyncio.gather(
+        *(
+            _client(args.host, port, request, args.pipeline, deadline, latencies)
+            for _ in range(args.connections)
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    requests = len(latencies) * args.pipeline
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{method} {args.path}: {requests:,} requests in {elapsed:.2f}s "
+        f"({requests / elapsed:,.0f} req/s), {sum(failures):,} non-200"
+    )
+    print(
+        f"round trip of {args.pipeline} request(s): "
+        f"p50 {p50:.2f} ms, p99 {p99:.2f} ms"
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(port: int) -> subprocess.Popen[bytes]:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "docbr_generator", "serve", "--port", str(port)],
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise SystemExit("server did not start")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--path", default="/cpf?count=1")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--pipeline", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    server = None
+    port = args.port
+    if port is None:
+        port = _free_port()
+        server = _start_server(port)
+    try:
+        asyncio.run(_load(args, port))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
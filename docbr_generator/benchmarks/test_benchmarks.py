@@ -0,0 +1,150 @@
+"""Throughput, cold-start and memory benchmarks (pytest-benchmark).
+
+Groups: scalar (generate / is_valid / repair per call), bulk (generate_many,
+validate_many, write_documents per 100k batch), startup (CLI process) and
+memory (tracemalloc peak per million values, kept in extra_info and checked
+against a budget).
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from docbr_generator import cnpj, cpf
+
+pytest.importorskip("pytest_benchmark")
+
+_BATCH = 100_000
+_SRC = Path(__file__).resolve().parents[1] / "src"
+# tracemalloc peak per million values; ~2x what 0.1.0 measured.
+_MEMORY_BUDGETS = {
+    ("cpf", "array"): 130_000_000,
+    ("cnpj", "array"): 160_000_000,
+    ("cpf", "str"): 270_000_000,
+    ("cnpj", "str"): 330_000_000,
+}
+_GENERATORS = {"cpf": cpf.generate_many, "cnpj": cnpj.generate_many}
+
+
+@pytest.fixture
+def np():
+    return pytest.importorskip("numpy")
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_cpf_generate(benchmark) -> None:
+    value = benchmark(cpf.generate, random.Random(0))
+    assert cpf.is_valid(value)
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_cnpj_generate(benchmark) -> None:
+    value = benchmark(cnpj.generate, random.Random(0))
+    assert cnpj.is_valid(value)
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_cpf_is_valid(benchmark) -> None:
+    assert benchmark(cpf.is_valid, "52998224725")
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_cnpj_is_valid(benchmark) -> None:
+    assert benchmark(cnpj.is_valid, "11222333000181")
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_cnpj_is_valid_alphanumeric(benchmark) -> None:
+    assert benchmark(cnpj.is_valid, "12ABC34501DE35", alphanumeric=True)
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_repair_candidates(benchmark) -> None:
+    from docbr_generator.repair import candidates
+
+    assert "52998224725" in benchmark(candidates, "52998224752", kind="cpf")
+
+
+@pytest.mark.benchmark(group="bulk")
+@pytest.mark.parametrize("output", ["str", "array"])
+def test_cpf_generate_many(benchmark, np, output: str) -> None:
+    benchmark(cpf.generate_many, _BATCH, rng=0, output=output)
+
+
+@pytest.mark.benchmark(group="bulk")
+@pytest.mark.parametrize("output", ["str", "bytes"])
+def test_cnpj_generate_many(benchmark, np, output: str) -> None:
+    benchmark(cnpj.generate_many, _BATCH, rng=0, output=output)
+
+
+@pytest.mark.benchmark(group="bulk")
+def test_cpf_generate_many_by_region(benchmark, np) -> None:
+    weights = {"SP": 46, "MG": 21, "RJ": 17, "BA": 15}
+    benchmark(
+        cpf.generate_many, _BATCH, rng=0, output="array", region_weights=weights
+    )
+
+
+@pytest.mark.benchmark(group="bulk")
+@pytest.mark.parametrize("document", ["cpf", "cnpj"])
+def test_validate_many(benchmark, np, document: str) -> None:
+    from docbr_generator import validate_many
+
+    values = _GENERATORS[document](_BATCH, rng=0)
+    mask = benchmark(validate_many, values, kind=document)
+    assert mask.all()
+
+
+@pytest.mark.benchmark(group="bulk")
+@pytest.mark.parametrize("fmt", ["lines", "copy"])
+def test_write_documents(benchmark, np, fmt: str) -> None:
+    from docbr_generator.stream import write_documents
+
+    with open(os.devnull, "wb") as sink:
+        benchmark(write_documents, sink, "cpf", _BATCH, fmt=fmt, rng=0, masked=True)
+
+
+@pytest.mark.benchmark(group="startup")
+@pytest.mark.parametrize("document", ["cpf", "cnpj"])
+def test_cli_cold_start(benchmark, tmp_path: Path, document: str) -> None:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(_SRC),
+        "DOCBR_GENERATOR_SOCKET": str(tmp_path / "no-daemon.sock"),
+    }
+    command = [sys.executable, "-m", "docbr_generator", document]
+    benchmark.pedantic(
+        subprocess.run,
+        args=(command,),
+        kwargs={"check": True, "stdout": subprocess.DEVNULL, "env": env},
+        rounds=20,
+        warmup_rounds=2,
+    )
+
+
+@pytest.mark.benchmark(group="memory")
+@pytest.mark.parametrize(
+    ("document", "output"),
+    [("cpf", "array"), ("cnpj", "array"), ("cpf", "str"), ("cnpj", "str")],
+)
+def test_generate_many_memory_per_million(
+    benchmark, np, document: str, output: str
+) -> None:
+    def peak_bytes() -> int:
+        tracemalloc.start()
+        try:
+            _GENERATORS[document](1_000_000, rng=0, output=output)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak = benchmark.pedantic(peak_bytes, rounds=1)
+    benchmark.extra_info["peak_bytes_per_million"] = peak
+    assert peak < _MEMORY_BUDGETS[document, output]
@@ -1,3 +1,20 @@
 """Generate algorithmically valid Brazilian CPF/CNPJ numbers (digits only)."""
 
+from __future__ import annotations
+
 __version__ = "0.1.0"
+
+__all__ = ["Generator", "validate_many"]
+
+
+def __getattr__(name: str) -> object:
+    # Imported on first use so `python -m docbr_generator cpf` stays fast to start.
+    if name == "Generator":
+        from docbr_generator.generator import Generator
+
+        return Generator
+    if name == "validate_many":
+        from docbr_generator.validation import validate_many
+
+        return validate_many
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
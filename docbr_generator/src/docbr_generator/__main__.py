@@ -1,4 +1,4 @@
-from docbr_generator.cli import main
+from docbr_generator.fastpath import main
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,57 @@
+"""Table-driven Mod-11 check digits shared by CPF and CNPJ.
+
+Each position gets a 256-entry table indexed by the raw ASCII byte and holding
+(byte - 48) * weight % 11, so the ASCII → int translation and the multiply are
+one lookup. A weighted sum is then a single C-level map over the encoded base.
+Letters A-Z use the same ASCII - 48 rule, which is what alphanumeric CNPJs need.
+"""
+
+from __future__ import annotations
+
+from operator import getitem
+
+from docbr_generator._typecheck import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# ASCII byte → character value (0-9 → 0-9, A-Z → 17-42); others map to None.
+# Callers validate characters first, so None entries are never summed.
+ASCII_VALUES: tuple[int | None, ...] = tuple(
+    code - 48 if 48 <= code <= 57 or 65 <= code <= 90 else None
+    for code in range(256)
+)
+
+# remainder → check digit character (remainders 0 and 1 give "0").
+_CHECK_CHARS = "00" + "".join(str(11 - r) for r in range(2, 11))
+
+
+def contribution_tables(weights: Sequence[int]) -> tuple[tuple[int, ...], ...]:
+    """Return one byte-indexed (value * weight % 11) table per weighted position."""
+    return tuple(
+        tuple(0 if value is None else value * weight % 11 for value in ASCII_VALUES)
+        for weight in weights
+    )
+
+
+def check_digits(
+    base: bytes,
+    tables_d1: tuple[tuple[int, ...], ...],
+    tables_d2: tuple[tuple[int, ...], ...],
+) -> str:
+    """Return both check digits for an ASCII base already known to be valid.
+
+    tables_d2 has one more position than base; it weighs the first check digit.
+    """
+    d1 = _CHECK_CHARS[sum(map(getitem, tables_d1, base)) % 11]
+    total = sum(map(getitem, tables_d2, base)) + tables_d2[len(base)][ord(d1)]
+    return d1 + _CHECK_CHARS[total % 11]
+
+
+def is_ascii_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def is_ascii_alphanumeric(value: str) -> bool:
+    """True for non-empty strings of 0-9 and uppercase A-Z only."""
+    return value.isascii() and value.isalnum() and value.upper() == value
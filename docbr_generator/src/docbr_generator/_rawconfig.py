@@ -0,0 +1,84 @@
+"""Dependency-light TOML config loading, shared by config and the CLI fast path.
+
+Parsed TOML is cached next to the file as `.<name>.marshal`, keyed by the file's
+mtime and size, so repeat loads skip importing and running tomllib. Only os and
+marshal (plus the tiny _typecheck flag) are imported here: no pathlib, dataclasses
+or typing.
+"""
+
+from __future__ import annotations
+
+import marshal
+import os
+
+from docbr_generator._typecheck import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+)
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, "config.toml")
+EXAMPLE_CONFIG_PATH = os.path.join(PROJECT_ROOT, "config.toml.example")
+
+
+def cache_path(path: str | os.PathLike[str]) -> str:
+    head, name = os.path.split(os.fspath(path))
+    return os.path.join(head, f".{name}.marshal")
+
+
+def _read_cache(cache: str, key: tuple[int, int]) -> dict[str, Any] | None:
+    try:
+        with open(cache, "rb") as handle:
+            cached_key, data = marshal.load(handle)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if tuple(cached_key) != key or not isinstance(data, dict):
+        return None
+    return data
+
+
+def _write_cache(cache: str, key: tuple[int, int], data: dict[str, Any]) -> None:
+    try:
+        payload = marshal.dumps((key, data))
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp, cache)
+    except (OSError, ValueError):
+        # Read-only directory, or values marshal cannot store (TOML datetimes).
+        pass
+
+
+def load_toml(path: str | os.PathLike[str]) -> dict[str, Any]:
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cache = cache_path(path)
+    cached = _read_cache(cache, key)
+    if cached is not None:
+        return cached
+
+    import tomllib
+
+    with open(path, "rb") as handle:
+        loaded = tomllib.load(handle)
+    if not isinstance(loaded, dict):
+        raise TypeError(f"Config root must be a table: {path}")
+    _write_cache(cache, key, loaded)
+    return loaded
+
+
+def load_raw(
+    config_path: str | os.PathLike[str] | None = None,
+    *,
+    example_path: str | os.PathLike[str] | None = None,
+) -> dict[str, Any]:
+    """Return the local config table if present, else the example's, else {}."""
+    for path in (
+        config_path or DEFAULT_CONFIG_PATH,
+        example_path or EXAMPLE_CONFIG_PATH,
+    ):
+        if os.path.isfile(path):
+            return load_toml(path)
+    return {}
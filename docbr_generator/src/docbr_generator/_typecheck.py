@@ -0,0 +1,6 @@
+"""typing.TYPE_CHECKING without importing typing, for the CLI fast path.
+
+Type checkers treat any name TYPE_CHECKING as true; at runtime it is False.
+"""
+
+TYPE_CHECKING = False
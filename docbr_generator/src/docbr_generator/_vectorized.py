@@ -0,0 +1,157 @@
+"""NumPy helpers shared by the bulk CPF/CNPJ generators (requires numpy)."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from docbr_generator.bitset import Bitset
+
+_ASCII_ZERO = ord("0")
+_OUTPUTS = ("str", "bytes", "array")
+
+# Character values (ASCII - 48) of 0-9 and A-Z, for alphanumeric CNPJ roots.
+ALPHANUMERIC_VALUES = np.array([*range(10), *range(17, 43)], dtype=np.uint8)
+
+# ASCII byte → character value; 255 marks bytes outside the alphabet.
+DIGIT_LOOKUP = np.full(256, 255, dtype=np.uint8)
+DIGIT_LOOKUP[48:58] = np.arange(10)
+ALPHANUMERIC_LOOKUP = DIGIT_LOOKUP.copy()
+ALPHANUMERIC_LOOKUP[65:91] = np.arange(17, 43)
+
+
+def as_generator(rng: np.random.Generator | int | None) -> np.random.Generator:
+    """Return rng if it is a Generator, else a new Generator seeded with it."""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def check_output(output: str) -> None:
+    if output not in _OUTPUTS:
+        raise ValueError(
+            f"output must be one of {', '.join(_OUTPUTS)}; got {output!r}"
+        )
+
+
+def mod11_check_digits(digits: np.ndarray, weights: Sequence[int]) -> np.ndarray:
+    """Return the Mod-11 check digit for every row of an (n, k) digit matrix."""
+    totals = digits @ np.asarray(weights, dtype=np.int32)
+    remainder = totals % 11
+    return np.where(remainder < 2, 0, 11 - remainder).astype(np.uint8)
+
+
+def all_same_digit_rows(digits: np.ndarray) -> np.ndarray:
+    return (digits == digits[:, :1]).all(axis=1)
+
+
+def random_digits(
+    gen: np.random.Generator,
+    n: int,
+    width: int,
+    symbols: np.ndarray | None = None,
+) -> np.ndarray:
+    """Draw an (n, width) digit matrix, redrawing rows whose digits are all the same.
+
+    symbols, if given, maps each drawn index to a character value (e.g.
+    ALPHANUMERIC_VALUES); the default draws plain digits 0-9.
+    """
+
+    def draw(rows: int) -> np.ndarray:
+        high = 10 if symbols is None else symbols.size
+        indices = gen.integers(0, high, size=(rows, width), dtype=np.uint8)
+        return indices if symbols is None else symbols[indices]
+
+    digits = draw(n)
+    rejected = np.flatnonzero(all_same_digit_rows(digits))
+    while rejected.size:
+        digits[rejected] = draw(rejected.size)
+        rejected = rejected[all_same_digit_rows(digits[rejected])]
+    return digits
+
+
+def alias_table(weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Build a Vose alias table (prob, alias) for a non-negative weight vector.
+
+    Each bucket i keeps i with probability prob[i] and otherwise yields
+    alias[i], so sampling costs one uniform index and one uniform float.
+    """
+    size = weights.size
+    scaled = np.asarray(weights, dtype=np.float64) * (size / weights.sum())
+    prob = np.ones(size, dtype=np.float64)
+    alias = np.arange(size, dtype=np.intp)
+    small = [i for i in range(size) if scaled[i] < 1.0]
+    large = [i for i in range(size) if scaled[i] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Leftovers are 1.0 up to rounding error and keep prob 1.
+    return prob, alias
+
+
+def alias_sample(
+    gen: np.random.Generator, prob: np.ndarray, alias: np.ndarray, n: int
+) -> np.ndarray:
+    """Draw n bucket indices from an alias_table in O(1) per sample."""
+    buckets = gen.integers(0, prob.size, size=n)
+    keep = gen.random(n) < prob[buckets]
+    return np.where(keep, buckets, alias[buckets])
+
+
+def int_digits(values: np.ndarray, width: int) -> np.ndarray:
+    """Split ints into an (n, width) digit matrix, most significant digit first."""
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    columns = np.asarray(values, dtype=np.int64)[:, None] // powers % 10
+    return columns.astype(np.uint8)
+
+
+def unique_bases(
+    gen: np.random.Generator,
+    n: int,
+    width: int,
+    seen: Bitset | None = None,
+) -> np.ndarray:
+    """Draw n distinct width-digit bases as ints, in draw order.
+
+    All-same-digit bases are skipped, as are bases already in seen; the chosen
+    bases are added to seen so later calls sharing it never repeat them.
+    """
+    space = 10**width
+    repdigit = (space - 1) // 9
+    if seen is not None and seen.size != space:
+        raise ValueError(f"seen must cover {space} bases, got size {seen.size}")
+    available = space - 10 - (len(seen) if seen is not None else 0)
+    if n > available:
+        raise ValueError(f"cannot draw {n} unique bases; only {available} remain")
+
+    chosen = np.empty(0, dtype=np.int64)
+    while chosen.size < n:
+        need = n - chosen.size
+        draw = gen.integers(0, space, size=need + need // 16 + 16, dtype=np.int64)
+        draw = draw[draw % repdigit != 0]
+        _, first = np.unique(draw, return_index=True)
+        draw = draw[np.sort(first)]
+        if seen is None:
+            draw = draw[~np.isin(draw, chosen)][:need]
+        else:
+            draw = draw[~seen.contains(draw)][:need]
+            seen.add(draw)
+        chosen = np.concatenate([chosen, draw])
+    return chosen
+
+
+def to_output(digits: np.ndarray, output: str) -> list[str] | bytes | np.ndarray:
+    """Return the digit matrix, one ASCII buffer of fixed-width rows, or strings."""
+    if output == "array":
+        return digits
+    width = digits.shape[1]
+    ascii_rows = np.ascontiguousarray(digits + np.uint8(_ASCII_ZERO))
+    if output == "bytes":
+        return ascii_rows.tobytes()
+    return ascii_rows.view(f"S{width}").ravel().astype(f"U{width}").tolist()
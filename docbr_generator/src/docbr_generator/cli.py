@@ -3,49 +3,34 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 import time
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, TextIO
 
-from docbr_generator import cnpj, cpf
+from docbr_generator.columnar import COLUMNAR_FORMATS
 from docbr_generator.config import load_config
+from docbr_generator.fastpath import run_single
+from docbr_generator.stream import DEFAULT_TABLE, FORMATS, check_table
 
-_PASTE_APPLESCRIPT = (
-    'tell application "System Events" to keystroke "v" using command down'
-)
+if TYPE_CHECKING:
+    from docbr_generator.csv_validation import CsvValidation
 
-
-def _copy_to_clipboard(value: str) -> None:
-    """Copy digits to the macOS clipboard via pbcopy (no trailing newline)."""
-    process = subprocess.run(
-        ["pbcopy"],
-        input=value.encode("utf-8"),
-        check=False,
-        capture_output=True,
-    )
-    if process.returncode != 0:
-        err = process.stderr.decode("utf-8", errors="replace").strip()
-        raise RuntimeError(err or "pbcopy failed")
+# Subcommand modules (daemon, pool, server, shards, csv_validation) and numpy
+# load on use.
 
 
-def _paste_from_clipboard(*, delay_seconds: float = 0.15) -> None:
-    """Simulate Cmd+V via System Events (requires Accessibility permission)."""
-    # Brief pause so the clipboard is ready and Shortcuts has released focus.
-    time.sleep(delay_seconds)
-    process = subprocess.run(
-        ["osascript", "-e", _PASTE_APPLESCRIPT],
-        check=False,
-        capture_output=True,
-    )
-    if process.returncode != 0:
-        err = process.stderr.decode("utf-8", errors="replace").strip()
-        raise RuntimeError(err or "osascript paste failed")
+def _table_name(value: str) -> str:
+    try:
+        return check_table(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="docbr-generator",
-        description="Generate algorithmically valid Brazilian CPF/CNPJ numbers (digits only).",
+        description="Generate algorithmically valid Brazilian CPF/CNPJ numbers.",
     )
     parser.add_argument(
         "document",
@@ -62,52 +47,607 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Copy to clipboard and paste into the focused field (Cmd+V via AppleScript)",
     )
+    style = parser.add_mutually_exclusive_group()
+    style.add_argument(
+        "--masked",
+        dest="masked",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Format as 000.000.000-00 / 00.000.000/0000-00 "
+        "(default: from [output] digits_only in config)",
+    )
+    style.add_argument(
+        "--digits-only",
+        dest="masked",
+        action="store_const",
+        const=False,
+        help="Emit digits only, even if config sets digits_only = false",
+    )
+    parser.add_argument(
+        "--count",
+        "-n",
+        type=int,
+        default=1,
+        help="Number of documents to generate (default: 1; >1 streams in bulk)",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Write documents to this file instead of stdout",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS + COLUMNAR_FORMATS,
+        default="lines",
+        help="Bulk output format: one value per line, CSV, JSON Lines, "
+        "multi-row SQL INSERTs, a Postgres COPY block, or (with --output) "
+        "a Parquet / Arrow IPC file",
+    )
+    parser.add_argument(
+        "--table",
+        type=_table_name,
+        default=DEFAULT_TABLE,
+        help=f"Target table for --format sql/copy (default: {DEFAULT_TABLE})",
+    )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Store --format parquet/arrow values as fixed-size binary, not strings",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible bulk output",
+    )
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="Never repeat a value within a bulk run (bitset-backed)",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Generate locally even if a `docbr-generator daemon` is running",
+    )
     return parser
 
 
-def generate_document(document: str) -> str:
-    if document == "cpf":
-        return cpf.generate()
-    if document == "cnpj":
-        return cnpj.generate()
-    raise ValueError(f"Unsupported document type: {document}")
+def build_bulk_parser() -> argparse.ArgumentParser:
+    from docbr_generator.shards import default_workers
 
+    parser = argparse.ArgumentParser(
+        prog="docbr-generator bulk",
+        description=(
+            "Generate a large CPF/CNPJ fixture set across worker processes, "
+            "one shard file per worker."
+        ),
+    )
+    parser.add_argument(
+        "document",
+        choices=("cpf", "cnpj"),
+        help="Document type to generate",
+    )
+    parser.add_argument(
+        "--count",
+        "-n",
+        type=int,
+        required=True,
+        help="Total number of documents across all shards",
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-d",
+        type=Path,
+        required=True,
+        help="Directory for the shard files",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=default_workers(),
+        help="Worker processes / shard files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="lines",
+        help="Shard format: one value per line, CSV, JSON Lines, "
+        "multi-row SQL INSERTs, or a Postgres COPY block",
+    )
+    parser.add_argument(
+        "--table",
+        type=_table_name,
+        default=DEFAULT_TABLE,
+        help=f"Target table for --format sql/copy (default: {DEFAULT_TABLE})",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible shards (same seed + workers → same files)",
+    )
+    parser.add_argument(
+        "--merge",
+        type=Path,
+        default=None,
+        help="Also concatenate the shards into this file",
+    )
+    style = parser.add_mutually_exclusive_group()
+    style.add_argument(
+        "--masked",
+        dest="masked",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Format as 000.000.000-00 / 00.000.000/0000-00 "
+        "(default: from [output] digits_only in config)",
+    )
+    style.add_argument(
+        "--digits-only",
+        dest="masked",
+        action="store_const",
+        const=False,
+        help="Emit digits only, even if config sets digits_only = false",
+    )
+    return parser
 
-def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+
+def bulk_main(argv: list[str]) -> int:
+    """Entry point for `docbr-generator bulk`: sharded multiprocess generation."""
+    from docbr_generator.shards import merge_shards, write_shards
+
+    parser = build_bulk_parser()
     args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("--count must be >= 0")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    started = time.perf_counter()
+    try:
+        paths = write_shards(
+            args.document,
+            args.count,
+            args.output_dir,
+            workers=args.workers,
+            fmt=args.format,
+            seed=args.seed,
+            masked=_resolve_masked(args),
+            table=args.table,
+        )
+        if args.merge is not None:
+            merge_shards(paths, args.merge, fmt=args.format)
+    except ImportError:
+        print(
+            "bulk output requires numpy: pip install 'docbr-generator[bulk]'",
+            file=sys.stderr,
+        )
+        return 1
+    except OSError as exc:
+        print(f"failed to write shards: {exc}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - started
+    rate = args.count / elapsed if elapsed else float("inf")
+    print(
+        f"wrote {args.count:,} {args.document} values in {len(paths)} shard(s) "
+        f"under {args.output_dir} in {elapsed:.2f}s ({rate:,.0f}/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def build_daemon_parser() -> argparse.ArgumentParser:
+    from docbr_generator.daemon import DEFAULT_POOL_SIZE
+
+    parser = argparse.ArgumentParser(
+        prog="docbr-generator daemon",
+        description=(
+            "Keep a warm pool of CPFs/CNPJs and serve them over a Unix socket; "
+            "single-value CLI calls use it automatically while it runs."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Socket path (default: $DOCBR_GENERATOR_SOCKET or a per-user temp path)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=f"Values pre-generated per document type (default: {DEFAULT_POOL_SIZE})",
+    )
+    return parser
+
 
-    # Config is loaded for future overrides / Shortcuts path docs; output is always digits.
-    load_config()
+def daemon_main(argv: list[str]) -> int:
+    """Entry point for `docbr-generator daemon`: serve until interrupted."""
+    from docbr_generator.daemon import serve
 
-    value = generate_document(args.document)
-    if not value.isdigit():
-        print("generator produced non-digit output", file=sys.stderr)
+    parser = build_daemon_parser()
+    args = parser.parse_args(argv)
+    if args.pool_size < 1:
+        parser.error("--pool-size must be >= 1")
+    try:
+        serve(args.socket, pool_size=args.pool_size)
+    except KeyboardInterrupt:
+        return 0
+    except (OSError, RuntimeError) as exc:
+        print(f"daemon error: {exc}", file=sys.stderr)
         return 1
+    return 0
+
+
+def build_pool_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="docbr-generator pool",
+        description=(
+            "Build a binary pool file of distinct packed CPFs/CNPJs for "
+            "docbr_generator.pool.Pool (memory-mapped, shared across processes)."
+        ),
+    )
+    parser.add_argument(
+        "document",
+        choices=("cpf", "cnpj"),
+        help="Document type to pool",
+    )
+    parser.add_argument(
+        "--count",
+        "-n",
+        type=int,
+        required=True,
+        help="Number of documents in the pool",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        required=True,
+        help="Pool file to write",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for a reproducible pool",
+    )
+    return parser
 
-    if args.copy or args.paste:
-        try:
-            _copy_to_clipboard(value)
-        except (OSError, RuntimeError) as exc:
-            print(f"failed to copy to clipboard: {exc}", file=sys.stderr)
-            return 1
-
-    if args.paste:
-        try:
-            _paste_from_clipboard()
-        except (OSError, RuntimeError) as exc:
-            print(f"failed to paste: {exc}", file=sys.stderr)
+
+def pool_main(argv: list[str]) -> int:
+    """Entry point for `docbr-generator pool`: write a packed pool file."""
+    from docbr_generator.pool import build_pool
+
+    parser = build_pool_parser()
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("--count must be >= 0")
+    started = time.perf_counter()
+    try:
+        build_pool(args.output, args.document, args.count, seed=args.seed)
+    except ImportError:
+        print(
+            "pool files require numpy: pip install 'docbr-generator[bulk]'",
+            file=sys.stderr,
+        )
+        return 1
+    except OSError as exc:
+        print(f"failed to write pool: {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    print(
+        f"wrote {args.count:,} {args.document} values to {args.output} "
+        f"in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    from docbr_generator.server import DEFAULT_HOST, DEFAULT_POOL_RECORDS, DEFAULT_PORT
+
+    parser = argparse.ArgumentParser(
+        prog="docbr-generator serve",
+        description=(
+            "Serve GET /cpf?count=N, GET /cnpj?count=N and POST /validate over "
+            "HTTP/1.1 (asyncio, single thread)."
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help=f"Interface to bind (default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"TCP port (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_RECORDS,
+        help=(
+            "Values pre-rendered per document type and style for small requests "
+            f"(default: {DEFAULT_POOL_RECORDS})"
+        ),
+    )
+    return parser
+
+
+def serve_main(argv: list[str]) -> int:
+    """Entry point for `docbr-generator serve`: answer HTTP until interrupted."""
+    parser = build_serve_parser()
+    args = parser.parse_args(argv)
+    if args.pool_size < 1:
+        parser.error("--pool-size must be >= 1")
+    print(f"listening on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        from docbr_generator.server import serve
+
+        serve(args.host, args.port, pool_records=args.pool_size)
+    except KeyboardInterrupt:
+        return 0
+    except ImportError:
+        print(
+            "the HTTP server requires numpy: pip install 'docbr-generator[bulk]'",
+            file=sys.stderr,
+        )
+        return 1
+    except OSError as exc:
+        print(f"server error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def build_validate_parser() -> argparse.ArgumentParser:
+    from docbr_generator.shards import default_workers
+
+    parser = argparse.ArgumentParser(
+        prog="docbr-generator validate",
+        description=(
+            "Stream a CSV file and report rows whose CPF/CNPJ column is invalid "
+            "(masks such as 000.000.000-00 are stripped first)."
+        ),
+    )
+    parser.add_argument("file", type=Path, help="CSV file to check")
+    parser.add_argument(
+        "--column",
+        "-c",
+        required=True,
+        help="Header name of the column, or its 1-based position",
+    )
+    parser.add_argument(
+        "--kind",
+        "-k",
+        choices=("cpf", "cnpj"),
+        required=True,
+        help="Document type stored in the column",
+    )
+    parser.add_argument(
+        "--alphanumeric",
+        action="store_true",
+        help="Also accept alphanumeric CNPJs",
+    )
+    parser.add_argument(
+        "--no-header",
+        action="store_true",
+        help="The first line is data, not a header",
+    )
+    parser.add_argument(
+        "--delimiter",
+        default=",",
+        help="Field delimiter (default: ',')",
+    )
+    parser.add_argument(
+        "--encoding",
+        default="utf-8-sig",
+        help="File encoding (default: utf-8-sig)",
+    )
+    parser.add_argument(
+        "--report",
+        "-o",
+        type=Path,
+        default=None,
+        help="Write the row,value report of invalid rows here (default: stdout)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help=(
+            f"Worker processes checking 16 MiB ranges in parallel (CPUs here: "
+            f"{default_workers()}); needs rows without embedded newlines"
+        ),
+    )
+    return parser
+
+
+def validate_main(argv: list[str]) -> int:
+    """Entry point for `docbr-generator validate`: exit 0 only if all rows pass."""
+    parser = build_validate_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.alphanumeric and args.kind != "cnpj":
+        parser.error("--alphanumeric only applies to --kind cnpj")
+
+    started = time.perf_counter()
+    try:
+        if args.report is None:
+            result = _validate_file(args, sys.stdout)
+        else:
+            with args.report.open("w", encoding="utf-8", newline="") as report:
+                result = _validate_file(args, report)
+    except ImportError:
+        print(
+            "validation requires numpy: pip install 'docbr-generator[bulk]'",
+            file=sys.stderr,
+        )
+        return 1
+    except ValueError as exc:
+        parser.error(str(exc))
+    except OSError as exc:
+        print(f"failed to validate {args.file}: {exc}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - started
+    rate = result.rows / elapsed if elapsed else float("inf")
+    print(
+        f"checked {result.rows:,} {args.kind} values in {args.file}: "
+        f"{result.invalid:,} invalid, in {elapsed:.2f}s ({rate:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    return 1 if result.invalid else 0
+
+
+def _validate_file(args: argparse.Namespace, report: TextIO) -> CsvValidation:
+    from docbr_generator.csv_validation import validate_csv
+
+    return validate_csv(
+        args.file,
+        report,
+        column=args.column,
+        kind=args.kind,
+        alphanumeric=args.alphanumeric,
+        header=not args.no_header,
+        delimiter=args.delimiter,
+        encoding=args.encoding,
+        workers=args.workers,
+    )
+
+
+_SUBCOMMANDS = {
+    "bulk": bulk_main,
+    "daemon": daemon_main,
+    "pool": pool_main,
+    "serve": serve_main,
+    "validate": validate_main,
+}
+
+
+def _resolve_masked(args: argparse.Namespace) -> bool:
+    """--masked/--digits-only when given, else the inverse of config digits_only."""
+    if args.masked is not None:
+        return args.masked
+    return not load_config().output.digits_only
+
+
+def _is_bulk_request(args: argparse.Namespace) -> bool:
+    return (
+        args.count != 1
+        or args.output is not None
+        or args.format != "lines"
+        or args.seed is not None
+        or args.unique
+    )
+
+
+def _write_bulk(handle: BinaryIO, args: argparse.Namespace) -> int:
+    from docbr_generator.stream import write_documents
+
+    return write_documents(
+        handle,
+        args.document,
+        args.count,
+        fmt=args.format,
+        rng=args.seed,
+        unique=args.unique,
+        masked=args.masked,
+        table=args.table,
+    )
+
+
+def _write_columnar(args: argparse.Namespace) -> int:
+    from docbr_generator.columnar import write_columnar
+
+    return write_columnar(
+        args.output,
+        args.document,
+        args.count,
+        fmt=args.format,
+        rng=args.seed,
+        unique=args.unique,
+        masked=args.masked,
+        column_type="binary" if args.binary else "string",
+    )
+
+
+def _stream_documents(args: argparse.Namespace) -> int:
+    """Write args.count documents in large chunks, reporting throughput on stderr."""
+    started = time.perf_counter()
+    try:
+        if args.format in COLUMNAR_FORMATS:
+            written = _write_columnar(args)
+        elif args.output is None:
+            written = _write_bulk(sys.stdout.buffer, args)
+            sys.stdout.buffer.flush()
+        else:
+            with args.output.open("wb", buffering=1 << 20) as handle:
+                written = _write_bulk(handle, args)
+    except ImportError as exc:
+        if exc.name == "pyarrow":
             print(
-                "Grant Accessibility to Terminal/Shortcuts/osascript under "
-                "System Settings → Privacy & Security → Accessibility.",
+                f"--format {args.format} requires pyarrow: "
+                "pip install 'docbr-generator[arrow]'",
                 file=sys.stderr,
             )
-            return 1
+        else:
+            print(
+                "bulk output requires numpy: pip install 'docbr-generator[bulk]'",
+                file=sys.stderr,
+            )
+        return 1
+    except OSError as exc:
+        print(f"failed to write output: {exc}", file=sys.stderr)
+        return 1
 
-    # Single trailing newline for shell pipelines; digits-only payload.
-    print(value)
+    elapsed = time.perf_counter() - started
+    rate = args.count / elapsed if elapsed else float("inf")
+    print(
+        f"wrote {args.count:,} {args.document} values ({written:,} bytes) "
+        f"in {elapsed:.2f}s ({rate:,.0f}/s)",
+        file=sys.stderr,
+    )
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in _SUBCOMMANDS:
+        return _SUBCOMMANDS[argv[0]](argv[1:])
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if _is_bulk_request(args):
+        if args.copy or args.paste:
+            parser.error("--copy/--paste only work for a single value")
+        if args.count < 1:
+            parser.error("--count must be >= 1")
+        if args.format in COLUMNAR_FORMATS and args.output is None:
+            parser.error(f"--format {args.format} needs --output")
+        args.masked = _resolve_masked(args)
+        return _stream_documents(args)
+
+    return run_single(
+        args.document,
+        copy=args.copy,
+        paste=args.paste,
+        use_daemon=not args.no_daemon,
+        masked=_resolve_masked(args),
+    )
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
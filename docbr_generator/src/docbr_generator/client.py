@@ -0,0 +1,41 @@
+"""Tiny client for the generator daemon (stdlib os/socket only, fast to import)."""
+
+from __future__ import annotations
+
+import os
+import socket
+
+SOCKET_ENV_VAR = "DOCBR_GENERATOR_SOCKET"
+ERROR_PREFIX = "error: "
+
+
+def default_socket_path() -> str:
+    """$DOCBR_GENERATOR_SOCKET, else a per-user socket in the runtime/temp dir."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return override
+    runtime_dir = (
+        os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    )
+    return os.path.join(runtime_dir, f"docbr-generator-{os.getuid()}.sock")
+
+
+def request_document(
+    document: str,
+    path: str | os.PathLike[str] | None = None,
+    *,
+    timeout_s: float = 0.25,
+) -> str | None:
+    """Return a value from a running daemon, or None if none answers."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout_s)
+            sock.connect(os.fspath(path or default_socket_path()))
+            sock.sendall(f"{document}\n".encode("ascii"))
+            with sock.makefile("rb") as reader:
+                reply = reader.readline().decode("utf-8").strip()
+    except OSError:
+        return None
+    if not reply or reply.startswith(ERROR_PREFIX):
+        return None
+    return reply
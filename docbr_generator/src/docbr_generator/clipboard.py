@@ -0,0 +1,37 @@
+"""macOS clipboard copy (pbcopy) and paste (Cmd+V via osascript) helpers."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+
+_PASTE_APPLESCRIPT = (
+    'tell application "System Events" to keystroke "v" using command down'
+)
+
+
+def copy_to_clipboard(value: str) -> None:
+    """Copy digits to the macOS clipboard via pbcopy (no trailing newline)."""
+    process = subprocess.run(
+        ["pbcopy"],
+        input=value.encode("utf-8"),
+        check=False,
+        capture_output=True,
+    )
+    if process.returncode != 0:
+        err = process.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(err or "pbcopy failed")
+
+
+def paste_from_clipboard(*, delay_seconds: float = 0.15) -> None:
+    """Simulate Cmd+V via System Events (requires Accessibility permission)."""
+    # Brief pause so the clipboard is ready and Shortcuts has released focus.
+    time.sleep(delay_seconds)
+    process = subprocess.run(
+        ["osascript", "-e", _PASTE_APPLESCRIPT],
+        check=False,
+        capture_output=True,
+    )
+    if process.returncode != 0:
+        err = process.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(err or "osascript paste failed")
@@ -1,53 +1,159 @@
-"""CNPJ generation and validation (Mod-11 check digits)."""
+"""CNPJ generation and validation (Mod-11 check digits).
+
+Alphanumeric CNPJs (issued from July 2026) may use 0-9 and A-Z in the first 12
+positions; each character counts as its ASCII code - 48 and the two check
+digits stay numeric. Pass alphanumeric=True to opt in.
+"""
 
 from __future__ import annotations
 
 import random
-import re
+
+from docbr_generator import _checksum
+from docbr_generator._typecheck import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+    from docbr_generator.bitset import Bitset
 
 _CNPJ_LENGTH = 14
-_DIGITS_ONLY = re.compile(r"^\d+$")
 _WEIGHTS_D1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 _WEIGHTS_D2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+_TABLES_D1 = _checksum.contribution_tables(_WEIGHTS_D1)
+_TABLES_D2 = _checksum.contribution_tables(_WEIGHTS_D2)
+
+# Number of 8-digit roots; size a Bitset with this to share a seen-set.
+ROOT_SPACE = 10**8
+
+# Display mask; each "0" takes the next character of the document.
+MASK = "00.000.000/0000-00"
+
+_ALPHANUMERIC = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 
 def _is_all_same_digit(digits: str) -> bool:
     return len(digits) > 0 and digits == digits[0] * len(digits)
 
 
-def _mod11_check_digit(digits: str, weights: list[int]) -> int:
-    total = sum(int(d) * w for d, w in zip(digits, weights, strict=True))
-    remainder = total % 11
-    return 0 if remainder < 2 else 11 - remainder
+def _check_digits(base12: str) -> str:
+    return _checksum.check_digits(base12.encode("ascii"), _TABLES_D1, _TABLES_D2)
+
 
+def _is_base_text(base: str, alphanumeric: bool) -> bool:
+    if alphanumeric:
+        return _checksum.is_ascii_alphanumeric(base)
+    return _checksum.is_ascii_digits(base)
 
-def calculate_check_digits(base12: str) -> str:
-    """Return the two CNPJ check digits for a 12-digit base."""
-    if len(base12) != 12 or not _DIGITS_ONLY.fullmatch(base12):
+
+def calculate_check_digits(base12: str, *, alphanumeric: bool = False) -> str:
+    """Return the two CNPJ check digits for a 12-character base.
+
+    The base must be digits, or with alphanumeric=True, digits and A-Z.
+    """
+    if len(base12) != 12 or not _is_base_text(base12, alphanumeric):
+        if alphanumeric:
+            raise ValueError("CNPJ base must be exactly 12 characters of 0-9/A-Z")
         raise ValueError("CNPJ base must be exactly 12 digits")
-    d1 = _mod11_check_digit(base12, _WEIGHTS_D1)
-    d2 = _mod11_check_digit(base12 + str(d1), _WEIGHTS_D2)
-    return f"{d1}{d2}"
+    return _check_digits(base12)
+
 
+def is_valid(cnpj: str, *, alphanumeric: bool = False) -> bool:
+    """Return True if cnpj is 14 digits with valid check digits (not all same).
 
-def is_valid(cnpj: str) -> bool:
-    """Return True if cnpj is 14 digits with valid check digits (not all same)."""
-    if len(cnpj) != _CNPJ_LENGTH or not _DIGITS_ONLY.fullmatch(cnpj):
+    With alphanumeric=True the first 12 characters may also be A-Z, so both
+    numeric and alphanumeric CNPJs are accepted.
+    """
+    if len(cnpj) != _CNPJ_LENGTH or not _is_base_text(cnpj[:12], alphanumeric):
+        return False
+    if not _checksum.is_ascii_digits(cnpj[12:]):
         return False
     if _is_all_same_digit(cnpj):
         return False
-    return cnpj[-2:] == calculate_check_digits(cnpj[:12])
+    return cnpj[-2:] == _check_digits(cnpj[:12])
+
+
+def mask(cnpj: str) -> str:
+    """Format a 14-character CNPJ as 00.000.000/0000-00."""
+    if len(cnpj) != _CNPJ_LENGTH:
+        raise ValueError("CNPJ must be exactly 14 characters")
+    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
 
 
-def generate(rng: random.Random | None = None) -> str:
-    """Generate a random valid 14-digit CNPJ (digits only)."""
-    rng = rng or random.Random()
+def generate(rng: random.Random | None = None, *, alphanumeric: bool = False) -> str:
+    """Generate a random valid 14-character CNPJ (digits only by default).
+
+    alphanumeric=True draws the 8-character root from 0-9 and A-Z. rng=None
+    draws from the random module's shared generator.
+    """
+    randrange = random.randrange if rng is None else rng.randrange
+    choices = random.choices if rng is None else rng.choices
     while True:
-        # Common pattern: random 8-digit root + branch 0001
-        root = "".join(str(rng.randint(0, 9)) for _ in range(8))
-        if _is_all_same_digit(root):
-            continue
-        base12 = root + "0001"
-        cnpj = base12 + calculate_check_digits(base12)
-        if is_valid(cnpj):
-            return cnpj
+        # Common pattern: random 8-character root + branch 0001
+        if alphanumeric:
+            root = "".join(choices(_ALPHANUMERIC, k=8))
+        else:
+            root = f"{randrange(ROOT_SPACE):08d}"
+        if not _is_all_same_digit(root):
+            base12 = root + "0001"
+            return base12 + _check_digits(base12)
+
+
+def generate_many(
+    n: int,
+    branches: int | Iterable[int] = 1,
+    rng: np.random.Generator | int | None = None,
+    *,
+    output: str = "str",
+    unique: bool = False,
+    seen: Bitset | None = None,
+    alphanumeric: bool = False,
+) -> list[str] | bytes | np.ndarray:
+    """Generate n valid CNPJs in one vectorized batch (requires numpy).
+
+    branches is a single branch number (default 0001) or an iterable of them,
+    e.g. range(1, 51). Each random root is emitted once per branch, in order,
+    so consecutive values form a company group; the last group may be cut short.
+    rng is a numpy Generator or an int seed; the same seed yields the same batch.
+    output="str" returns digit strings, "bytes" one ASCII buffer of 14-byte
+    records, "array" the (n, 14) uint8 digit matrix.
+    unique=True makes every root in the batch distinct (so every CNPJ is, too).
+    Passing seen, a Bitset(ROOT_SPACE) (optionally file-backed), also skips
+    roots issued by earlier calls and records the new ones.
+    alphanumeric=True draws roots from 0-9 and A-Z (not combinable with
+    unique/seen); the "array" output then holds character values (ASCII - 48).
+    """
+    import numpy as np
+
+    from docbr_generator import _vectorized as vec
+
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    vec.check_output(output)
+    branch_numbers = [branches] if isinstance(branches, int) else list(branches)
+    if not branch_numbers:
+        raise ValueError("branches must not be empty")
+    if any(not 1 <= branch <= 9999 for branch in branch_numbers):
+        raise ValueError("branch numbers must be between 1 and 9999")
+    gen = vec.as_generator(rng)
+
+    group_size = len(branch_numbers)
+    root_count = -(-n // group_size)
+    branch_digits = vec.int_digits(branch_numbers, 4)
+    if alphanumeric:
+        if unique or seen is not None:
+            raise ValueError("unique/seen only support numeric CNPJ roots")
+        roots = vec.random_digits(gen, root_count, 8, vec.ALPHANUMERIC_VALUES)
+    elif unique or seen is not None:
+        roots = vec.int_digits(vec.unique_bases(gen, root_count, 8, seen), 8)
+    else:
+        roots = vec.random_digits(gen, root_count, 8)
+
+    digits = np.empty((n, _CNPJ_LENGTH), dtype=np.uint8)
+    digits[:, :8] = np.repeat(roots, group_size, axis=0)[:n]
+    digits[:, 8:12] = np.tile(branch_digits, (root_count, 1))[:n]
+    digits[:, 12] = vec.mod11_check_digits(digits[:, :12], _WEIGHTS_D1)
+    digits[:, 13] = vec.mod11_check_digits(digits[:, :13], _WEIGHTS_D2)
+    return vec.to_output(digits, output)
@@ -0,0 +1,173 @@
+"""Write generated documents as Arrow IPC or Parquet (requires numpy and pyarrow).
+
+No per-row Python objects are created: each chunk's digit matrix is turned
+into ASCII bytes in place and handed to Arrow as one contiguous buffer, either
+as a fixed-size binary column or as a string column whose offsets are a plain
+arange (every value has the same width). Parquet files are written without
+dictionary encoding, which random documents would only inflate.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.stream import DEFAULT_CHUNK_SIZE, fill_values, value_spans
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+COLUMN_TYPES = ("string", "binary")
+DEFAULT_ROW_GROUP_ROWS = 1 << 20
+
+_GENERATORS = {"cpf": cpf.generate_many, "cnpj": cnpj.generate_many}
+_BASE_SPACES = {"cpf": cpf.BASE_SPACE, "cnpj": cnpj.ROOT_SPACE}
+_MASKS = {"cpf": cpf.MASK, "cnpj": cnpj.MASK}
+_INT32_MAX = (1 << 31) - 1
+
+
+def to_arrow(
+    digits: np.ndarray,
+    *,
+    masked: bool = False,
+    column_type: str = "string",
+    large: bool | None = None,
+) -> pa.Array:
+    """Wrap a generate_many(output="array") digit matrix as an Arrow array.
+
+    The ASCII buffer is the only copy of the values: Arrow wraps it without
+    copying. Strings use 64-bit offsets (large_string) when large is True, or
+    by default only when the buffer exceeds 2 GiB.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if column_type not in COLUMN_TYPES:
+        raise ValueError(f"column_type must be one of {', '.join(COLUMN_TYPES)}")
+    rows, length = digits.shape
+    pattern = _MASKS["cpf" if length == cpf._CPF_LENGTH else "cnpj"]
+    if not masked:
+        pattern = "0" * length
+    ascii_rows = np.empty((rows, len(pattern)), dtype=np.uint8)
+    ascii_rows[:] = np.frombuffer(pattern.encode("ascii"), dtype=np.uint8)
+    fill_values(ascii_rows, digits, value_spans(pattern))
+
+    width = len(pattern)
+    data = pa.py_buffer(ascii_rows)
+    if column_type == "binary":
+        value_type = pa.binary(width)
+        return pa.FixedSizeBinaryArray.from_buffers(value_type, rows, [None, data])
+    if large is None:
+        large = rows * width > _INT32_MAX
+    if large:
+        offsets = np.arange(0, (rows + 1) * width, width, dtype=np.int64)
+        return pa.LargeStringArray.from_buffers(rows, pa.py_buffer(offsets), data)
+    offsets = np.arange(0, (rows + 1) * width, width, dtype=np.int32)
+    return pa.StringArray.from_buffers(rows, pa.py_buffer(offsets), data)
+
+
+def write_columnar(
+    path: Path,
+    document: str,
+    count: int,
+    *,
+    fmt: str = "parquet",
+    rng: np.random.Generator | int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    unique: bool = False,
+    masked: bool = False,
+    alphanumeric: bool = False,
+    column_type: str = "string",
+    row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+    compression: str | None = "snappy",
+) -> int:
+    """Write count documents to path as one column named document; return bytes.
+
+    Values are drawn chunk_size at a time exactly as write_documents draws
+    them, so the same seed yields the same values as the text formats. Memory
+    stays bounded by row_group_rows (Parquet) or chunk_size (Arrow IPC).
+    alphanumeric=True (CNPJ only) cannot be combined with unique.
+    """
+    import pyarrow as pa
+
+    from docbr_generator import _vectorized as vec
+    from docbr_generator.bitset import Bitset
+
+    try:
+        generate_many = _GENERATORS[document]
+    except KeyError:
+        raise ValueError(f"Unsupported document type: {document}") from None
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    if alphanumeric and document != "cnpj":
+        raise ValueError("alphanumeric only applies to CNPJ")
+    if column_type not in COLUMN_TYPES:
+        raise ValueError(f"column_type must be one of {', '.join(COLUMN_TYPES)}")
+    if count < 0:
+        raise ValueError("count must be >= 0")
+    if chunk_size < 1 or row_group_rows < 1:
+        raise ValueError("chunk_size and row_group_rows must be >= 1")
+
+    pattern = _MASKS[document]
+    width = len(pattern) if masked else pattern.count("0")
+    # Every batch must match the schema, so the widest one picks the offsets.
+    large = min(count, chunk_size) * width > _INT32_MAX
+    if column_type == "binary":
+        value_type = pa.binary(width)
+    else:
+        value_type = pa.large_string() if large else pa.string()
+    schema = pa.schema([(document, value_type)])
+    gen = vec.as_generator(rng)
+    seen = Bitset(_BASE_SPACES[document]) if unique else None
+    extra = {"alphanumeric": True} if alphanumeric else {}
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        remaining = count
+        while remaining:
+            rows = min(remaining, chunk_size)
+            digits = generate_many(rows, rng=gen, output="array", seen=seen, **extra)
+            array = to_arrow(
+                digits, masked=masked, column_type=column_type, large=large
+            )
+            yield pa.RecordBatch.from_arrays([array], schema=schema)
+            remaining -= rows
+
+    if fmt == "arrow":
+        with pa.ipc.new_file(os.fspath(path), schema) as writer:
+            for batch in batches():
+                writer.write_batch(batch)
+    else:
+        _write_parquet(path, schema, batches(), row_group_rows, compression)
+    return os.path.getsize(path)
+
+
+def _write_parquet(
+    path: Path,
+    schema: pa.Schema,
+    batches: Iterator[pa.RecordBatch],
+    row_group_rows: int,
+    compression: str | None,
+) -> None:
+    """Collect batches into row groups of about row_group_rows and write them."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with pq.ParquetWriter(
+        os.fspath(path), schema, compression=compression or "none", use_dictionary=False
+    ) as writer:
+        pending: list[pa.RecordBatch] = []
+        rows = 0
+        for batch in batches:
+            pending.append(batch)
+            rows += batch.num_rows
+            if rows >= row_group_rows:
+                table = pa.Table.from_batches(pending, schema)
+                writer.write_table(table, row_group_size=row_group_rows)
+                pending, rows = [], 0
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema))
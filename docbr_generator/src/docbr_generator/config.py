@@ -1,15 +1,17 @@
-"""Load TOML configuration (local config.toml, else example defaults)."""
+"""Load TOML configuration (local config.toml, else example defaults).
+
+File lookup and the marshal parse cache live in docbr_generator._rawconfig.
+"""
 
 from __future__ import annotations
 
-import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-_PROJECT_ROOT = Path(__file__).resolve().parents[2]
-_DEFAULT_CONFIG_PATH = _PROJECT_ROOT / "config.toml"
-_EXAMPLE_CONFIG_PATH = _PROJECT_ROOT / "config.toml.example"
+from docbr_generator._rawconfig import PROJECT_ROOT, load_raw
+
+_PROJECT_ROOT = Path(PROJECT_ROOT)
 
 
 @dataclass(frozen=True)
@@ -62,25 +64,10 @@ def _parse(data: dict[str, Any]) -> AppConfig:
     )
 
 
-def _load_toml(path: Path) -> dict[str, Any]:
-    with path.open("rb") as handle:
-        loaded = tomllib.load(handle)
-    if not isinstance(loaded, dict):
-        raise TypeError(f"Config root must be a table: {path}")
-    return loaded
-
-
 def load_config(
     config_path: Path | None = None,
     *,
     example_path: Path | None = None,
 ) -> AppConfig:
     """Load local config.toml if present; otherwise config.toml.example; else defaults."""
-    local_path = config_path or _DEFAULT_CONFIG_PATH
-    fallback_path = example_path or _EXAMPLE_CONFIG_PATH
-
-    if local_path.is_file():
-        return _parse(_load_toml(local_path))
-    if fallback_path.is_file():
-        return _parse(_load_toml(fallback_path))
-    return AppConfig(output=OutputConfig(), cli=CliConfig())
+    return _parse(load_raw(config_path, example_path=example_path))
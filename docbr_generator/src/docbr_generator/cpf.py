@@ -3,47 +3,181 @@
 from __future__ import annotations
 
 import random
-import re
+
+from docbr_generator import _checksum
+from docbr_generator._typecheck import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import numpy as np
+
+    from docbr_generator.bitset import Bitset
 
 _CPF_LENGTH = 11
-_DIGITS_ONLY = re.compile(r"^\d+$")
+_WEIGHTS_D1 = list(range(10, 1, -1))
+_WEIGHTS_D2 = list(range(11, 1, -1))
+_TABLES_D1 = _checksum.contribution_tables(_WEIGHTS_D1)
+_TABLES_D2 = _checksum.contribution_tables(_WEIGHTS_D2)
+
+# Number of 9-digit bases; size a Bitset with this to share a seen-set.
+BASE_SPACE = 10**9
+
+# Display mask; each "0" takes the next character of the document.
+MASK = "000.000.000-00"
+
+# Ninth digit → UFs of the Receita Federal fiscal region that issued the CPF.
+FISCAL_REGIONS: dict[int, tuple[str, ...]] = {
+    0: ("RS",),
+    1: ("DF", "GO", "MS", "MT", "TO"),
+    2: ("AC", "AM", "AP", "PA", "RO", "RR"),
+    3: ("CE", "MA", "PI"),
+    4: ("AL", "PB", "PE", "RN"),
+    5: ("BA", "SE"),
+    6: ("MG",),
+    7: ("ES", "RJ"),
+    8: ("SP",),
+    9: ("PR", "SC"),
+}
+_UF_REGIONS = {uf: region for region, ufs in FISCAL_REGIONS.items() for uf in ufs}
 
 
 def _is_all_same_digit(digits: str) -> bool:
     return len(digits) > 0 and digits == digits[0] * len(digits)
 
 
-def _mod11_check_digit(digits: str, weights: list[int]) -> int:
-    total = sum(int(d) * w for d, w in zip(digits, weights, strict=True))
-    remainder = total % 11
-    return 0 if remainder < 2 else 11 - remainder
+def _check_digits(base9: str) -> str:
+    return _checksum.check_digits(base9.encode("ascii"), _TABLES_D1, _TABLES_D2)
 
 
 def calculate_check_digits(base9: str) -> str:
     """Return the two CPF check digits for a 9-digit base."""
-    if len(base9) != 9 or not _DIGITS_ONLY.fullmatch(base9):
+    if len(base9) != 9 or not _checksum.is_ascii_digits(base9):
         raise ValueError("CPF base must be exactly 9 digits")
-    d1 = _mod11_check_digit(base9, list(range(10, 1, -1)))
-    d2 = _mod11_check_digit(base9 + str(d1), list(range(11, 1, -1)))
-    return f"{d1}{d2}"
+    return _check_digits(base9)
 
 
 def is_valid(cpf: str) -> bool:
     """Return True if cpf is 11 digits with valid check digits (not all same)."""
-    if len(cpf) != _CPF_LENGTH or not _DIGITS_ONLY.fullmatch(cpf):
+    if len(cpf) != _CPF_LENGTH or not _checksum.is_ascii_digits(cpf):
         return False
     if _is_all_same_digit(cpf):
         return False
-    return cpf[-2:] == calculate_check_digits(cpf[:9])
+    return cpf[-2:] == _check_digits(cpf[:9])
+
+
+def mask(cpf: str) -> str:
+    """Format an 11-digit CPF as 000.000.000-00."""
+    if len(cpf) != _CPF_LENGTH:
+        raise ValueError("CPF must be exactly 11 digits")
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
 
 
 def generate(rng: random.Random | None = None) -> str:
-    """Generate a random valid 11-digit CPF (digits only)."""
-    rng = rng or random.Random()
+    """Generate a random valid 11-digit CPF (digits only).
+
+    rng=None draws from the random module's shared generator; for seeded,
+    resumable streams use docbr_generator.Generator.
+    """
+    randrange = random.randrange if rng is None else rng.randrange
     while True:
-        base9 = "".join(str(rng.randint(0, 9)) for _ in range(9))
+        base9 = f"{randrange(BASE_SPACE):09d}"
+        if not _is_all_same_digit(base9):
+            return base9 + _check_digits(base9)
+
+
+def iter_all(seed: int, *, start: int = 0, stop: int | None = None) -> Iterator[str]:
+    """Yield every valid CPF exactly once, in a pseudo-random order keyed by seed.
+
+    Walks positions start..stop-1 of a keyed permutation of the BASE_SPACE
+    9-digit bases (O(1) memory); the 10 positions landing on an all-same-digit
+    base are skipped. Resume by passing the next position as start; shard by
+    giving each worker a disjoint [start, stop) range.
+    """
+    from docbr_generator.permutation import KeyedPermutation
+
+    stop = BASE_SPACE if stop is None else stop
+    if not 0 <= start <= stop <= BASE_SPACE:
+        raise ValueError(f"need 0 <= start <= stop <= {BASE_SPACE}")
+    permutation = KeyedPermutation(BASE_SPACE, seed)
+    for position in range(start, stop):
+        base9 = f"{permutation(position):09d}"
         if _is_all_same_digit(base9):
             continue
-        cpf = base9 + calculate_check_digits(base9)
-        if is_valid(cpf):
-            return cpf
+        yield base9 + _check_digits(base9)
+
+
+def _region_probabilities(region_weights: Mapping[int | str, float]) -> np.ndarray:
+    """Turn {region digit or UF: weight} into a length-10 weight vector."""
+    import numpy as np
+
+    weights = np.zeros(10, dtype=np.float64)
+    for key, weight in region_weights.items():
+        if isinstance(key, str):
+            if key.upper() not in _UF_REGIONS:
+                raise ValueError(f"Unknown UF in region_weights: {key!r}")
+            region = _UF_REGIONS[key.upper()]
+        elif isinstance(key, int) and 0 <= key <= 9:
+            region = key
+        else:
+            raise ValueError(f"region_weights keys must be 0-9 or a UF, got {key!r}")
+        if not weight >= 0 or weight == float("inf"):
+            raise ValueError(f"region weight must be finite and >= 0, got {weight!r}")
+        weights[region] += weight
+    if not weights.sum() > 0:
+        raise ValueError("region_weights must have a positive total")
+    return weights
+
+
+def generate_many(
+    n: int,
+    rng: np.random.Generator | int | None = None,
+    *,
+    output: str = "str",
+    unique: bool = False,
+    seen: Bitset | None = None,
+    region_weights: Mapping[int | str, float] | None = None,
+) -> list[str] | bytes | np.ndarray:
+    """Generate n valid CPFs in one vectorized batch (requires numpy).
+
+    rng is a numpy Generator or an int seed; the same seed yields the same batch.
+    output="str" returns digit strings, "bytes" one ASCII buffer of 11-byte
+    records, "array" the (n, 11) uint8 digit matrix.
+    unique=True makes every base in the batch distinct. Passing seen, a
+    Bitset(BASE_SPACE) (optionally file-backed), also skips bases issued by
+    earlier calls and records the new ones.
+    region_weights draws the ninth (fiscal region) digit from a distribution
+    keyed by region digit 0-9 or by UF (e.g. {"SP": 46.0, "RJ": 17.5}); UFs of
+    one region add up and unlisted regions get weight 0. It cannot be combined
+    with unique/seen.
+    """
+    import numpy as np
+
+    from docbr_generator import _vectorized as vec
+
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    vec.check_output(output)
+    gen = vec.as_generator(rng)
+
+    if region_weights is not None and (unique or seen is not None):
+        raise ValueError("region_weights cannot be combined with unique/seen")
+
+    digits = np.empty((n, _CPF_LENGTH), dtype=np.uint8)
+    if unique or seen is not None:
+        digits[:, :9] = vec.int_digits(vec.unique_bases(gen, n, 9, seen), 9)
+    elif region_weights is not None:
+        prob, alias = vec.alias_table(_region_probabilities(region_weights))
+        digits[:, 8] = vec.alias_sample(gen, prob, alias, n)
+        digits[:, :8] = gen.integers(0, 10, size=(n, 8), dtype=np.uint8)
+        rejected = np.flatnonzero(vec.all_same_digit_rows(digits[:, :9]))
+        while rejected.size:
+            digits[rejected, :8] = gen.integers(
+                0, 10, size=(rejected.size, 8), dtype=np.uint8
+            )
+            rejected = rejected[vec.all_same_digit_rows(digits[rejected, :9])]
+    else:
+        digits[:, :9] = vec.random_digits(gen, n, 9)
+    digits[:, 9] = vec.mod11_check_digits(digits[:, :9], _WEIGHTS_D1)
+    digits[:, 10] = vec.mod11_check_digits(digits[:, :10], _WEIGHTS_D2)
+    return vec.to_output(digits, output)
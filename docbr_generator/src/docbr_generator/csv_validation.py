@@ -0,0 +1,175 @@
+"""Validate one CPF/CNPJ column of a large CSV file in bounded-memory batches.
+
+Rows are parsed with the csv module and the column is checked chunk_rows values
+at a time through validate_many(strip_masks=True), so masked values such as
+529.982.247-25 pass. Only invalid rows are kept. With workers > 1 the file is
+split into byte ranges at line boundaries and each range is parsed and checked
+in its own process, which assumes no quoted field spans several lines.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+DEFAULT_CHUNK_ROWS = 1 << 16
+_RANGE_BYTES = 1 << 24
+
+
+@dataclass(frozen=True)
+class CsvValidation:
+    """Totals for one validated file; invalid rows go to the report stream."""
+
+    rows: int
+    invalid: int
+
+
+@dataclass(frozen=True)
+class _ColumnCheck:
+    index: int
+    kind: str
+    alphanumeric: bool
+    delimiter: str
+    encoding: str
+    chunk_rows: int
+
+
+def resolve_column(header: list[str] | None, column: str) -> int:
+    """Return the 0-based index of column: a header name, else a 1-based number."""
+    if header is not None and column in header:
+        return header.index(column)
+    if column.isdigit() and int(column) >= 1:
+        return int(column) - 1
+    if header is None:
+        raise ValueError(f"column must be a 1-based number, got {column!r}")
+    raise ValueError(f"column {column!r} not in header: {', '.join(header)}")
+
+
+def validate_csv(
+    path: Path,
+    report: TextIO,
+    *,
+    column: str,
+    kind: str,
+    alphanumeric: bool = False,
+    header: bool = True,
+    delimiter: str = ",",
+    encoding: str = "utf-8-sig",
+    workers: int = 1,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> CsvValidation:
+    """Check column of every data row in path; write invalid rows to report.
+
+    The report is CSV with a "row,value" header; rows are numbered from 1,
+    counting data rows only (the header is not a row). Undecodable bytes become
+    U+FFFD and rows too short to have the column count as invalid.
+    """
+    from docbr_generator.validation import _spec_for
+
+    _spec_for(kind)
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+
+    with path.open("rb") as handle:
+        first_line = handle.readline() if header else b""
+        data_start = handle.tell()
+    names = None
+    if header:
+        text = first_line.decode(encoding, errors="replace")
+        names = next(csv.reader([text], delimiter=delimiter), [])
+    check = _ColumnCheck(
+        resolve_column(names, column),
+        kind,
+        alphanumeric,
+        delimiter,
+        encoding,
+        chunk_rows,
+    )
+
+    writer = csv.writer(report, lineterminator="\n")
+    writer.writerow(("row", "value"))
+    rows = invalid = 0
+    for range_rows, range_invalid in _check_ranges(path, data_start, check, workers):
+        writer.writerows((rows + row, value) for row, value in range_invalid)
+        rows += range_rows
+        invalid += len(range_invalid)
+    return CsvValidation(rows=rows, invalid=invalid)
+
+
+def _check_ranges(
+    path: Path, data_start: int, check: _ColumnCheck, workers: int
+) -> Iterator[tuple[int, list[tuple[int, str]]]]:
+    """Yield (row count, invalid rows numbered within the piece) in file order."""
+    if workers == 1:
+        # One sequential pass, batch by batch; quoted fields may span lines here.
+        with path.open(encoding=check.encoding, errors="replace", newline="") as handle:
+            handle.seek(data_start)
+            yield from _check_batches(
+                csv.reader(handle, delimiter=check.delimiter), check
+            )
+        return
+
+    bounds = _line_ranges(path, data_start)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(
+            partial(_check_range, path, check=check), bounds[:-1], bounds[1:]
+        )
+
+
+def _line_ranges(path: Path, start: int) -> list[int]:
+    """Split [start, EOF) into ~_RANGE_BYTES pieces ending on line boundaries."""
+    size = os.path.getsize(path)
+    bounds = [start]
+    with path.open("rb") as handle:
+        while bounds[-1] < size:
+            handle.seek(bounds[-1] + _RANGE_BYTES)
+            handle.readline()
+            bounds.append(min(handle.tell(), size))
+    return bounds
+
+
+def _check_range(
+    path: Path, start: int, stop: int, *, check: _ColumnCheck
+) -> tuple[int, list[tuple[int, str]]]:
+    """Worker entry point: parse and check the rows in bytes [start, stop)."""
+    with path.open("rb") as handle:
+        handle.seek(start)
+        data = handle.read(stop - start)
+    text = io.StringIO(data.decode(check.encoding, errors="replace"), newline="")
+    count = 0
+    invalid: list[tuple[int, str]] = []
+    reader = csv.reader(text, delimiter=check.delimiter)
+    for batch_rows, batch_invalid in _check_batches(reader, check):
+        invalid.extend((count + row, value) for row, value in batch_invalid)
+        count += batch_rows
+    return count, invalid
+
+
+def _check_batches(
+    rows: Iterable[list[str]], check: _ColumnCheck
+) -> Iterator[tuple[int, list[tuple[int, str]]]]:
+    """Yield (batch size, invalid (1-based row in batch, value)) per chunk_rows."""
+    from docbr_generator.validation import validate_many
+
+    index = check.index
+    iterator = iter(rows)
+    while batch := list(islice(iterator, check.chunk_rows)):
+        values = [row[index] if len(row) > index else "" for row in batch]
+        valid = validate_many(
+            values,
+            kind=check.kind,
+            alphanumeric=check.alphanumeric,
+            strip_masks=True,
+        )
+        positions = (~valid).nonzero()[0].tolist()
+        yield len(batch), [(position + 1, values[position]) for position in positions]
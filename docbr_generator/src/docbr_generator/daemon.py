@@ -0,0 +1,96 @@
+"""Resident generator daemon on a Unix domain socket (client: docbr_generator.client).
+
+Protocol: one request per line (b"cpf\\n" or b"cnpj\\n"), answered with the value
+and a newline, or b"error: ...\\n". A connection may send many requests.
+The daemon keeps a warm pool per document type, refilled in large batches.
+"""
+
+from __future__ import annotations
+
+import socketserver
+import stat
+import threading
+from collections import deque
+from pathlib import Path
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.client import ERROR_PREFIX, default_socket_path, request_document
+
+DEFAULT_POOL_SIZE = 4096
+
+
+class DocumentPool:
+    """Thread-safe pool of pre-generated documents, refilled pool_size at a time."""
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        self._pool_size = pool_size
+        self._pools: dict[str, deque[str]] = {"cpf": deque(), "cnpj": deque()}
+        self._refill_lock = threading.Lock()
+
+    def take(self, document: str) -> str:
+        try:
+            pool = self._pools[document]
+        except KeyError:
+            raise ValueError(f"Unsupported document type: {document}") from None
+        while True:
+            try:
+                return pool.popleft()
+            except IndexError:
+                with self._refill_lock:
+                    if not pool:
+                        pool.extend(_generate_batch(document, self._pool_size))
+
+    def warm(self) -> None:
+        for document in self._pools:
+            self._pools[document].extend(_generate_batch(document, self._pool_size))
+
+
+def _generate_batch(document: str, count: int) -> list[str]:
+    module = cpf if document == "cpf" else cnpj
+    try:
+        return module.generate_many(count)
+    except ImportError:
+        return [module.generate() for _ in range(count)]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DocumentServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            document = line.strip().decode("ascii", errors="replace")
+            try:
+                reply = self.server.pool.take(document)
+            except ValueError as exc:
+                reply = f"{ERROR_PREFIX}{exc}"
+            self.wfile.write(f"{reply}\n".encode("utf-8"))
+            self.wfile.flush()
+
+
+class DocumentServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, pool: DocumentPool) -> None:
+        if path.exists() or path.is_symlink():
+            if not stat.S_ISSOCK(path.lstat().st_mode):
+                raise RuntimeError(f"{path} exists and is not a socket")
+            if request_document("cpf", path) is not None:
+                raise RuntimeError(f"a daemon is already listening on {path}")
+            path.unlink()  # stale socket from a previous run
+        self.pool = pool
+        self.path = path
+        super().__init__(str(path), _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def serve(path: Path | None = None, *, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+    """Warm the pool and answer requests on path until interrupted."""
+    pool = DocumentPool(pool_size)
+    pool.warm()
+    with DocumentServer(path or Path(default_socket_path()), pool) as server:
+        server.serve_forever()
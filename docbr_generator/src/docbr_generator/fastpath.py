@@ -0,0 +1,111 @@
+"""Startup-optimized entry point: the single-value Shortcuts case skips argparse.
+
+`docbr-generator cpf|cnpj [--copy] [--paste] [--no-daemon] [--masked |
+--digits-only]` runs here without importing argparse, dataclasses or numpy;
+[output] digits_only is read through the marshal-cached _rawconfig and
+subprocess is only imported for --copy/--paste. Anything else is handed to the
+full argparse CLI.
+"""
+
+from __future__ import annotations
+
+import sys
+
+_DOCUMENTS = ("cpf", "cnpj")
+_FLAGS = frozenset({"--copy", "--paste", "--no-daemon", "--masked", "--digits-only"})
+
+
+def run_single(
+    document: str,
+    *,
+    copy: bool = False,
+    paste: bool = False,
+    use_daemon: bool = True,
+    masked: bool = False,
+) -> int:
+    """Print one document, optionally copying/pasting it; return the exit code."""
+    value = None
+    if use_daemon:
+        from docbr_generator.client import request_document
+
+        value = request_document(document)
+    if value is None:
+        if document == "cpf":
+            from docbr_generator.cpf import generate
+        else:
+            from docbr_generator.cnpj import generate
+        value = generate()
+    if not value.isdigit():
+        print("generator produced non-digit output", file=sys.stderr)
+        return 1
+    if masked:
+        if document == "cpf":
+            from docbr_generator.cpf import mask
+        else:
+            from docbr_generator.cnpj import mask
+        value = mask(value)
+
+    if copy or paste:
+        from docbr_generator.clipboard import copy_to_clipboard
+
+        try:
+            copy_to_clipboard(value)
+        except (OSError, RuntimeError) as exc:
+            print(f"failed to copy to clipboard: {exc}", file=sys.stderr)
+            return 1
+
+    if paste:
+        from docbr_generator.clipboard import paste_from_clipboard
+
+        try:
+            paste_from_clipboard()
+        except (OSError, RuntimeError) as exc:
+            print(f"failed to paste: {exc}", file=sys.stderr)
+            print(
+                "Grant Accessibility to Terminal/Shortcuts/osascript under "
+                "System Settings → Privacy & Security → Accessibility.",
+                file=sys.stderr,
+            )
+            return 1
+
+    # Single trailing newline for shell pipelines.
+    print(value)
+    return 0
+
+
+def _config_masked() -> bool:
+    from docbr_generator._rawconfig import load_raw
+
+    output = load_raw().get("output") or {}
+    return output.get("digits_only", True) is False
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    flags = argv[1:]
+    if (
+        argv
+        and argv[0] in _DOCUMENTS
+        and _FLAGS.issuperset(flags)
+        and len(set(flags)) == len(flags)
+        and not {"--masked", "--digits-only"}.issubset(flags)
+    ):
+        if "--masked" in flags or "--digits-only" in flags:
+            masked = "--masked" in flags
+        else:
+            masked = _config_masked()
+        return run_single(
+            argv[0],
+            copy="--copy" in flags,
+            paste="--paste" in flags,
+            use_daemon="--no-daemon" not in flags,
+            masked=masked,
+        )
+
+    from docbr_generator.cli import main as cli_main
+
+    return cli_main(argv)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
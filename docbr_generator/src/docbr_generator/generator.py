@@ -0,0 +1,205 @@
+"""Seeded, seekable, thread-safe document stream (docbr_generator.Generator).
+
+Document i of a stream is derived from one SplitMix64 word for (seed, i), so
+the stream is counter-based: seeking or skipping ahead is O(1), any slice can be
+regenerated on its own, and both backends produce the same values. The
+"numpy" backend computes whole batches as uint64 arrays; the "random" backend
+is pure Python, for installs without the bulk extra.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import secrets
+import threading
+from typing import TYPE_CHECKING
+
+from docbr_generator import cnpj, cpf
+
+if TYPE_CHECKING:
+    import numpy as np
+
+BACKENDS = ("numpy", "random")
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_ALPHANUMERIC = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Base/root space, digits drawn per document, and symbols per digit.
+_LAYOUTS = {
+    ("cpf", False): (cpf.BASE_SPACE, 9, 10),
+    ("cnpj", False): (cnpj.ROOT_SPACE, 8, 10),
+    ("cnpj", True): (36**8, 8, 36),
+}
+
+
+def _finalize(z: int) -> int:
+    """SplitMix64 output function."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _is_repdigit(base: int, width: int, radix: int) -> bool:
+    return base % ((radix**width - 1) // (radix - 1)) == 0
+
+
+class Generator:
+    """Reproducible CPF/CNPJ source owning a counter-based PRNG.
+
+    seed=None draws a fresh 64-bit seed, kept in .seed so a run can be
+    replayed. position is the index of the next document; every call reserves
+    its indices under a lock, so threads sharing one Generator never receive
+    the same index and a batch equals the values it would have produced one by
+    one. Bases are word % space, biased by at most space / 2**64: about 5e-11
+    for CPF, 5e-12 for numeric CNPJ and 1.5e-7 for alphanumeric CNPJ.
+    """
+
+    def __init__(self, seed: int | None = None, *, backend: str = "numpy") -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}")
+        # Fail at construction, not halfway through a run.
+        if backend == "numpy" and importlib.util.find_spec("numpy") is None:
+            raise ImportError(
+                "the numpy backend requires numpy: "
+                "pip install 'docbr-generator[bulk]' (or use backend=\"random\")"
+            )
+        self.seed = secrets.randbits(64) if seed is None else seed
+        self.backend = backend
+        digest = hashlib.blake2b(
+            str(self.seed).encode("ascii"), digest_size=8, person=b"docbr-gen"
+        ).digest()
+        self._key = int.from_bytes(digest, "little")
+        self._position = 0
+        self._lock = threading.Lock()
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def seek(self, index: int) -> None:
+        """Make index the next document to be produced (resume a stream)."""
+        if index < 0:
+            raise ValueError("index must be >= 0")
+        with self._lock:
+            self._position = index
+
+    def skip(self, count: int) -> None:
+        """Jump ahead count documents without generating them."""
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        with self._lock:
+            self._position += count
+
+    def _reserve(self, count: int) -> int:
+        with self._lock:
+            start = self._position
+            self._position += count
+        return start
+
+    def generate(self, kind: str = "cpf", *, alphanumeric: bool = False) -> str:
+        """Return the next CPF or CNPJ (branch 0001) as a digits-only string."""
+        layout = _layout(kind, alphanumeric)
+        return _document(self._key, self._reserve(1), kind, layout)
+
+    def generate_many(
+        self,
+        kind: str,
+        n: int,
+        *,
+        output: str = "str",
+        alphanumeric: bool = False,
+    ) -> list[str] | bytes | np.ndarray:
+        """Return the next n documents; output as in cpf.generate_many.
+
+        The "random" backend supports output="str" and "bytes" only.
+        """
+        layout = _layout(kind, alphanumeric)
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        if self.backend == "random":
+            if output not in ("str", "bytes"):
+                raise ValueError('backend "random" only supports output "str"/"bytes"')
+            start = self._reserve(n)
+            values = [
+                _document(self._key, index, kind, layout)
+                for index in range(start, start + n)
+            ]
+            return "".join(values).encode("ascii") if output == "bytes" else values
+
+        from docbr_generator import _vectorized as vec
+
+        vec.check_output(output)
+        digits = _document_matrix(self._key, self._reserve(n), n, kind, layout)
+        return vec.to_output(digits, output)
+
+
+def _layout(kind: str, alphanumeric: bool) -> tuple[int, int, int]:
+    if alphanumeric and kind != "cnpj":
+        raise ValueError("alphanumeric only applies to CNPJ")
+    try:
+        return _LAYOUTS[kind, alphanumeric]
+    except KeyError:
+        raise ValueError(f"Unsupported document type: {kind}") from None
+
+
+def _document(key: int, index: int, kind: str, layout: tuple[int, int, int]) -> str:
+    space, width, radix = layout
+    word = _finalize((key + (index + 1) * _GOLDEN) & _MASK64)
+    while _is_repdigit(word % space, width, radix):
+        word = _finalize((word + _GOLDEN) & _MASK64)
+    base = word % space
+    if kind == "cpf":
+        base9 = f"{base:09d}"
+        return base9 + cpf._check_digits(base9)
+    if radix == 10:
+        root = f"{base:08d}"
+    else:
+        powers = range(width - 1, -1, -1)
+        root = "".join(_ALPHANUMERIC[base // 36**power % 36] for power in powers)
+    return root + "0001" + cnpj._check_digits(root + "0001")
+
+
+def _document_matrix(
+    key: int, start: int, n: int, kind: str, layout: tuple[int, int, int]
+) -> np.ndarray:
+    """Vectorized _document for indices start..start+n-1, as a digit matrix."""
+    import numpy as np
+
+    from docbr_generator import _vectorized as vec
+
+    space, width, radix = layout
+    counters = np.arange(start + 1, start + n + 1, dtype=np.uint64)
+    words = _finalize_array(counters * np.uint64(_GOLDEN) + np.uint64(key))
+    repdigit = np.uint64((radix**width - 1) // (radix - 1))
+    rejected = np.flatnonzero(words % np.uint64(space) % repdigit == 0)
+    while rejected.size:
+        words[rejected] = _finalize_array(words[rejected] + np.uint64(_GOLDEN))
+        rejected = rejected[words[rejected] % np.uint64(space) % repdigit == 0]
+    bases = words % np.uint64(space)
+
+    powers = np.uint64(radix) ** np.arange(width - 1, -1, -1, dtype=np.uint64)
+    base_digits = (bases[:, None] // powers % np.uint64(radix)).astype(np.uint8)
+    if kind == "cpf":
+        digits = np.empty((n, 11), dtype=np.uint8)
+        digits[:, :9] = base_digits
+        digits[:, 9] = vec.mod11_check_digits(digits[:, :9], cpf._WEIGHTS_D1)
+        digits[:, 10] = vec.mod11_check_digits(digits[:, :10], cpf._WEIGHTS_D2)
+        return digits
+    digits = np.empty((n, 14), dtype=np.uint8)
+    if radix != 10:
+        base_digits = vec.ALPHANUMERIC_VALUES[base_digits]
+    digits[:, :8] = base_digits
+    digits[:, 8:12] = (0, 0, 0, 1)
+    digits[:, 12] = vec.mod11_check_digits(digits[:, :12], cnpj._WEIGHTS_D1)
+    digits[:, 13] = vec.mod11_check_digits(digits[:, :13], cnpj._WEIGHTS_D2)
+    return digits
+
+
+def _finalize_array(z: np.ndarray) -> np.ndarray:
+    """SplitMix64 output function over a uint64 array (wrapping arithmetic)."""
+    import numpy as np
+
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
@@ -0,0 +1,55 @@
+"""Keyed bijection over [0, size) via a numeric Feistel network + cycle walking."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+
+_MASK64 = (1 << 64) - 1
+_ROUNDS = 6
+
+
+class KeyedPermutation:
+    """Pseudo-random permutation of [0, size) selected by an integer seed.
+
+    Values are split into two halves in [0, m) with m = ceil(sqrt(size)) and
+    run through Feistel rounds, a bijection on [0, m*m). Outputs >= size are
+    fed back in (cycle walking) until they land inside the domain, which keeps
+    the map a bijection on [0, size). State is just the round keys: O(1) memory.
+    """
+
+    def __init__(self, size: int, seed: int) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self._half = math.isqrt(size - 1) + 1
+        digest = hashlib.blake2b(
+            str(seed).encode("ascii"), digest_size=8 * _ROUNDS, person=b"docbr-perm"
+        ).digest()
+        self._keys = [
+            int.from_bytes(digest[i : i + 8], "little")
+            for i in range(0, len(digest), 8)
+        ]
+
+    def __call__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError(f"index {index} outside [0, {self.size})")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def _encrypt(self, value: int) -> int:
+        half = self._half
+        left, right = divmod(value, half)
+        for key in self._keys:
+            left, right = right, (left + _mix(right, key)) % half
+        return left * half + right
+
+
+def _mix(value: int, key: int) -> int:
+    """SplitMix64-style finalizer of value keyed by key (the Feistel round function)."""
+    x = (value * 0x9E3779B97F4A7C15 + key) & _MASK64
+    x ^= x >> 31
+    x = (x * 0xBF58476D1CE4E5B9) & _MASK64
+    return x ^ (x >> 29)
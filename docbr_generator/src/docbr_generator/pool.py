@@ -0,0 +1,135 @@
+"""Pre-generated pool files of packed documents, shared safely across processes.
+
+File layout (little-endian): a 32-byte header — magic, document kind, record
+width, record count, next-record cursor — followed by fixed-width records, each
+the full document as an unsigned int (5 bytes per CPF, 6 per CNPJ). Readers
+memory-map the file and advance the cursor under an exclusive flock, so any
+number of processes (e.g. pytest-xdist workers) take distinct values.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from docbr_generator import cnpj, cpf
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_MAGIC = b"DOCBRPL1"
+_HEADER = struct.Struct("<8sBB6xQQ")
+_CURSOR = struct.Struct("<Q")
+_CURSOR_OFFSET = _HEADER.size - _CURSOR.size
+_KINDS = ("cpf", "cnpj")
+_LENGTHS = {"cpf": 11, "cnpj": 14}
+_WIDTHS = {"cpf": 5, "cnpj": 6}
+_GENERATORS = {"cpf": cpf.generate_many, "cnpj": cnpj.generate_many}
+_BASE_SPACES = {"cpf": cpf.BASE_SPACE, "cnpj": cnpj.ROOT_SPACE}
+_BUILD_CHUNK = 1 << 18
+
+
+class PoolExhaustedError(Exception):
+    """Raised when a pool file has no untaken documents left."""
+
+
+def _pack(digits: np.ndarray, width: int) -> bytes:
+    """Pack an (n, length) digit matrix into n little-endian width-byte ints."""
+    import numpy as np
+
+    powers = 10 ** np.arange(digits.shape[1] - 1, -1, -1, dtype=np.uint64)
+    values = (digits.astype(np.uint64) @ powers).astype("<u8")
+    return values.view(np.uint8).reshape(-1, 8)[:, :width].tobytes()
+
+
+def build_pool(
+    path: Path,
+    document: str,
+    count: int,
+    *,
+    seed: int | None = None,
+) -> None:
+    """Write a pool file of count distinct valid documents (requires numpy)."""
+    import numpy as np
+
+    from docbr_generator.bitset import Bitset
+
+    if document not in _KINDS:
+        raise ValueError(f"Unsupported document type: {document}")
+    if count < 0:
+        raise ValueError("count must be >= 0")
+    gen = np.random.default_rng(seed)
+    seen = Bitset(_BASE_SPACES[document])
+    width = _WIDTHS[document]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, _KINDS.index(document), width, count, 0))
+        for start in range(0, count, _BUILD_CHUNK):
+            rows = min(_BUILD_CHUNK, count - start)
+            digits = _GENERATORS[document](rows, rng=gen, output="array", seen=seen)
+            handle.write(_pack(digits, width))
+
+
+class Pool:
+    """Memory-mapped reader that hands out each pooled document at most once."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path.open("r+b")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            magic, kind, width, count, _ = _HEADER.unpack_from(self._map)
+            if magic != _MAGIC or kind >= len(_KINDS):
+                raise ValueError(f"{path} is not a docbr pool file")
+            if len(self._map) != _HEADER.size + count * width:
+                raise ValueError(f"{path} is truncated or corrupt: size mismatch")
+        except Exception:
+            self._file.close()
+            raise
+        self.document = _KINDS[kind]
+        self.count = count
+        self._width = width
+        self._length = _LENGTHS[self.document]
+
+    def __enter__(self) -> Pool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def remaining(self) -> int:
+        return self.count - _CURSOR.unpack_from(self._map, _CURSOR_OFFSET)[0]
+
+    def take(self) -> str:
+        """Return the next untaken document; PoolExhaustedError when none are left."""
+        return self.take_many(1)[0]
+
+    def take_many(self, n: int) -> list[str]:
+        """Atomically reserve the next n documents (all or nothing) and return them."""
+        if n < 1:
+            raise ValueError("n must be >= 1")
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        try:
+            (start,) = _CURSOR.unpack_from(self._map, _CURSOR_OFFSET)
+            if start + n > self.count:
+                raise PoolExhaustedError(
+                    f"{self.path}: {n} requested, {self.count - start} left"
+                )
+            _CURSOR.pack_into(self._map, _CURSOR_OFFSET, start + n)
+        finally:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+        width, length = self._width, self._length
+        offset = _HEADER.size + start * width
+        return [
+            f"{int.from_bytes(self._map[pos : pos + width], 'little'):0{length}d}"
+            for pos in range(offset, offset + n * width, width)
+        ]
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
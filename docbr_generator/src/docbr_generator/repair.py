@@ -0,0 +1,134 @@
+"""Suggest valid CPFs/CNPJs one typo away from an invalid value.
+
+Two typo classes are tried: a single mistyped character (substitution) and two
+swapped neighbours (adjacent transposition). Both weighted Mod-11 sums are
+computed once per value; each candidate then adjusts them by weight * delta
+for the one or two changed positions, an O(1) check instead of re-summing the
+whole document. Weights are zero-padded over the check-digit positions, so a
+typo in a check digit needs no special casing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from docbr_generator import _checksum, cnpj, cpf
+
+_DIGITS = "0123456789"
+_ALPHANUMERIC = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Mask punctuation and blanks ignored in input, as in validate_many(strip_masks).
+_STRIP_MASK = str.maketrans("", "", ".-/ \t")
+# Weighted sum % 11 → check digit.
+_CHECK_DIGIT = (0, 0, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+
+
+@dataclass(frozen=True)
+class _Spec:
+    length: int
+    weights_d1: tuple[int, ...]
+    weights_d2: tuple[int, ...]
+    base_symbols: str
+    # (symbol, value) pairs tried at base positions and at check positions.
+    base_values: tuple[tuple[str, int], ...]
+    check_values: tuple[tuple[str, int], ...]
+
+
+def _spec(
+    length: int, weights_d1: list[int], weights_d2: list[int], symbols: str
+) -> _Spec:
+    pad_d1 = (0,) * (length - len(weights_d1))
+    pad_d2 = (0,) * (length - len(weights_d2))
+    return _Spec(
+        length,
+        (*weights_d1, *pad_d1),
+        (*weights_d2, *pad_d2),
+        symbols,
+        tuple((symbol, ord(symbol) - 48) for symbol in symbols),
+        tuple((symbol, ord(symbol) - 48) for symbol in _DIGITS),
+    )
+
+
+_SPECS = {
+    ("cpf", False): _spec(11, cpf._WEIGHTS_D1, cpf._WEIGHTS_D2, _DIGITS),
+    ("cnpj", False): _spec(14, cnpj._WEIGHTS_D1, cnpj._WEIGHTS_D2, _DIGITS),
+    ("cnpj", True): _spec(14, cnpj._WEIGHTS_D1, cnpj._WEIGHTS_D2, _ALPHANUMERIC),
+}
+
+
+def candidates(value: str, *, kind: str, alphanumeric: bool = False) -> list[str]:
+    """Return valid documents one substitution or adjacent swap away from value.
+
+    Mask punctuation is ignored and results are bare characters: swaps first,
+    then substitutions, each left to right. A value that is already valid, has
+    the wrong length, or contains characters outside the alphabet yields [].
+    alphanumeric=True (CNPJ only) also tries and accepts A-Z in the base.
+    """
+    if alphanumeric and kind != "cnpj":
+        raise ValueError("alphanumeric repair only applies to CNPJ")
+    try:
+        spec = _SPECS[kind, alphanumeric]
+    except KeyError:
+        raise ValueError(f"Unsupported document type: {kind}") from None
+
+    text = value.translate(_STRIP_MASK)
+    length = spec.length
+    base = length - 2
+    if len(text) != length or not text.isascii():
+        return []
+    if not all(char in spec.base_symbols for char in text[:base]):
+        return []
+    if not _checksum.is_ascii_digits(text[base:]):
+        return []
+
+    values = [_checksum.ASCII_VALUES[code] for code in text.encode("ascii")]
+    w1, w2 = spec.weights_d1, spec.weights_d2
+    sum1 = sum(map(int.__mul__, w1, values))
+    sum2 = sum(map(int.__mul__, w2, values))
+    d1, d2 = values[base], values[base + 1]
+    if _CHECK_DIGIT[sum1 % 11] == d1 and _CHECK_DIGIT[sum2 % 11] == d2:
+        return []
+
+    found: list[str] = []
+    for i in range(length - 1):
+        left, right = values[i], values[i + 1]
+        if left == right:
+            continue
+        # Swapping moves delta = right - left from weight w[i + 1] to w[i].
+        delta = right - left
+        new_d1 = right if i == base else (left if i + 1 == base else d1)
+        new_d2 = left if i + 1 == base + 1 else d2
+        if new_d1 > 9 or new_d2 > 9:
+            continue
+        if (
+            _CHECK_DIGIT[(sum1 + (w1[i] - w1[i + 1]) * delta) % 11] == new_d1
+            and _CHECK_DIGIT[(sum2 + (w2[i] - w2[i + 1]) * delta) % 11] == new_d2
+        ):
+            found.append(f"{text[:i]}{text[i + 1]}{text[i]}{text[i + 2:]}")
+
+    for i in range(length):
+        old, weight1, weight2 = values[i], w1[i], w2[i]
+        # Sums without position i; each symbol then adds weight * its value.
+        rest1, rest2 = sum1 - weight1 * old, sum2 - weight2 * old
+        pairs = spec.base_values if i < base else spec.check_values
+        for symbol, new in pairs:
+            if new == old:
+                continue
+            new_d1 = new if i == base else d1
+            new_d2 = new if i == base + 1 else d2
+            if (
+                _CHECK_DIGIT[(rest1 + weight1 * new) % 11] == new_d1
+                and _CHECK_DIGIT[(rest2 + weight2 * new) % 11] == new_d2
+            ):
+                found.append(f"{text[:i]}{symbol}{text[i + 1:]}")
+
+    return [doc for doc in found if doc != doc[0] * length]
+
+
+def repair_many(
+    values: Iterable[str], *, kind: str, alphanumeric: bool = False
+) -> list[list[str]]:
+    """candidates() for every value, in order (an empty list for valid values)."""
+    return [
+        candidates(value, kind=kind, alphanumeric=alphanumeric) for value in values
+    ]
@@ -0,0 +1,455 @@
+"""Minimal asyncio HTTP/1.1 service generating and validating documents.
+
+Endpoints (keep-alive and pipelined requests are supported):
+
+    GET  /cpf?count=N[&masked=1][&seed=S]     one CPF per line
+    GET  /cnpj?count=N[&masked=1][&seed=S]    one CNPJ (branch 0001) per line
+    POST /validate?kind=cpf|cnpj[&alphanumeric=1]
+         body: one value per line, masks allowed; reply: "1" or "0" per line
+
+Unseeded requests of up to INLINE_COUNT values are sliced from buffers rendered
+pool_records at a time, so a small request costs a slice and a write. Larger
+or seeded requests are rendered by stream.write_documents one chunk at a time
+and sent chunked, pausing while the transport's write buffer is full; a seeded
+response equals `docbr-generator <kind> -n N --seed S`. Validation runs on
+the default executor so a large body does not stall other connections.
+Requires numpy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import io
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.client import ERROR_PREFIX
+from docbr_generator.stream import DEFAULT_CHUNK_SIZE, write_documents
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_POOL_RECORDS = 1 << 16
+INLINE_COUNT = 1 << 12
+MAX_COUNT = 100_000_000
+MAX_BODY_BYTES = 1 << 24
+
+_MAX_HEAD_BYTES = 1 << 13
+_MASKS = {"cpf": cpf.MASK, "cnpj": cnpj.MASK}
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Content Too Large",
+    431: "Request Header Fields Too Large",
+    501: "Not Implemented",
+    503: "Service Unavailable",
+}
+_TRUE = ("1", "true", "yes")
+_FALSE = ("", "0", "false", "no")
+
+
+class _HttpError(Exception):
+    """A request answered with status and an "error: ..." body."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class _Request:
+    method: str
+    path: str
+    query: dict[str, str]
+    body: bytes
+    keep_alive: bool
+    # HTTP/1.0 peers cannot decode chunked bodies.
+    chunked: bool
+
+
+@dataclass(frozen=True)
+class _Response:
+    """A complete body, chunks sent with chunked encoding, or off-loop work."""
+
+    body: bytes = b""
+    chunks: Iterator[bytes] | None = None
+    headers: tuple[tuple[str, str], ...] = ()
+    deferred: Callable[[], _Response] | None = None
+
+
+def _parse_request(buffer: bytearray) -> _Request | None:
+    """Remove and return the first complete request in buffer, or None yet."""
+    end = buffer.find(b"\r\n\r\n", 0, _MAX_HEAD_BYTES + 4)
+    if end < 0:
+        if len(buffer) >= _MAX_HEAD_BYTES + 4:
+            raise _HttpError(431, "request head too large")
+        return None
+    lines = bytes(buffer[:end]).decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise _HttpError(400, "malformed request line") from None
+    if version not in ("HTTP/1.1", "HTTP/1.0"):
+        raise _HttpError(400, f"unsupported protocol {version}")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise _HttpError(400, "malformed header line")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise _HttpError(501, "chunked request bodies are not supported")
+    length = headers.get("content-length", "0")
+    if not length.isdigit():
+        raise _HttpError(400, "invalid Content-Length")
+    if int(length) > MAX_BODY_BYTES:
+        raise _HttpError(413, f"body exceeds {MAX_BODY_BYTES} bytes")
+
+    start = end + 4
+    stop = start + int(length)
+    if len(buffer) < stop:
+        return None
+    body = bytes(buffer[start:stop])
+    del buffer[:stop]
+    connection = headers.get("connection", "").lower()
+    http11 = version == "HTTP/1.1"
+    path, _, query = target.partition("?")
+    return _Request(
+        method=method,
+        path=path,
+        query=dict(parse_qsl(query, keep_blank_values=True)),
+        body=body,
+        keep_alive=connection != "close" if http11 else connection == "keep-alive",
+        chunked=http11,
+    )
+
+
+def _render(kind: str, count: int, *, masked: bool, rng: np.random.Generator) -> bytes:
+    handle = io.BytesIO()
+    write_documents(handle, kind, count, rng=rng, masked=masked)
+    return handle.getvalue()
+
+
+class _LineBuffer:
+    """Pre-rendered newline-terminated documents of one kind and style."""
+
+    def __init__(self, kind: str, masked: bool, records: int) -> None:
+        from docbr_generator import _vectorized as vec
+
+        self._kind = kind
+        self._masked = masked
+        self._records = records
+        self._gen = vec.as_generator(None)
+        pattern = _MASKS[kind]
+        self._width = (len(pattern) if masked else pattern.count("0")) + 1
+        self._data = b""
+        self._offset = 0
+
+    def take(self, count: int) -> bytes:
+        size = count * self._width
+        parts = []
+        while size:
+            if self._offset == len(self._data):
+                self._refill()
+            part = self._data[self._offset : self._offset + size]
+            self._offset += len(part)
+            size -= len(part)
+            parts.append(part)
+        return b"".join(parts)
+
+    def _refill(self) -> None:
+        self._data = _render(
+            self._kind, self._records, masked=self._masked, rng=self._gen
+        )
+        self._offset = 0
+
+
+class DocumentService:
+    """Route parsed requests to pooled, streamed or validation responses."""
+
+    def __init__(self, pool_records: int = DEFAULT_POOL_RECORDS) -> None:
+        if pool_records < 1:
+            raise ValueError("pool_records must be >= 1")
+        self._buffers = {
+            (kind, masked): _LineBuffer(kind, masked, pool_records)
+            for kind in _MASKS
+            for masked in (False, True)
+        }
+
+    def warm(self) -> None:
+        """Render every buffer now (and import numpy) instead of on first use."""
+        for buffer in self._buffers.values():
+            buffer._refill()
+
+    def handle(self, request: _Request) -> _Response:
+        if request.path in ("/cpf", "/cnpj"):
+            if request.method != "GET":
+                raise _HttpError(405, f"{request.path} only accepts GET")
+            return self._documents(request.path[1:], request.query)
+        if request.path == "/validate":
+            if request.method != "POST":
+                raise _HttpError(405, "/validate only accepts POST")
+            return _validate(request.query, request.body)
+        raise _HttpError(404, f"no such endpoint: {request.path}")
+
+    def _documents(self, kind: str, query: dict[str, str]) -> _Response:
+        from docbr_generator import _vectorized as vec
+
+        count = _int_param(query, "count", 1)
+        if not 1 <= count <= MAX_COUNT:
+            raise _HttpError(400, f"count must be between 1 and {MAX_COUNT}")
+        masked = _bool_param(query, "masked")
+        if "seed" not in query and count <= INLINE_COUNT:
+            return _Response(body=self._buffers[kind, masked].take(count))
+        gen = vec.as_generator(_int_param(query, "seed", None))
+        if count <= INLINE_COUNT:
+            return _Response(body=_render(kind, count, masked=masked, rng=gen))
+        return _Response(chunks=_render_chunks(kind, count, masked, gen))
+
+
+def _render_chunks(
+    kind: str, count: int, masked: bool, gen: np.random.Generator
+) -> Iterator[bytes]:
+    """Chunks drawing from gen exactly as one write_documents call would."""
+    while count:
+        rows = min(count, DEFAULT_CHUNK_SIZE)
+        yield _render(kind, rows, masked=masked, rng=gen)
+        count -= rows
+
+
+def _validate(query: dict[str, str], body: bytes) -> _Response:
+    kind = query.get("kind")
+    if kind not in _MASKS:
+        raise _HttpError(400, "kind must be cpf or cnpj")
+    alphanumeric = _bool_param(query, "alphanumeric")
+    return _Response(
+        deferred=functools.partial(_validate_lines, kind, alphanumeric, body)
+    )
+
+
+def _validate_lines(kind: str, alphanumeric: bool, body: bytes) -> _Response:
+    import numpy as np
+
+    from docbr_generator.validation import validate_many
+
+    valid = validate_many(
+        body.splitlines(),
+        kind=kind,
+        alphanumeric=alphanumeric,
+        strip_masks=True,
+    )
+    flags = np.full(2 * valid.size, ord("\n"), dtype=np.uint8)
+    flags[0::2] = valid.view(np.uint8) + np.uint8(ord("0"))
+    invalid = valid.size - int(np.count_nonzero(valid))
+    headers = (("X-Invalid-Count", f"{invalid}"),)
+    return _Response(body=flags.tobytes(), headers=headers)
+
+
+def _int_param(query: dict[str, str], name: str, default: int | None) -> int | None:
+    value = query.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise _HttpError(400, f"{name} must be an integer") from None
+
+
+def _bool_param(query: dict[str, str], name: str) -> bool:
+    value = query.get(name, "").lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    raise _HttpError(400, f"{name} must be 1/true/yes or 0/false/no")
+
+
+def _head(status: int, headers: list[tuple[str, str]], keep_alive: bool) -> bytes:
+    lines = [f"HTTP/1.1 {status} {_REASONS[status]}"]
+    lines.append("Content-Type: text/plain; charset=us-ascii")
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    if not keep_alive:
+        lines.append("Connection: close")
+    lines.append("\r\n")
+    return "\r\n".join(lines).encode("latin-1")
+
+
+class _HttpProtocol(asyncio.Protocol):
+    """One connection: parse buffered requests in order, answer each in turn."""
+
+    def __init__(self, service: DocumentService) -> None:
+        self._service = service
+        self._buffer = bytearray()
+        self._transport: asyncio.Transport | None = None
+        self._streaming: asyncio.Task[None] | None = None
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        if self._streaming is None:
+            self._answer_buffered()
+        elif len(self._buffer) > _MAX_HEAD_BYTES + MAX_BODY_BYTES:
+            # Pipelined requests queue up behind a long stream; stop reading.
+            self._transport.pause_reading()
+
+    def pause_writing(self) -> None:
+        self._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._writable.set()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._writable.set()
+        if self._streaming is not None:
+            self._streaming.cancel()
+
+    def _answer_buffered(self) -> None:
+        transport = self._transport
+        while not transport.is_closing():
+            try:
+                request = _parse_request(self._buffer)
+            except _HttpError as exc:
+                # The rest of the buffer cannot be framed; answer and hang up.
+                self._send_error(exc.status, str(exc), keep_alive=False)
+                return
+            if request is None:
+                return
+            try:
+                response = self._service.handle(request)
+            except _HttpError as exc:
+                self._send_error(exc.status, str(exc), request.keep_alive)
+                continue
+            except ValueError as exc:
+                self._send_error(400, str(exc), request.keep_alive)
+                continue
+            if response.deferred is not None:
+                # Later pipelined requests wait, so replies stay in order.
+                self._streaming = asyncio.get_running_loop().create_task(
+                    self._run_deferred(response.deferred, request)
+                )
+                return
+            if response.chunks is None:
+                self._send(response, request.keep_alive)
+                continue
+            self._streaming = asyncio.get_running_loop().create_task(
+                self._stream(response, request)
+            )
+            return
+
+    def _send(self, response: _Response, keep_alive: bool) -> None:
+        length = f"{len(response.body)}"
+        headers = [*response.headers, ("Content-Length", length)]
+        self._transport.write(_head(200, headers, keep_alive) + response.body)
+        if not keep_alive:
+            self._transport.close()
+
+    def _send_error(self, status: int, message: str, keep_alive: bool) -> None:
+        body = f"{ERROR_PREFIX}{message}\n".encode("utf-8")
+        headers = [("Content-Length", f"{len(body)}")]
+        self._transport.write(_head(status, headers, keep_alive) + body)
+        if not keep_alive:
+            self._transport.close()
+
+    async def _run_deferred(
+        self, deferred: Callable[[], _Response], request: _Request
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(None, deferred)
+        except ValueError as exc:
+            self._send_error(400, str(exc), request.keep_alive)
+        except MemoryError:
+            self._send_error(503, "not enough memory", request.keep_alive)
+        else:
+            if not self._transport.is_closing():
+                self._send(response, request.keep_alive)
+        finally:
+            self._streaming = None
+        self._resume()
+
+    async def _stream(self, response: _Response, request: _Request) -> None:
+        transport = self._transport
+        # Without chunked framing the end of the body is the end of the connection.
+        keep_alive = request.keep_alive and request.chunked
+        headers = list(response.headers)
+        if request.chunked:
+            headers.append(("Transfer-Encoding", "chunked"))
+        try:
+            transport.write(_head(200, headers, keep_alive))
+            for chunk in response.chunks:
+                await self._writable.wait()
+                if transport.is_closing():
+                    return
+                if request.chunked:
+                    transport.writelines((b"%x\r\n" % len(chunk), chunk, b"\r\n"))
+                else:
+                    transport.write(chunk)
+                # Let other connections run between chunks.
+                await asyncio.sleep(0)
+        except Exception as exc:
+            # A half-sent body cannot be finished: hang up instead of hanging.
+            transport.close()
+            asyncio.get_running_loop().call_exception_handler(
+                {"message": "streaming response failed", "exception": exc}
+            )
+            return
+        finally:
+            self._streaming = None
+        if request.chunked:
+            transport.write(b"0\r\n\r\n")
+        if not keep_alive:
+            transport.close()
+            return
+        self._resume()
+
+    def _resume(self) -> None:
+        """Answer requests that queued up behind a stream or deferred reply."""
+        if self._transport.is_closing():
+            return
+        self._transport.resume_reading()
+        self._answer_buffered()
+
+
+async def start_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    service: DocumentService | None = None,
+) -> asyncio.Server:
+    """Warm the buffers and start listening; port 0 picks a free port."""
+    service = service or DocumentService()
+    service.warm()
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(
+        lambda: _HttpProtocol(service), host, port, reuse_address=True
+    )
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    pool_records: int = DEFAULT_POOL_RECORDS,
+) -> None:
+    """Answer HTTP requests on host:port until interrupted."""
+
+    async def run() -> None:
+        server = await start_server(
+            host, port, service=DocumentService(pool_records)
+        )
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
@@ -0,0 +1,122 @@
+"""Split bulk generation across worker processes, one shard file per worker."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from docbr_generator.stream import DEFAULT_TABLE, check_table, write_documents
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_EXTENSIONS = {
+    "lines": "txt",
+    "csv": "csv",
+    "jsonl": "jsonl",
+    "sql": "sql",
+    "copy": "sql",
+}
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def split_count(count: int, shards: int) -> list[int]:
+    """Split count into shards near-equal parts (earlier shards take the remainder)."""
+    if shards < 1:
+        raise ValueError("shards must be >= 1")
+    size, extra = divmod(count, shards)
+    return [size + (1 if index < extra else 0) for index in range(shards)]
+
+
+def shard_path(
+    out_dir: Path, document: str, index: int, shards: int, fmt: str
+) -> Path:
+    return out_dir / f"{document}-{index:04d}-of-{shards:04d}.{_EXTENSIONS[fmt]}"
+
+
+def _write_shard(
+    document: str,
+    count: int,
+    path: Path,
+    fmt: str,
+    seed: np.random.SeedSequence,
+    masked: bool,
+    table: str,
+) -> int:
+    """Worker entry point: write straight to path and return only the byte count."""
+    import numpy as np
+
+    with path.open("wb", buffering=1 << 20) as handle:
+        return write_documents(
+            handle,
+            document,
+            count,
+            fmt=fmt,
+            rng=np.random.default_rng(seed),
+            masked=masked,
+            table=table,
+        )
+
+
+def write_shards(
+    document: str,
+    count: int,
+    out_dir: Path,
+    *,
+    workers: int,
+    fmt: str = "lines",
+    seed: int | None = None,
+    masked: bool = False,
+    table: str = DEFAULT_TABLE,
+) -> list[Path]:
+    """Generate count documents as one shard file per worker process.
+
+    Each worker gets an independent RNG stream spawned from SeedSequence(seed),
+    so a given seed and worker count reproduce the same shard files. Workers
+    write their own files; only byte counts travel back to the parent. SQL and
+    COPY shards are self-contained scripts, so merging just concatenates them.
+    """
+    import numpy as np
+
+    if fmt not in _EXTENSIONS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    check_table(table)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    counts = split_count(count, workers)
+    paths = [shard_path(out_dir, document, i, workers, fmt) for i in range(workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _write_shard,
+                document,
+                shard_count,
+                path,
+                fmt,
+                shard_seed,
+                masked,
+                table,
+            )
+            for shard_count, path, shard_seed in zip(counts, paths, seeds, strict=True)
+        ]
+        for future in futures:
+            future.result()
+    return paths
+
+
+def merge_shards(paths: list[Path], output: Path, *, fmt: str = "lines") -> None:
+    """Concatenate shard files into output, keeping only the first CSV header."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("wb") as merged:
+        for index, path in enumerate(paths):
+            with path.open("rb") as shard:
+                if fmt == "csv" and index > 0:
+                    shard.readline()
+                shutil.copyfileobj(shard, merged, length=1 << 20)
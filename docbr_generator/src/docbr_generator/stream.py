@@ -0,0 +1,161 @@
+"""Stream many generated documents to a binary file in fixed-size chunks.
+
+Every format has fixed-width records, so a chunk is one preallocated byte
+template (quotes, mask punctuation and line endings pre-filled) whose value
+columns are overwritten with ASCII digits and written as a single block.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO
+
+from docbr_generator import cnpj, cpf
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FORMATS = ("lines", "csv", "jsonl", "sql", "copy")
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_TABLE = "documents"
+
+_GENERATORS = {"cpf": cpf.generate_many, "cnpj": cnpj.generate_many}
+_BASE_SPACES = {"cpf": cpf.BASE_SPACE, "cnpj": cnpj.ROOT_SPACE}
+_MASKS = {"cpf": cpf.MASK, "cnpj": cnpj.MASK}
+
+
+@dataclass(frozen=True)
+class _Layout:
+    """Bytes written once per file, once per chunk, and around every value."""
+
+    header: bytes = b""
+    statement: bytes = b""
+    prefix: bytes = b""
+    suffix: bytes = b"\n"
+    # Same width as suffix; replaces it on the last record of each chunk.
+    last_suffix: bytes | None = None
+    footer: bytes = b""
+
+
+def check_table(table: str) -> str:
+    """Reject anything but a plain (optionally schema-qualified) SQL identifier."""
+    if not all(part.isascii() and part.isidentifier() for part in table.split(".")):
+        raise ValueError(f"Invalid SQL table name: {table!r}")
+    return table
+
+
+def _layout(document: str, fmt: str, table: str) -> _Layout:
+    if fmt == "lines":
+        return _Layout()
+    if fmt == "csv":
+        return _Layout(header=f"{document}\n".encode("ascii"))
+    if fmt == "jsonl":
+        return _Layout(prefix=f'{{"{document}": "'.encode("ascii"), suffix=b'"}\n')
+    if fmt == "sql":
+        # One multi-row INSERT per chunk keeps statements bounded for the server.
+        return _Layout(
+            statement=f"INSERT INTO {table} ({document}) VALUES\n".encode("ascii"),
+            prefix=b"('",
+            suffix=b"'),\n",
+            last_suffix=b"');\n",
+        )
+    if fmt == "copy":
+        # COPY ... FROM STDIN text format, loadable with `psql -f`.
+        return _Layout(
+            header=f"COPY {table} ({document}) FROM STDIN;\n".encode("ascii"),
+            footer=b"\\.\n",
+        )
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+def _record_template(rows: int, record: bytes, last_record: bytes) -> np.ndarray:
+    """Preallocate an (rows, record) byte matrix with every row pre-filled."""
+    import numpy as np
+
+    template = np.empty((rows, len(record)), dtype=np.uint8)
+    template[:] = np.frombuffer(record, dtype=np.uint8)
+    template[-1] = np.frombuffer(last_record, dtype=np.uint8)
+    return template
+
+
+def value_spans(pattern: str, offset: int = 0) -> list[tuple[int, int]]:
+    """Column spans of the "0" placeholder runs in pattern, shifted by offset."""
+    return [
+        (offset + match.start(), offset + match.end())
+        for match in re.finditer("0+", pattern)
+    ]
+
+
+def fill_values(
+    template: np.ndarray, digits: np.ndarray, spans: list[tuple[int, int]]
+) -> None:
+    """Write digits (values, not ASCII) into template's spans as ASCII bytes."""
+    import numpy as np
+
+    column = 0
+    for start, stop in spans:
+        source = digits[:, column : column + stop - start]
+        np.add(source, np.uint8(ord("0")), out=template[:, start:stop])
+        column += stop - start
+
+
+def write_documents(
+    handle: BinaryIO,
+    document: str,
+    count: int,
+    *,
+    fmt: str = "lines",
+    rng: np.random.Generator | int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    unique: bool = False,
+    masked: bool = False,
+    table: str = DEFAULT_TABLE,
+) -> int:
+    """Write count documents to handle as one record per line; return bytes written.
+
+    Memory stays bounded by chunk_size regardless of count: each chunk's digits
+    are copied into a preallocated record template and written as one block.
+    unique=True shares one in-memory Bitset across chunks so no value repeats
+    (~125 MB for CPF, ~12.5 MB for CNPJ roots). masked=True writes values as
+    000.000.000-00 / 00.000.000/0000-00. fmt="sql" emits one multi-row INSERT
+    per chunk and fmt="copy" a single COPY block, both into table.
+    """
+    from docbr_generator import _vectorized as vec
+    from docbr_generator.bitset import Bitset
+
+    try:
+        generate_many = _GENERATORS[document]
+    except KeyError:
+        raise ValueError(f"Unsupported document type: {document}") from None
+    if count < 0:
+        raise ValueError("count must be >= 0")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    layout = _layout(document, fmt, check_table(table))
+    pattern = _MASKS[document]
+    if not masked:
+        pattern = "0" * pattern.count("0")
+    # Placeholder "0"s are overwritten; only their column spans matter.
+    record = layout.prefix + pattern.encode("ascii") + layout.suffix
+    last_record = layout.prefix + pattern.encode("ascii")
+    last_record += layout.last_suffix or layout.suffix
+    spans = value_spans(pattern, len(layout.prefix))
+
+    gen = vec.as_generator(rng)
+    seen = Bitset(_BASE_SPACES[document]) if unique else None
+    written = handle.write(layout.header)
+
+    template: np.ndarray | None = None
+    remaining = count
+    while remaining:
+        rows = min(remaining, chunk_size)
+        digits = generate_many(rows, rng=gen, output="array", seen=seen)
+        if template is None or template.shape[0] != rows:
+            template = _record_template(rows, record, last_record)
+        fill_values(template, digits, spans)
+        written += handle.write(layout.statement)
+        written += handle.write(template.tobytes())
+        remaining -= rows
+    return written + handle.write(layout.footer)
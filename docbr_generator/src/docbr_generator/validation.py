@@ -0,0 +1,200 @@
+"""Bulk CPF/CNPJ validation over fixed-width byte matrices (requires numpy)."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from docbr_generator import cnpj, cpf
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_ASCII_ZERO = ord("0")
+# Mask punctuation and blanks dropped by strip_masks=True.
+_MASK_CODES = tuple(map(ord, ".-/ \t"))
+# Blanks allowed around a masked value; anything longer is invalid.
+_MASK_SLACK = 8
+_CHUNK_ROWS = 1 << 20
+_FILE_BLOCK_BYTES = 1 << 24
+
+
+@dataclass(frozen=True)
+class _DocumentSpec:
+    length: int
+    masked_length: int
+    weights_d1: list[int]
+    weights_d2: list[int]
+
+
+_SPECS = {
+    "cpf": _DocumentSpec(
+        cpf._CPF_LENGTH, len(cpf.MASK), cpf._WEIGHTS_D1, cpf._WEIGHTS_D2
+    ),
+    "cnpj": _DocumentSpec(
+        cnpj._CNPJ_LENGTH, len(cnpj.MASK), cnpj._WEIGHTS_D1, cnpj._WEIGHTS_D2
+    ),
+}
+
+
+def validate_many(
+    values: Sequence[str] | Sequence[bytes] | np.ndarray | os.PathLike[str],
+    *,
+    kind: str,
+    alphanumeric: bool = False,
+    strip_masks: bool = False,
+) -> np.ndarray:
+    """Return a boolean mask: True where the value passes is_valid for kind.
+
+    values is a list of str/bytes, a NumPy "U"/"S" array, or a path to a file
+    with one value per line. By default values are compared as raw characters,
+    exactly like cpf.is_valid / cnpj.is_valid; strip_masks=True first drops
+    ".", "-", "/" and blanks, so 529.982.247-25 is accepted (values more than a
+    few characters longer than the mask are rejected). alphanumeric=True
+    (CNPJ only) accepts mixed numeric and alphanumeric columns.
+    """
+    import numpy as np
+
+    spec = _spec_for(kind)
+    if alphanumeric and kind != "cnpj":
+        raise ValueError("alphanumeric validation only applies to CNPJ")
+    if isinstance(values, (str, bytes)):
+        raise TypeError("values must be a sequence, array or path, not a single value")
+
+    masks = [
+        _validate_chunk(chunk, spec, alphanumeric, strip_masks)
+        for chunk in _iter_chunks(values, spec, strip_masks)
+    ]
+    if not masks:
+        return np.zeros(0, dtype=bool)
+    return np.concatenate(masks)
+
+
+def _spec_for(kind: str) -> _DocumentSpec:
+    try:
+        return _SPECS[kind]
+    except KeyError:
+        raise ValueError(f"Unsupported document type: {kind}") from None
+
+
+def _iter_chunks(
+    values: Sequence[str] | Sequence[bytes] | np.ndarray | os.PathLike[str],
+    spec: _DocumentSpec,
+    strip_masks: bool = False,
+) -> Iterator[np.ndarray]:
+    import numpy as np
+
+    # One spare column keeps over-long values detectable after truncation, so
+    # a single huge value cannot widen the whole chunk.
+    width = _max_width(spec, strip_masks) + 1
+    if isinstance(values, os.PathLike):
+        for lines in _iter_file_lines(Path(values)):
+            yield np.array(lines, dtype=f"S{width}")
+        return
+    if isinstance(values, np.ndarray):
+        flat = values.ravel()
+        for start in range(0, flat.size, _CHUNK_ROWS):
+            yield flat[start : start + _CHUNK_ROWS]
+        return
+    for start in range(0, len(values), _CHUNK_ROWS):
+        chunk = values[start : start + _CHUNK_ROWS]
+        kind = "S" if chunk and isinstance(chunk[0], bytes) else "U"
+        yield np.array(chunk, dtype=f"{kind}{width}")
+
+
+def _max_width(spec: _DocumentSpec, strip_masks: bool) -> int:
+    """Longest value that can still be valid."""
+    return spec.masked_length + _MASK_SLACK if strip_masks else spec.length
+
+
+def _iter_file_lines(path: Path) -> Iterator[list[bytes]]:
+    """Yield blocks of lines (without line endings) read in large binary chunks."""
+    with path.open("rb") as handle:
+        pending = b""
+        while block := handle.read(_FILE_BLOCK_BYTES):
+            block = pending + block
+            cut = block.rfind(b"\n") + 1
+            pending = block[cut:]
+            if cut:
+                yield block[:cut].splitlines()
+        if pending:
+            yield pending.splitlines()
+
+
+def _code_matrix(chunk: np.ndarray) -> np.ndarray:
+    """View a "U"/"S" array as an (n, width) matrix of character codes."""
+    import numpy as np
+
+    if chunk.dtype.kind == "U":
+        unit = np.dtype(np.uint32)
+    elif chunk.dtype.kind == "S":
+        unit = np.dtype(np.uint8)
+    else:
+        raise TypeError(f"expected a str or bytes array, got dtype {chunk.dtype}")
+    chunk = np.ascontiguousarray(chunk)
+    width = chunk.dtype.itemsize // unit.itemsize
+    return chunk.view(unit).reshape(chunk.size, width)
+
+
+def _strip_mask_codes(codes: np.ndarray) -> np.ndarray:
+    """Drop mask punctuation and blanks from every row, left-aligning the rest."""
+    import numpy as np
+
+    drop = np.isin(codes, _MASK_CODES)
+    if not drop.any():
+        return codes
+    # A stable sort on the drop flag moves kept characters to the front in order.
+    order = np.argsort(drop, axis=1, kind="stable")
+    stripped = np.take_along_axis(codes, order, axis=1)
+    kept = codes.shape[1] - drop.sum(axis=1)
+    stripped[np.arange(codes.shape[1]) >= kept[:, None]] = 0
+    return stripped
+
+
+def _validate_chunk(
+    chunk: np.ndarray,
+    spec: _DocumentSpec,
+    alphanumeric: bool,
+    strip_masks: bool = False,
+) -> np.ndarray:
+    import numpy as np
+
+    from docbr_generator import _vectorized as vec
+
+    codes = _code_matrix(chunk)
+    too_long = None
+    if strip_masks:
+        # Caller arrays may be wider than any valid value: reject the extra
+        # up front instead of stripping n x width codes.
+        limit = _max_width(spec, strip_masks)
+        if codes.shape[1] > limit:
+            too_long = (codes[:, limit:] != 0).any(axis=1)
+            codes = codes[:, :limit]
+        codes = _strip_mask_codes(codes)
+    length = spec.length
+    base = length - 2
+    if codes.shape[1] < length:
+        return np.zeros(codes.shape[0], dtype=bool)
+
+    if alphanumeric:
+        # One table lookup per byte gives its value; 255 marks anything else.
+        digits = vec.ALPHANUMERIC_LOOKUP[np.minimum(codes[:, :length], 255)]
+        valid = (digits[:, :base] != 255).all(axis=1)
+        valid &= (digits[:, base:] <= 9).all(axis=1)
+    else:
+        # Unsigned subtraction wraps non-digits above 9; one compare checks range.
+        digits = codes[:, :length] - codes.dtype.type(_ASCII_ZERO)
+        valid = (digits <= 9).all(axis=1)
+    if codes.shape[1] > length:
+        valid &= codes[:, length] == 0
+    valid &= ~vec.all_same_digit_rows(digits)
+
+    d1 = vec.mod11_check_digits(digits[:, :base], spec.weights_d1)
+    d2 = vec.mod11_check_digits(digits[:, : base + 1], spec.weights_d2)
+    valid &= (d1 == digits[:, base]) & (d2 == digits[:, base + 1])
+    if too_long is not None:
+        valid &= ~too_long
+    return valid
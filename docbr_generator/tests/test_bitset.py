@@ -0,0 +1,41 @@
+"""Bitset tests (one scenario per test)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from docbr_generator.bitset import Bitset
+
+
+def test_add_then_contains() -> None:
+    bits = Bitset(100)
+    bits.add(np.array([3, 4, 99]))
+    assert bits.contains(np.array([3, 4, 5, 99])).tolist() == [True, True, False, True]
+    assert len(bits) == 3
+
+
+def test_add_sets_every_value_sharing_a_byte() -> None:
+    bits = Bitset(16)
+    bits.add(np.arange(8))
+    assert bits.contains(np.arange(8)).all()
+
+
+def test_file_backed_bits_persist(tmp_path: Path) -> None:
+    path = tmp_path / "seen.bin"
+    bits = Bitset(1000, path)
+    bits.add(np.array([7, 512]))
+    bits.flush()
+    del bits
+    reopened = Bitset(1000, path)
+    assert len(reopened) == 2
+    assert reopened.contains(np.array([7, 8, 512])).tolist() == [True, False, True]
+
+
+def test_file_size_mismatch_raises(tmp_path: Path) -> None:
+    path = tmp_path / "seen.bin"
+    path.write_bytes(b"\x00" * 3)
+    with pytest.raises(ValueError):
+        Bitset(1000, path)
@@ -0,0 +1,37 @@
+"""Table-driven Mod-11 tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import random
+
+from docbr_generator import _checksum, cnpj, cpf
+
+
+def _reference_check_digits(
+    base: str, weights_d1: list[int], weights_d2: list[int]
+) -> str:
+    digits = [int(d) for d in base]
+    r1 = sum(d * w for d, w in zip(digits, weights_d1)) % 11
+    d1 = 0 if r1 < 2 else 11 - r1
+    r2 = sum(d * w for d, w in zip(digits + [d1], weights_d2)) % 11
+    return f"{d1}{0 if r2 < 2 else 11 - r2}"
+
+
+def test_cpf_tables_match_reference_mod11() -> None:
+    rng = random.Random(1)
+    for _ in range(500):
+        base = f"{rng.randrange(10**9):09d}"
+        expected = _reference_check_digits(base, cpf._WEIGHTS_D1, cpf._WEIGHTS_D2)
+        assert cpf.calculate_check_digits(base) == expected
+
+
+def test_cnpj_tables_match_reference_mod11() -> None:
+    rng = random.Random(2)
+    for _ in range(500):
+        base = f"{rng.randrange(10**12):012d}"
+        expected = _reference_check_digits(base, cnpj._WEIGHTS_D1, cnpj._WEIGHTS_D2)
+        assert cnpj.calculate_check_digits(base) == expected
+
+
+def test_is_ascii_digits_rejects_non_ascii_digits() -> None:
+    assert not _checksum.is_ascii_digits("٥٢٩")
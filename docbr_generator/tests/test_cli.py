@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from docbr_generator import _rawconfig, cnpj, cpf
 from docbr_generator.cli import main
 from docbr_generator.config import load_config
+from docbr_generator.fastpath import main as fastpath_main
 
 
 def test_cli_cpf_prints_eleven_digits(capsys) -> None:
@@ -39,8 +43,10 @@ def test_cli_rejects_unknown_document() -> None:
 def test_cli_paste_copies_and_simulates_cmd_v(capsys) -> None:
     completed = MagicMock(returncode=0, stderr=b"")
     with (
-        patch("docbr_generator.cli.subprocess.run", return_value=completed) as run_mock,
-        patch("docbr_generator.cli.time.sleep"),
+        patch(
+            "docbr_generator.clipboard.subprocess.run", return_value=completed
+        ) as run_mock,
+        patch("docbr_generator.clipboard.time.sleep"),
     ):
         exit_code = main(["cpf", "--paste"])
 
@@ -77,3 +83,139 @@ def test_load_config_prefers_local_over_example(tmp_path: Path) -> None:
     )
     config = load_config(local, example_path=example)
     assert config.cli.python_path == "/tmp/local-python"
+
+
+def test_cli_count_streams_newline_delimited_values(tmp_path: Path) -> None:
+    output = tmp_path / "cpfs.txt"
+    exit_code = main(["cpf", "--count", "1000", "--output", str(output)])
+    lines = output.read_text(encoding="ascii").splitlines()
+    assert exit_code == 0
+    assert len(lines) == 1000
+    assert all(cpf.is_valid(line) for line in lines)
+
+
+def test_cli_count_writes_to_stdout(capsysbinary) -> None:
+    exit_code = main(["cnpj", "--count", "3"])
+    captured = capsysbinary.readouterr()
+    assert exit_code == 0
+    assert len(captured.out.splitlines()) == 3
+    assert b"wrote 3 cnpj values" in captured.err
+
+
+def test_cli_csv_format_writes_header(tmp_path: Path) -> None:
+    output = tmp_path / "cnpjs.csv"
+    main(["cnpj", "-n", "5", "-o", str(output), "--format", "csv"])
+    lines = output.read_text(encoding="ascii").splitlines()
+    assert lines[0] == "cnpj"
+    assert len(lines) == 6
+    assert all(cnpj.is_valid(line) for line in lines[1:])
+
+
+def test_cli_jsonl_format_writes_objects(tmp_path: Path) -> None:
+    output = tmp_path / "cpfs.jsonl"
+    main(["cpf", "-n", "4", "-o", str(output), "--format", "jsonl"])
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(records) == 4
+    assert all(cpf.is_valid(record["cpf"]) for record in records)
+
+
+def test_cli_masked_prints_formatted_cpf(capsys) -> None:
+    exit_code = main(["cpf", "--masked", "--no-daemon"])
+    value = capsys.readouterr().out.strip()
+    assert exit_code == 0
+    assert value == cpf.mask(value.replace(".", "").replace("-", ""))
+
+
+def test_cli_honours_config_digits_only_false(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    local = tmp_path / "config.toml"
+    local.write_text("[output]\ndigits_only = false\n", encoding="utf-8")
+    monkeypatch.setattr(_rawconfig, "DEFAULT_CONFIG_PATH", str(local))
+    fastpath_main(["cnpj", "--no-daemon"])
+    main(["cnpj", "-n", "2"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [len(line) for line in lines] == [18, 18, 18]
+    assert lines[0][2] == "." and lines[0][10] == "/"
+
+
+def test_cli_sql_format_writes_insert(tmp_path: Path) -> None:
+    output = tmp_path / "seed.sql"
+    main(["cpf", "-n", "3", "-o", str(output), "--format", "sql", "--table", "app.t"])
+    lines = output.read_text(encoding="ascii").splitlines()
+    assert lines[0] == "INSERT INTO app.t (cpf) VALUES"
+    assert len(lines) == 4
+
+
+def test_cli_seed_makes_bulk_output_reproducible(tmp_path: Path) -> None:
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    main(["cpf", "-n", "100", "--seed", "3", "-o", str(first)])
+    main(["cpf", "-n", "100", "--seed", "3", "-o", str(second)])
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_cli_bulk_rejects_paste() -> None:
+    try:
+        main(["cpf", "--count", "2", "--paste"])
+    except SystemExit as exc:
+        assert exc.code != 0
+    else:
+        raise AssertionError("expected SystemExit for --paste with --count")
+
+
+def test_cli_bulk_subcommand_writes_shards_and_merge(tmp_path: Path, capsys) -> None:
+    merged = tmp_path / "all.txt"
+    exit_code = main(
+        [
+            "bulk",
+            "cnpj",
+            "--count",
+            "500",
+            "--workers",
+            "2",
+            "--output-dir",
+            str(tmp_path / "shards"),
+            "--merge",
+            str(merged),
+            "--seed",
+            "1",
+        ]
+    )
+    lines = merged.read_text(encoding="ascii").splitlines()
+    assert exit_code == 0
+    assert len(list((tmp_path / "shards").iterdir())) == 2
+    assert len(lines) == 500
+    assert all(cnpj.is_valid(line) for line in lines)
+    assert "2 shard(s)" in capsys.readouterr().err
+
+
+def test_load_config_writes_and_reuses_marshal_cache(tmp_path: Path) -> None:
+    local = tmp_path / "config.toml"
+    local.write_text('[cli]\npython_path = "/tmp/first"\n', encoding="utf-8")
+    assert load_config(local).cli.python_path == "/tmp/first"
+    assert (tmp_path / ".config.toml.marshal").is_file()
+    assert load_config(local).cli.python_path == "/tmp/first"
+
+
+def test_load_config_cache_invalidated_by_mtime(tmp_path: Path) -> None:
+    local = tmp_path / "config.toml"
+    local.write_text('[cli]\npython_path = "/tmp/first"\n', encoding="utf-8")
+    load_config(local)
+    local.write_text('[cli]\npython_path = "/tmp/other"\n', encoding="utf-8")
+    stat = local.stat()
+    os.utime(local, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_config(local).cli.python_path == "/tmp/other"
+
+
+def test_cli_validate_subcommand_writes_report(tmp_path: Path, capsys) -> None:
+    source = tmp_path / "suppliers.csv"
+    source.write_text(
+        "name,cnpj\nA,11.222.333/0001-81\nB,11222333000100\n", encoding="utf-8"
+    )
+    report = tmp_path / "invalid.csv"
+    exit_code = main(
+        ["validate", str(source), "-c", "cnpj", "-k", "cnpj", "-o", str(report)]
+    )
+    assert exit_code == 1
+    assert report.read_text(encoding="utf-8") == "row,value\n2,11222333000100\n"
+    assert "checked 2 cnpj values" in capsys.readouterr().err
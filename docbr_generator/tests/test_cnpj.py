@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import random
 
+import pytest
+
 from docbr_generator import cnpj
+from docbr_generator.bitset import Bitset
 
 
 def test_generate_returns_fourteen_digits() -> None:
@@ -37,6 +40,10 @@ def test_is_valid_rejects_wrong_check_digits() -> None:
     assert not cnpj.is_valid("11222333000100")
 
 
+def test_mask_formats_known_cnpj() -> None:
+    assert cnpj.mask("11222333000181") == "11.222.333/0001-81"
+
+
 def test_is_valid_rejects_all_same_digits() -> None:
     assert not cnpj.is_valid("00000000000000")
 
@@ -51,3 +58,95 @@ def test_is_valid_rejects_non_digits() -> None:
 
 def test_calculate_check_digits_for_known_base() -> None:
     assert cnpj.calculate_check_digits("112223330001") == "81"
+
+
+def test_generate_many_returns_valid_cnpjs() -> None:
+    values = cnpj.generate_many(1000, rng=5)
+    assert len(values) == 1000
+    assert all(cnpj.is_valid(value) for value in values)
+
+
+def test_generate_many_defaults_to_branch_0001() -> None:
+    values = cnpj.generate_many(10, rng=6)
+    assert {value[8:12] for value in values} == {"0001"}
+
+
+def test_generate_many_groups_roots_across_branches() -> None:
+    values = cnpj.generate_many(7, branches=range(1, 4), rng=7)
+    expected = ["0001", "0002", "0003"] * 2 + ["0001"]
+    assert [value[8:12] for value in values] == expected
+    assert values[0][:8] == values[1][:8] == values[2][:8]
+    assert all(cnpj.is_valid(value) for value in values)
+
+
+def test_generate_many_is_deterministic_for_seed() -> None:
+    assert cnpj.generate_many(50, rng=8) == cnpj.generate_many(50, rng=8)
+
+
+def test_generate_many_bytes_is_contiguous_fixed_width() -> None:
+    raw = cnpj.generate_many(5, rng=9, output="bytes")
+    assert len(raw) == 5 * 14
+    records = [raw[i : i + 14].decode() for i in range(0, len(raw), 14)]
+    assert records == cnpj.generate_many(5, rng=9)
+
+
+def test_generate_many_array_is_uint8_matrix() -> None:
+    digits = cnpj.generate_many(5, rng=10, output="array")
+    assert digits.shape == (5, 14)
+    assert digits.dtype.name == "uint8"
+
+
+def test_generate_many_rejects_out_of_range_branch() -> None:
+    with pytest.raises(ValueError):
+        cnpj.generate_many(1, branches=0)
+
+
+def test_generate_many_unique_roots_have_no_duplicates() -> None:
+    values = cnpj.generate_many(20_000, branches=range(1, 5), rng=11, unique=True)
+    assert len(set(values)) == 20_000
+    assert len({value[:8] for value in values}) == 5_000
+
+
+def test_generate_many_seen_never_repeats_roots_across_calls() -> None:
+    seen = Bitset(cnpj.ROOT_SPACE)
+    first = cnpj.generate_many(500, rng=12, seen=seen)
+    second = cnpj.generate_many(500, rng=12, seen=seen)
+    assert not {value[:8] for value in first} & {value[:8] for value in second}
+
+
+def test_is_valid_accepts_known_alphanumeric_cnpj() -> None:
+    # Receita Federal example: base 12ABC34501DE → check digits 35
+    assert cnpj.is_valid("12ABC34501DE35", alphanumeric=True)
+
+
+def test_is_valid_rejects_alphanumeric_by_default() -> None:
+    assert not cnpj.is_valid("12ABC34501DE35")
+
+
+def test_is_valid_alphanumeric_rejects_lowercase() -> None:
+    assert not cnpj.is_valid("12abc34501de35", alphanumeric=True)
+
+
+def test_is_valid_alphanumeric_rejects_letter_check_digits() -> None:
+    assert not cnpj.is_valid("12ABC34501DE3A", alphanumeric=True)
+
+
+def test_calculate_check_digits_for_alphanumeric_base() -> None:
+    assert cnpj.calculate_check_digits("12ABC34501DE", alphanumeric=True) == "35"
+
+
+def test_generate_alphanumeric_is_valid() -> None:
+    value = cnpj.generate(random.Random(13), alphanumeric=True)
+    assert len(value) == 14
+    assert cnpj.is_valid(value, alphanumeric=True)
+
+
+def test_generate_many_alphanumeric_is_valid() -> None:
+    values = cnpj.generate_many(1000, rng=14, alphanumeric=True)
+    assert all(cnpj.is_valid(value, alphanumeric=True) for value in values)
+    assert any(not value.isdigit() for value in values)
+
+
+def test_generate_many_alphanumeric_rejects_unique() -> None:
+    with pytest.raises(ValueError):
+        cnpj.generate_many(1, alphanumeric=True, unique=True)
@@ -0,0 +1,85 @@
+"""Arrow / Parquet export tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from docbr_generator import cnpj, cpf  # noqa: E402
+from docbr_generator.cli import main  # noqa: E402
+from docbr_generator.columnar import to_arrow, write_columnar  # noqa: E402
+from docbr_generator.stream import write_documents  # noqa: E402
+
+
+def test_to_arrow_string_column_matches_str_output() -> None:
+    digits = cpf.generate_many(50, rng=1, output="array")
+    array = to_arrow(digits)
+    assert array.type == pa.string()
+    assert array.to_pylist() == cpf.generate_many(50, rng=1)
+
+
+def test_to_arrow_binary_column_is_masked_fixed_width() -> None:
+    array = to_arrow(
+        cnpj.generate_many(5, rng=2, output="array"), masked=True, column_type="binary"
+    )
+    assert array.type == pa.binary(len(cnpj.MASK))
+    assert array.to_pylist() == [
+        cnpj.mask(value).encode() for value in cnpj.generate_many(5, rng=2)
+    ]
+
+
+def test_write_columnar_parquet_matches_text_output(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.parquet"
+    write_columnar(path, "cpf", 1000, rng=3, chunk_size=300, row_group_rows=600)
+    expected = io.BytesIO()
+    write_documents(expected, "cpf", 1000, rng=3, chunk_size=300)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    values = parquet.read().column("cpf").to_pylist()
+    assert values == expected.getvalue().decode().split()
+
+
+def test_write_columnar_arrow_alphanumeric(tmp_path: Path) -> None:
+    path = tmp_path / "cnpj.arrow"
+    write_columnar(path, "cnpj", 100, fmt="arrow", rng=4, alphanumeric=True)
+    values = pa.ipc.open_file(path).read_all().column("cnpj").to_pylist()
+    assert len(values) == 100
+    assert all(cnpj.is_valid(value, alphanumeric=True) for value in values)
+
+
+def test_write_columnar_uses_large_strings_for_huge_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from docbr_generator import columnar
+
+    # Pretend 2 GiB is 1,000 bytes: 100-row batches of 11 characters exceed it.
+    monkeypatch.setattr(columnar, "_INT32_MAX", 1_000)
+    path = tmp_path / "cpf.arrow"
+    write_columnar(path, "cpf", 150, fmt="arrow", rng=5, chunk_size=100)
+    table = pa.ipc.open_file(path).read_all()
+    assert table.schema.field("cpf").type == pa.large_string()
+    assert table.num_rows == 150
+    assert all(cpf.is_valid(value) for value in table.column("cpf").to_pylist())
+
+
+def test_write_columnar_rejects_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_columnar(tmp_path / "x", "cpf", 1, fmt="orc")
+
+
+def test_cli_parquet_requires_output() -> None:
+    with pytest.raises(SystemExit):
+        main(["cpf", "--count", "5", "--format", "parquet"])
+
+
+def test_cli_writes_parquet_file(tmp_path: Path) -> None:
+    path = tmp_path / "out.parquet"
+    assert main(["cnpj", "-n", "20", "--format", "parquet", "-o", str(path)]) == 0
+    values = pq.read_table(path).column("cnpj").to_pylist()
+    assert len(values) == 20
+    assert all(cnpj.is_valid(value) for value in values)
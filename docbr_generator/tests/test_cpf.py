@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import random
 
+import pytest
+
 from docbr_generator import cpf
+from docbr_generator.bitset import Bitset
 
 
 def test_generate_returns_eleven_digits() -> None:
@@ -32,6 +35,10 @@ def test_is_valid_rejects_wrong_check_digits() -> None:
     assert not cpf.is_valid("52998224700")
 
 
+def test_mask_formats_known_cpf() -> None:
+    assert cpf.mask("52998224725") == "529.982.247-25"
+
+
 def test_is_valid_rejects_all_same_digits() -> None:
     assert not cpf.is_valid("11111111111")
 
@@ -46,3 +53,94 @@ def test_is_valid_rejects_non_digits() -> None:
 
 def test_calculate_check_digits_for_known_base() -> None:
     assert cpf.calculate_check_digits("529982247") == "25"
+
+
+def test_generate_many_returns_valid_cpfs() -> None:
+    values = cpf.generate_many(1000, rng=5)
+    assert len(values) == 1000
+    assert all(cpf.is_valid(value) for value in values)
+
+
+def test_generate_many_is_deterministic_for_seed() -> None:
+    assert cpf.generate_many(50, rng=6) == cpf.generate_many(50, rng=6)
+
+
+def test_generate_many_array_matches_strings() -> None:
+    digits = cpf.generate_many(20, rng=7, output="array")
+    assert digits.shape == (20, 11)
+    as_strings = ["".join(str(d) for d in row) for row in digits.tolist()]
+    assert as_strings == cpf.generate_many(20, rng=7)
+
+
+def test_generate_many_zero_returns_empty_list() -> None:
+    assert cpf.generate_many(0, rng=8) == []
+
+
+def test_generate_many_rejects_unknown_output() -> None:
+    with pytest.raises(ValueError):
+        cpf.generate_many(1, output="csv")
+
+
+def test_generate_many_unique_has_no_duplicates() -> None:
+    values = cpf.generate_many(50_000, rng=9, unique=True)
+    assert len(set(values)) == 50_000
+    assert all(cpf.is_valid(value) for value in values)
+
+
+def test_generate_many_seen_never_repeats_across_calls() -> None:
+    seen = Bitset(cpf.BASE_SPACE)
+    first = cpf.generate_many(1000, rng=10, seen=seen)
+    second = cpf.generate_many(1000, rng=10, seen=seen)
+    assert not set(first) & set(second)
+    assert len(seen) == 2000
+
+
+def test_generate_many_rejects_wrongly_sized_seen() -> None:
+    with pytest.raises(ValueError):
+        cpf.generate_many(1, seen=Bitset(100))
+
+
+def test_generate_many_region_weights_fix_the_ninth_digit() -> None:
+    values = cpf.generate_many(500, rng=12, region_weights={"SP": 1.0})
+    assert {value[8] for value in values} == {"8"}
+    assert all(cpf.is_valid(value) for value in values)
+
+
+def test_generate_many_region_weights_follow_the_distribution() -> None:
+    digits = cpf.generate_many(
+        100_000, rng=13, output="array", region_weights={0: 1.0, "RJ": 3.0}
+    )
+    share_rj = (digits[:, 8] == 7).mean()
+    assert set(digits[:, 8].tolist()) == {0, 7}
+    assert 0.74 < share_rj < 0.76
+
+
+def test_generate_many_region_weights_reject_unknown_uf() -> None:
+    with pytest.raises(ValueError):
+        cpf.generate_many(1, rng=1, region_weights={"XX": 1.0})
+
+
+def test_generate_many_region_weights_reject_unique() -> None:
+    with pytest.raises(ValueError):
+        cpf.generate_many(1, rng=1, unique=True, region_weights={8: 1.0})
+
+
+def test_iter_all_yields_valid_distinct_cpfs() -> None:
+    values = list(cpf.iter_all(seed=1, stop=2000))
+    assert len(set(values)) == len(values)
+    assert all(cpf.is_valid(value) for value in values)
+
+
+def test_iter_all_is_deterministic_for_seed() -> None:
+    assert list(cpf.iter_all(seed=2, stop=50)) == list(cpf.iter_all(seed=2, stop=50))
+
+
+def test_iter_all_shards_concatenate_to_the_full_range() -> None:
+    whole = list(cpf.iter_all(seed=3, stop=300))
+    shards = [cpf.iter_all(seed=3, start=lo, stop=lo + 100) for lo in (0, 100, 200)]
+    assert [value for shard in shards for value in shard] == whole
+
+
+def test_iter_all_rejects_stop_past_base_space() -> None:
+    with pytest.raises(ValueError):
+        next(cpf.iter_all(seed=4, stop=cpf.BASE_SPACE + 1))
@@ -0,0 +1,81 @@
+"""CSV column validation tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from docbr_generator import csv_validation
+from docbr_generator.csv_validation import resolve_column, validate_csv
+
+_ROWS = [
+    ("1", "Ana", "529.982.247-25"),
+    ("2", "Bia", "52998224700"),
+    ("3", "Caio, Jr.", "52998224725"),
+    ("4", "Duda", ""),
+    ("5", "Eva", "11111111111"),
+]
+
+
+def _write_csv(path: Path, rows: list[tuple[str, ...]], header: bool = True) -> Path:
+    lines = ["id,name,cpf"] if header else []
+    for row in rows:
+        lines.append(",".join(f'"{field}"' if "," in field else field for field in row))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_validate_csv_reports_invalid_rows_with_values(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path / "in.csv", _ROWS)
+    report = io.StringIO()
+    result = validate_csv(path, report, column="cpf", kind="cpf")
+    assert (result.rows, result.invalid) == (5, 3)
+    assert report.getvalue().splitlines() == [
+        "row,value",
+        "2,52998224700",
+        "4,",
+        "5,11111111111",
+    ]
+
+
+def test_validate_csv_numbers_rows_across_batches(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path / "in.csv", _ROWS * 3)
+    report = io.StringIO()
+    result = validate_csv(path, report, column="cpf", kind="cpf", chunk_rows=2)
+    rows = [line.split(",")[0] for line in report.getvalue().splitlines()[1:]]
+    assert result.rows == 15
+    assert rows == ["2", "4", "5", "7", "9", "10", "12", "14", "15"]
+
+
+def test_validate_csv_without_header_uses_position(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path / "in.csv", _ROWS, header=False)
+    result = validate_csv(path, io.StringIO(), column="3", kind="cpf", header=False)
+    assert (result.rows, result.invalid) == (5, 3)
+
+
+def test_validate_csv_short_rows_are_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "in.csv"
+    path.write_text("id,cpf\n1,52998224725\n2\n", encoding="utf-8")
+    report = io.StringIO()
+    result = validate_csv(path, report, column="cpf", kind="cpf")
+    assert result.invalid == 1
+    assert report.getvalue().splitlines()[1] == "2,"
+
+
+def test_validate_csv_workers_match_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(csv_validation, "_RANGE_BYTES", 64)
+    path = _write_csv(tmp_path / "in.csv", _ROWS * 10)
+    sequential, parallel = io.StringIO(), io.StringIO()
+    first = validate_csv(path, sequential, column="cpf", kind="cpf")
+    second = validate_csv(path, parallel, column="cpf", kind="cpf", workers=2)
+    assert first == second
+    assert sequential.getvalue() == parallel.getvalue()
+
+
+def test_resolve_column_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError):
+        resolve_column(["id", "cpf"], "cnpj")
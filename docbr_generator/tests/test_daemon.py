@@ -0,0 +1,124 @@
+"""Generator daemon + client tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.cli import main
+from docbr_generator.client import SOCKET_ENV_VAR, request_document
+from docbr_generator.daemon import DocumentPool, DocumentServer
+
+
+class _FixedPool(DocumentPool):
+    def take(self, document: str) -> str:
+        if document != "cpf":
+            raise ValueError(f"Unsupported document type: {document}")
+        return "52998224725"
+
+
+def _start(server: DocumentServer) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    return tmp_path / "d.sock"
+
+
+@pytest.fixture
+def running_server(socket_path: Path) -> Iterator[DocumentServer]:
+    server = DocumentServer(socket_path, DocumentPool(pool_size=8))
+    _start(server)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_document_returns_valid_values(
+    running_server: DocumentServer, socket_path: Path
+) -> None:
+    assert cpf.is_valid(request_document("cpf", socket_path) or "")
+    assert cnpj.is_valid(request_document("cnpj", socket_path) or "")
+
+
+def test_pool_refills_past_its_size(
+    running_server: DocumentServer, socket_path: Path
+) -> None:
+    values = [request_document("cpf", socket_path) for _ in range(20)]
+    assert all(cpf.is_valid(value or "") for value in values)
+
+
+def test_request_document_unknown_type_returns_none(
+    running_server: DocumentServer, socket_path: Path
+) -> None:
+    assert request_document("rg", socket_path) is None
+
+
+def test_request_document_without_daemon_returns_none(socket_path: Path) -> None:
+    assert request_document("cpf", socket_path) is None
+
+
+def test_server_replaces_stale_socket_and_cleans_up(socket_path: Path) -> None:
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(socket_path))
+    stale.close()
+    server = DocumentServer(socket_path, DocumentPool(pool_size=1))
+    server.server_close()
+    assert not socket_path.exists()
+
+
+def test_server_leaves_regular_file_at_socket_path(socket_path: Path) -> None:
+    socket_path.write_bytes(b"keep me")
+    with pytest.raises(RuntimeError, match="not a socket"):
+        DocumentServer(socket_path, DocumentPool(pool_size=1))
+    assert socket_path.read_bytes() == b"keep me"
+
+
+def test_cli_paste_uses_running_daemon(
+    socket_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    server = DocumentServer(socket_path, _FixedPool(pool_size=1))
+    _start(server)
+    monkeypatch.setenv(SOCKET_ENV_VAR, str(socket_path))
+    completed = MagicMock(returncode=0, stderr=b"")
+    try:
+        with (
+            patch(
+                "docbr_generator.clipboard.subprocess.run", return_value=completed
+            ) as run_mock,
+            patch("docbr_generator.clipboard.time.sleep"),
+        ):
+            exit_code = main(["cpf", "--paste"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert exit_code == 0
+    assert capsys.readouterr().out.strip() == "52998224725"
+    assert run_mock.call_args_list[0].kwargs["input"] == b"52998224725"
+
+
+def test_cli_no_daemon_generates_locally(
+    socket_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    server = DocumentServer(socket_path, _FixedPool(pool_size=1))
+    _start(server)
+    monkeypatch.setenv(SOCKET_ENV_VAR, str(socket_path))
+    try:
+        values = set()
+        for _ in range(3):
+            main(["cpf", "--no-daemon"])
+            values.add(capsys.readouterr().out.strip())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert values != {"52998224725"}
@@ -0,0 +1,92 @@
+"""Generator stream tests (one scenario per test)."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from docbr_generator import Generator, cnpj, cpf
+
+
+def test_generator_same_seed_same_stream() -> None:
+    first = Generator(seed=5).generate_many("cpf", 100)
+    second = Generator(seed=5).generate_many("cpf", 100)
+    assert first == second
+    assert first != Generator(seed=6).generate_many("cpf", 100)
+
+
+def test_generator_backends_produce_identical_values() -> None:
+    for kind, alphanumeric in (("cpf", False), ("cnpj", False), ("cnpj", True)):
+        fast = Generator(9, backend="numpy")
+        pure = Generator(9, backend="random")
+        assert fast.generate_many(
+            kind, 500, alphanumeric=alphanumeric
+        ) == pure.generate_many(kind, 500, alphanumeric=alphanumeric)
+
+
+def test_generator_values_are_valid() -> None:
+    gen = Generator(seed=1)
+    assert all(cpf.is_valid(value) for value in gen.generate_many("cpf", 1000))
+    assert all(cnpj.is_valid(value) for value in gen.generate_many("cnpj", 1000))
+    assert cnpj.is_valid(gen.generate("cnpj", alphanumeric=True), alphanumeric=True)
+
+
+def test_generator_batch_matches_single_calls() -> None:
+    single = Generator(seed=2, backend="random")
+    batch = Generator(seed=2).generate_many("cnpj", 50)
+    assert batch == [single.generate("cnpj") for _ in range(50)]
+
+
+def test_generator_skip_and_seek_resume_the_stream() -> None:
+    full = Generator(seed=3).generate_many("cpf", 1000)
+    skipped = Generator(seed=3)
+    skipped.skip(600)
+    assert skipped.generate_many("cpf", 400) == full[600:]
+    skipped.seek(10)
+    assert skipped.generate("cpf") == full[10]
+    assert skipped.position == 11
+
+
+def test_generator_array_output_matches_strings() -> None:
+    digits = Generator(seed=4).generate_many("cpf", 20, output="array")
+    strings = Generator(seed=4).generate_many("cpf", 20)
+    assert isinstance(digits, np.ndarray)
+    assert ["".join(map(str, row)) for row in digits] == strings
+
+
+def test_generator_threads_get_disjoint_indices() -> None:
+    shared = Generator(seed=8)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        batches = list(pool.map(lambda _: shared.generate_many("cpf", 250), range(16)))
+    produced = sorted(value for batch in batches for value in batch)
+    assert shared.position == 4000
+    assert produced == sorted(Generator(seed=8).generate_many("cpf", 4000))
+
+
+def test_generator_random_seed_is_recorded_for_replay() -> None:
+    gen = Generator()
+    values = gen.generate_many("cpf", 10)
+    assert Generator(seed=gen.seed).generate_many("cpf", 10) == values
+
+
+def test_generator_random_backend_rejects_array_output() -> None:
+    with pytest.raises(ValueError):
+        Generator(1, backend="random").generate_many("cpf", 1, output="array")
+
+
+def test_generator_rejects_unknown_backend_and_kind() -> None:
+    with pytest.raises(ValueError):
+        Generator(1, backend="mt19937")
+    with pytest.raises(ValueError):
+        Generator(1).generate("rg")
+
+
+def test_generator_numpy_backend_fails_early_without_numpy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    with pytest.raises(ImportError, match="requires numpy"):
+        Generator(1)
+    assert cpf.is_valid(Generator(1, backend="random").generate("cpf"))
@@ -0,0 +1,23 @@
+"""Keyed permutation tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import pytest
+
+from docbr_generator.permutation import KeyedPermutation
+
+
+def test_permutation_is_a_bijection_on_non_square_domain() -> None:
+    permutation = KeyedPermutation(1000, seed=1)
+    assert sorted(permutation(i) for i in range(1000)) == list(range(1000))
+
+
+def test_permutation_depends_on_seed() -> None:
+    first = [KeyedPermutation(1000, seed=1)(i) for i in range(20)]
+    second = [KeyedPermutation(1000, seed=2)(i) for i in range(20)]
+    assert first != second
+
+
+def test_permutation_rejects_index_outside_domain() -> None:
+    with pytest.raises(IndexError):
+        KeyedPermutation(10, seed=1)(10)
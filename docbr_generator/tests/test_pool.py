@@ -0,0 +1,97 @@
+"""Pool file tests (one scenario per test)."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.cli import main
+from docbr_generator.pool import Pool, PoolExhaustedError, build_pool
+
+
+def _take_from(path: Path, n: int) -> list[str]:
+    with Pool(path) as pool:
+        return [pool.take() for _ in range(n)]
+
+
+def test_pool_round_trips_valid_cpfs(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.pool"
+    build_pool(path, "cpf", 100, seed=1)
+    assert path.stat().st_size == 32 + 100 * 5
+    with Pool(path) as pool:
+        values = pool.take_many(100)
+    assert len(set(values)) == 100
+    assert all(cpf.is_valid(value) for value in values)
+
+
+def test_pool_round_trips_valid_cnpjs(tmp_path: Path) -> None:
+    path = tmp_path / "cnpj.pool"
+    build_pool(path, "cnpj", 50, seed=2)
+    with Pool(path) as pool:
+        assert pool.document == "cnpj"
+        assert all(cnpj.is_valid(pool.take()) for _ in range(50))
+
+
+def test_pool_cursor_persists_across_readers(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.pool"
+    build_pool(path, "cpf", 10, seed=3)
+    with Pool(path) as first:
+        taken = first.take_many(4)
+    with Pool(path) as second:
+        assert second.remaining == 6
+        assert not set(taken) & set(second.take_many(6))
+
+
+def test_pool_raises_when_exhausted(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.pool"
+    build_pool(path, "cpf", 2, seed=4)
+    with Pool(path) as pool:
+        pool.take_many(2)
+        with pytest.raises(PoolExhaustedError):
+            pool.take()
+
+
+def test_pool_rejects_non_positive_take_without_moving_cursor(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.pool"
+    build_pool(path, "cpf", 6, seed=6)
+    with Pool(path) as pool:
+        first = pool.take_many(3)
+        for n in (0, -3):
+            with pytest.raises(ValueError):
+                pool.take_many(n)
+        assert pool.remaining == 3
+        assert not set(first) & set(pool.take_many(3))
+
+
+def test_pool_rejects_truncated_file(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.pool"
+    build_pool(path, "cpf", 10, seed=7)
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        Pool(path)
+
+
+def test_pool_processes_take_distinct_values(tmp_path: Path) -> None:
+    path = tmp_path / "cpf.pool"
+    build_pool(path, "cpf", 400, seed=5)
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        batches = list(executor.map(_take_from, [path] * 4, [100] * 4))
+    values = [value for batch in batches for value in batch]
+    assert len(set(values)) == 400
+
+
+def test_pool_rejects_foreign_file(tmp_path: Path) -> None:
+    path = tmp_path / "not.pool"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        Pool(path)
+
+
+def test_cli_pool_subcommand_builds_file(tmp_path: Path) -> None:
+    path = tmp_path / "cli.pool"
+    assert main(["pool", "cnpj", "--count", "20", "--output", str(path)]) == 0
+    with Pool(path) as pool:
+        assert pool.remaining == 20
@@ -0,0 +1,58 @@
+"""Typo repair tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import pytest
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.repair import candidates, repair_many
+
+
+def test_candidates_include_the_swapped_original() -> None:
+    # 52998224725 with its last two digits swapped.
+    suggestions = candidates("52998224752", kind="cpf")
+    assert "52998224725" in suggestions
+    assert all(cpf.is_valid(value) for value in suggestions)
+
+
+def test_candidates_include_the_mistyped_original() -> None:
+    suggestions = candidates("11222393000181", kind="cnpj")
+    assert "11222333000181" in suggestions
+    assert all(cnpj.is_valid(value) for value in suggestions)
+
+
+def test_candidates_list_swaps_before_substitutions() -> None:
+    suggestions = candidates("52998224752", kind="cpf")
+    swaps = [value for value in suggestions if sorted(value) == sorted("52998224752")]
+    assert suggestions[: len(swaps)] == swaps
+
+
+def test_candidates_fix_a_check_digit_typo() -> None:
+    assert "52998224725" in candidates("52998224705", kind="cpf")
+
+
+def test_candidates_ignore_mask_punctuation() -> None:
+    assert "52998224725" in candidates("529.982.247-52", kind="cpf")
+
+
+def test_candidates_of_valid_or_malformed_values_are_empty() -> None:
+    assert candidates("52998224725", kind="cpf") == []
+    assert candidates("5299822472", kind="cpf") == []
+    assert candidates("5299822472X", kind="cpf") == []
+
+
+def test_candidates_alphanumeric_cnpj_tries_letters() -> None:
+    suggestions = candidates("12ABD34501DE35", kind="cnpj", alphanumeric=True)
+    assert "12ABC34501DE35" in suggestions
+    assert all(cnpj.is_valid(value, alphanumeric=True) for value in suggestions)
+
+
+def test_candidates_reject_unknown_kind() -> None:
+    with pytest.raises(ValueError):
+        candidates("52998224752", kind="rg")
+
+
+def test_repair_many_keeps_input_order() -> None:
+    results = repair_many(["52998224725", "52998224752"], kind="cpf")
+    assert results[0] == []
+    assert "52998224725" in results[1]
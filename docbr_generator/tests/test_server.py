@@ -0,0 +1,178 @@
+"""HTTP server tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import io
+import socket
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.server import DocumentService, start_server
+from docbr_generator.stream import write_documents
+
+_UNMASK = str.maketrans("", "", ".-/")
+
+
+@pytest.fixture(scope="module")
+def port() -> Iterator[int]:
+    loop = asyncio.new_event_loop()
+    service = DocumentService(pool_records=64)
+    server = loop.run_until_complete(start_server("127.0.0.1", 0, service=service))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server.sockets[0].getsockname()[1]
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
+
+
+@pytest.fixture
+def conn(port: int) -> Iterator[http.client.HTTPConnection]:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    yield connection
+    connection.close()
+
+
+def _get(conn: http.client.HTTPConnection, path: str) -> http.client.HTTPResponse:
+    conn.request("GET", path)
+    return conn.getresponse()
+
+
+def _status(conn: http.client.HTTPConnection, method: str, path: str) -> int:
+    conn.request(method, path, body=b"" if method == "POST" else None)
+    response = conn.getresponse()
+    response.read()
+    return response.status
+
+
+def test_server_returns_count_valid_cpfs(conn: http.client.HTTPConnection) -> None:
+    response = _get(conn, "/cpf?count=3")
+    values = response.read().decode("ascii").splitlines()
+    assert response.status == 200
+    assert len(values) == 3
+    assert all(cpf.is_valid(value) for value in values)
+
+
+def test_server_masked_cnpjs_past_the_pool_size(
+    conn: http.client.HTTPConnection,
+) -> None:
+    values = _get(conn, "/cnpj?count=150&masked=1").read().decode().splitlines()
+    assert len(values) == 150
+    assert all(len(value) == len(cnpj.MASK) for value in values)
+    assert all(cnpj.is_valid(value.translate(_UNMASK)) for value in values)
+
+
+def test_server_keeps_connection_alive(conn: http.client.HTTPConnection) -> None:
+    first = _get(conn, "/cpf").read()
+    sock = conn.sock
+    second = _get(conn, "/cnpj").read()
+    assert conn.sock is sock
+    assert len(first) == 12 and len(second) == 15
+
+
+def test_server_streams_seeded_output_like_the_cli(
+    conn: http.client.HTTPConnection,
+) -> None:
+    expected = io.BytesIO()
+    write_documents(expected, "cpf", 70_000, rng=7)
+    response = _get(conn, "/cpf?count=70000&seed=7")
+    assert response.getheader("Transfer-Encoding") == "chunked"
+    assert response.read() == expected.getvalue()
+
+
+def test_server_validates_posted_lines(conn: http.client.HTTPConnection) -> None:
+    conn.request(
+        "POST", "/validate?kind=cpf", body=b"529.982.247-25\n52998224726\r\n\n"
+    )
+    response = conn.getresponse()
+    assert response.read() == b"1\n0\n0\n"
+    assert response.getheader("X-Invalid-Count") == "2"
+
+
+def test_server_validates_a_huge_line_in_bounded_memory(
+    conn: http.client.HTTPConnection,
+) -> None:
+    body = b"529.982.247-25\n" * 5000 + b"5" * 100_000 + b"\n"
+    conn.request("POST", "/validate?kind=cpf", body=body)
+    response = conn.getresponse()
+    assert response.read() == b"1\n" * 5000 + b"0\n"
+    assert response.getheader("X-Invalid-Count") == "1"
+
+
+def test_server_rejects_bad_requests_and_stays_usable(
+    conn: http.client.HTTPConnection,
+) -> None:
+    assert _status(conn, "GET", "/rg") == 404
+    assert _status(conn, "GET", "/cpf?count=0") == 400
+    assert _status(conn, "GET", "/cpf?count=abc") == 400
+    assert _status(conn, "POST", "/validate?kind=rg") == 400
+    assert _status(conn, "GET", "/validate") == 405
+    assert _status(conn, "GET", "/cpf") == 200
+
+
+def test_server_answers_pipelined_requests_in_order(port: int) -> None:
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        sock.sendall(
+            b"GET /cpf HTTP/1.1\r\n\r\n"
+            b"GET /cnpj?count=2 HTTP/1.1\r\nConnection: close\r\n\r\n"
+        )
+        reply = b""
+        while chunk := sock.recv(65536):
+            reply += chunk
+    first, second = reply.split(b"HTTP/1.1 200 OK\r\n")[1:]
+    assert cpf.is_valid(first.split(b"\r\n\r\n")[1].decode().strip())
+    head, body = second.split(b"\r\n\r\n")
+    assert b"Connection: close" in head
+    assert [cnpj.is_valid(value) for value in body.decode().split()] == [True, True]
+
+
+def test_server_keeps_serving_while_validation_runs(
+    port: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from docbr_generator import server
+
+    release = threading.Event()
+    validate_lines = server._validate_lines
+
+    def blocked(*args: object) -> object:
+        release.wait(10)
+        return validate_lines(*args)
+
+    monkeypatch.setattr(server, "_validate_lines", blocked)
+    slow = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    fast = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+    try:
+        slow.request("POST", "/validate?kind=cpf", body=b"529.982.247-25\n")
+        assert _status(fast, "GET", "/cpf") == 200
+        release.set()
+        assert slow.getresponse().read() == b"1\n"
+    finally:
+        release.set()
+        slow.close()
+        fast.close()
+
+
+def test_server_hangs_up_when_a_stream_fails(
+    port: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from docbr_generator import server
+
+    def failing(*args: object) -> Iterator[bytes]:
+        yield b"52998224725\n"
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(server, "_render_chunks", failing)
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+        sock.sendall(b"GET /cpf?count=5000&seed=1 HTTP/1.1\r\n\r\n")
+        reply = b""
+        while chunk := sock.recv(65536):
+            reply += chunk
+    assert reply.startswith(b"HTTP/1.1 200 OK")
+    assert not reply.endswith(b"0\r\n\r\n")
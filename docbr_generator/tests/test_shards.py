@@ -0,0 +1,44 @@
+"""Sharded multiprocess generation tests (one scenario per test)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from docbr_generator import cpf
+from docbr_generator.shards import merge_shards, split_count, write_shards
+
+
+def test_split_count_spreads_remainder_over_first_shards() -> None:
+    assert split_count(10, 3) == [4, 3, 3]
+
+
+def test_write_shards_writes_one_valid_file_per_worker(tmp_path: Path) -> None:
+    paths = write_shards("cpf", 1001, tmp_path, workers=2, seed=1)
+    lines = [line for path in paths for line in path.read_text().splitlines()]
+    assert [path.name for path in paths] == [
+        "cpf-0000-of-0002.txt",
+        "cpf-0001-of-0002.txt",
+    ]
+    assert len(lines) == 1001
+    assert all(cpf.is_valid(line) for line in lines)
+
+
+def test_write_shards_is_reproducible_for_seed(tmp_path: Path) -> None:
+    first = write_shards("cnpj", 200, tmp_path / "a", workers=2, seed=2)
+    second = write_shards("cnpj", 200, tmp_path / "b", workers=2, seed=2)
+    assert [p.read_bytes() for p in first] == [p.read_bytes() for p in second]
+
+
+def test_write_shards_streams_differ_between_workers(tmp_path: Path) -> None:
+    paths = write_shards("cpf", 200, tmp_path, workers=2, seed=3)
+    assert paths[0].read_bytes() != paths[1].read_bytes()
+
+
+def test_merge_shards_keeps_a_single_csv_header(tmp_path: Path) -> None:
+    paths = write_shards("cpf", 10, tmp_path, workers=2, fmt="csv", seed=4)
+    merged = tmp_path / "all.csv"
+    merge_shards(paths, merged, fmt="csv")
+    lines = merged.read_text().splitlines()
+    assert lines[0] == "cpf"
+    assert len(lines) == 11
+    assert "cpf" not in lines[1:]
@@ -0,0 +1,77 @@
+"""Startup import-time tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+# Generous so CI noise doesn't flake; the argparse CLI took ~60 ms here.
+_IMPORT_BUDGET_US = 25_000
+_HEAVY_MODULES = {
+    "argparse",
+    "subprocess",
+    "tomllib",
+    "numpy",
+    "typing",
+    "docbr_generator.cli",
+    "docbr_generator.config",
+    "docbr_generator.validation",
+}
+
+
+def _run(tmp_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(_SRC),
+        "DOCBR_GENERATOR_SOCKET": str(tmp_path / "no-daemon.sock"),
+    }
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_config_cache(tmp_path_factory: pytest.TempPathFactory) -> None:
+    # The first run parses config.toml(.example) with tomllib and caches it.
+    _run(tmp_path_factory.mktemp("warm"), "-m", "docbr_generator", "cpf")
+
+
+def _importtime_rows(tmp_path: Path, *args: str) -> list[tuple[str, int]]:
+    """Run the entry point under -X importtime; return (raw name, cumulative µs)."""
+    result = _run(tmp_path, "-X", "importtime", "-m", "docbr_generator", *args)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        rows.append((name, int(cumulative)))
+    return rows
+
+
+def test_fast_path_skips_heavy_modules(tmp_path: Path) -> None:
+    imported = {name.strip() for name, _ in _importtime_rows(tmp_path, "cpf")}
+    assert not _HEAVY_MODULES & imported
+
+
+def test_fast_path_package_imports_within_budget(tmp_path: Path) -> None:
+    # Nested imports are indented and already counted in their parent's total.
+    top_level = [
+        (name.strip(), cumulative)
+        for name, cumulative in _importtime_rows(tmp_path, "cnpj")
+        if not name.startswith("  ")
+    ]
+    package_us = sum(
+        cumulative
+        for name, cumulative in top_level
+        if name == "docbr_generator" or name.startswith("docbr_generator.")
+    )
+    assert package_us < _IMPORT_BUDGET_US, top_level
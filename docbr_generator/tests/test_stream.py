@@ -0,0 +1,73 @@
+"""Bulk stream writer tests (one scenario per test)."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from docbr_generator import cnpj, cpf
+from docbr_generator.stream import write_documents
+
+
+def test_write_documents_spans_partial_last_chunk() -> None:
+    buffer = io.BytesIO()
+    written = write_documents(buffer, "cpf", 25, rng=1, chunk_size=10)
+    lines = buffer.getvalue().decode("ascii").splitlines()
+    assert written == 25 * 12
+    assert len(lines) == 25
+    assert all(cpf.is_valid(line) for line in lines)
+
+
+def test_write_documents_is_deterministic_for_seed() -> None:
+    first, second = io.BytesIO(), io.BytesIO()
+    write_documents(first, "cnpj", 30, rng=2, chunk_size=7)
+    write_documents(second, "cnpj", 30, rng=2, chunk_size=7)
+    assert first.getvalue() == second.getvalue()
+
+
+def test_write_documents_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        write_documents(io.BytesIO(), "cpf", 1, fmt="xml")
+
+
+def test_write_documents_unique_never_repeats_across_chunks() -> None:
+    buffer = io.BytesIO()
+    write_documents(buffer, "cnpj", 5000, rng=3, chunk_size=100, unique=True)
+    lines = buffer.getvalue().splitlines()
+    assert len(set(lines)) == 5000
+
+
+def test_write_documents_masked_matches_single_value_mask() -> None:
+    digits, masked = io.BytesIO(), io.BytesIO()
+    write_documents(digits, "cnpj", 20, rng=4, chunk_size=6)
+    write_documents(masked, "cnpj", 20, rng=4, chunk_size=6, masked=True)
+    expected = [cnpj.mask(line) for line in digits.getvalue().decode().split()]
+    assert masked.getvalue().decode().split() == expected
+
+
+def test_write_documents_sql_emits_one_insert_per_chunk() -> None:
+    buffer = io.BytesIO()
+    write_documents(buffer, "cpf", 5, fmt="sql", rng=5, chunk_size=3, table="t")
+    lines = buffer.getvalue().decode("ascii").splitlines()
+    assert lines[0] == "INSERT INTO t (cpf) VALUES"
+    assert lines[3].endswith("');")
+    assert lines[4] == "INSERT INTO t (cpf) VALUES"
+    assert lines[6].endswith("');")
+    assert all(cpf.is_valid(line[2:13]) for line in lines if line.startswith("('"))
+
+
+def test_write_documents_copy_wraps_rows_in_one_block() -> None:
+    buffer = io.BytesIO()
+    write_documents(buffer, "cpf", 4, fmt="copy", rng=6, chunk_size=3, masked=True)
+    lines = buffer.getvalue().decode("ascii").splitlines()
+    assert lines[0] == "COPY documents (cpf) FROM STDIN;"
+    assert lines[-1] == "\\."
+    digits = [line.replace(".", "").replace("-", "") for line in lines[1:-1]]
+    assert len(digits) == 4
+    assert all(cpf.is_valid(value) for value in digits)
+
+
+def test_write_documents_rejects_unsafe_table_name() -> None:
+    with pytest.raises(ValueError):
+        write_documents(io.BytesIO(), "cpf", 1, fmt="sql", table="t; DROP TABLE x")
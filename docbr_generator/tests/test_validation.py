@@ -0,0 +1,113 @@
+"""Bulk validation tests (one scenario per test)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from docbr_generator import cnpj, cpf, validate_many
+
+_CPF_CASES = [
+    "52998224725",
+    "52998224700",
+    "11111111111",
+    "5299822472",
+    "529982247251",
+    "5299822472a",
+    "",
+    "529.982.247-25",
+]
+_CNPJ_CASES = [
+    "11222333000181",
+    "11222333000100",
+    "00000000000000",
+    "1122233300018",
+    "1122233300018a",
+    "112223330001810",
+]
+
+
+def test_validate_many_cpf_matches_scalar() -> None:
+    mask = validate_many(_CPF_CASES, kind="cpf")
+    assert mask.tolist() == [cpf.is_valid(value) for value in _CPF_CASES]
+
+
+def test_validate_many_cnpj_matches_scalar() -> None:
+    mask = validate_many(_CNPJ_CASES, kind="cnpj")
+    assert mask.tolist() == [cnpj.is_valid(value) for value in _CNPJ_CASES]
+
+
+def test_validate_many_accepts_generated_batch() -> None:
+    values = cpf.generate_many(10_000, rng=1)
+    assert validate_many(values, kind="cpf").all()
+
+
+def test_validate_many_accepts_numpy_bytes_array() -> None:
+    values = np.array([b"52998224725", b"52998224700"])
+    assert validate_many(values, kind="cpf").tolist() == [True, False]
+
+
+def test_validate_many_accepts_numpy_str_array() -> None:
+    values = np.array(["11222333000181", "1122233300018"])
+    assert validate_many(values, kind="cnpj").tolist() == [True, False]
+
+
+def test_validate_many_reads_file_lines(tmp_path: Path) -> None:
+    path = tmp_path / "cpfs.txt"
+    path.write_text("52998224725\r\n11111111111\n\n52998224725", encoding="utf-8")
+    assert validate_many(path, kind="cpf").tolist() == [True, False, False, True]
+
+
+def test_validate_many_empty_input_returns_empty_mask() -> None:
+    assert validate_many([], kind="cpf").shape == (0,)
+
+
+def test_validate_many_rejects_single_string() -> None:
+    with pytest.raises(TypeError):
+        validate_many("52998224725", kind="cpf")
+
+
+def test_validate_many_rejects_unknown_kind() -> None:
+    with pytest.raises(ValueError):
+        validate_many(["52998224725"], kind="rg")
+
+
+def test_validate_many_alphanumeric_matches_scalar_on_mixed_column() -> None:
+    values = [
+        *_CNPJ_CASES,
+        "12ABC34501DE35",
+        "12ABC34501DE36",
+        "12abc34501de35",
+        "12ABC34501DE3A",
+        "12ABÇ34501DE35",
+    ]
+    mask = validate_many(values, kind="cnpj", alphanumeric=True)
+    expected = [cnpj.is_valid(value, alphanumeric=True) for value in values]
+    assert mask.tolist() == expected
+
+
+def test_validate_many_alphanumeric_accepts_generated_batch() -> None:
+    values = np.array(cnpj.generate_many(10_000, rng=2, alphanumeric=True), dtype="S")
+    assert validate_many(values, kind="cnpj", alphanumeric=True).all()
+
+
+def test_validate_many_alphanumeric_rejects_cpf_kind() -> None:
+    with pytest.raises(ValueError):
+        validate_many(["52998224725"], kind="cpf", alphanumeric=True)
+
+
+def test_validate_many_strip_masks_accepts_masked_values() -> None:
+    values = ["529.982.247-25", " 52998224725 ", "529.982.247-2", "529.982.247-255"]
+    mask = validate_many(values, kind="cpf", strip_masks=True)
+    assert mask.tolist() == [True, True, False, False]
+
+
+def test_validate_many_strip_masks_bounds_width_of_long_values() -> None:
+    # One huge cell must neither widen the batch nor validate by truncation.
+    values = ["529.982.247-25"] * 1000 + ["529.982.247-25" + " " * 10 + "x" * 20_000]
+    mask = validate_many(values, kind="cpf", strip_masks=True)
+    assert mask[:-1].all() and not mask[-1]
+    wide = np.array(["529.982.247-25", "529.982.247-25" + " " * 30 + "1"])
+    assert validate_many(wide, kind="cpf", strip_masks=True).tolist() == [True, False]
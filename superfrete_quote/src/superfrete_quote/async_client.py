@@ -0,0 +1,252 @@
+"""asyncio SuperFrete calculator client over a pool of keep-alive connections."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import urllib.parse
+from typing import Any
+
+from superfrete_quote.cache import QuoteCache
+from superfrete_quote.client import (
+    RETRY_STATUSES,
+    QuoteResult,
+    SuperFreteError,
+    parse_calculator_response,
+    request_headers,
+    retry_delay,
+)
+from superfrete_quote.ratelimit import RateLimiter, parse_retry_after
+
+# Status, lower-cased headers, body.
+_Reply = tuple[int, dict[str, str], bytes]
+
+
+class _StaleConnectionError(ConnectionError):
+    """A kept-alive connection closed before any byte of the response."""
+
+
+class _Connection:
+    """One HTTP/1.1 connection; a request is sent only once the last is read."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    async def post(self, head: bytes, body: bytes) -> _Reply:
+        try:
+            self.writer.write(head + body)
+            await self.writer.drain()
+            status_line = await self.reader.readline()
+        except (ConnectionResetError, BrokenPipeError) as exc:
+            raise _StaleConnectionError(str(exc)) from exc
+        if not status_line:
+            raise _StaleConnectionError("connection closed before the response")
+        parts = status_line.decode("latin-1").split(" ", 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            # The server did answer: surface it rather than send the POST again.
+            raise SuperFreteError(f"malformed status line: {status_line!r}")
+        headers: dict[str, str] = {}
+        while line := (await self.reader.readline()).rstrip(b"\r\n"):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked()
+        elif "content-length" in headers:
+            data = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            # No framing: the body ends when the server closes.
+            data = await self.reader.read()
+            self.reusable = False
+        if headers.get("connection", "").lower() == "close":
+            self.reusable = False
+        return int(parts[1]), headers, data
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while size := int((await self.reader.readline()).split(b";")[0], 16):
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+        # Skip trailers up to the blank line.
+        while (await self.reader.readline()).strip():
+            pass
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        self.reusable = False
+        self.writer.close()
+
+
+class AsyncSuperFreteClient:
+    """SuperFrete calculator client reusing up to max_connections connections.
+
+    Requests wait for a free connection, so max_connections also bounds the
+    calls in flight. Retries (429/5xx, network errors, bad JSON) and parsing
+    match SuperFreteClient; use as `async with` or call aclose().
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        token: str,
+        user_agent: str,
+        timeout_s: float = 30.0,
+        max_retries: int = 3,
+        retry_backoff_s: float = 1.0,
+        max_connections: int = 4,
+        limiter: RateLimiter | None = None,
+        cache: QuoteCache | None = None,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        url = urllib.parse.urlsplit(base_url.rstrip("/"))
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"base_url must be an http(s) URL, got {base_url!r}")
+        self._base_url = base_url.rstrip("/")
+        self._host = url.hostname
+        self._port = url.port or (443 if url.scheme == "https" else 80)
+        self._ssl = ssl.create_default_context() if url.scheme == "https" else None
+        netloc = url.netloc.rpartition("@")[2]
+        headers = {"Host": netloc, **request_headers(token, user_agent)}
+        self._head = f"POST {url.path}/calculator HTTP/1.1\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+        self._timeout_s = timeout_s
+        self._max_retries = max_retries
+        self._retry_backoff_s = retry_backoff_s
+        self._limiter = limiter
+        self._cache = cache
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle: list[_Connection] = []
+        self.connections_opened = 0
+
+    async def __aenter__(self) -> AsyncSuperFreteClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        while self._idle:
+            connection = self._idle.pop()
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except OSError:
+                pass
+
+    async def calculate(self, payload: dict[str, Any]) -> list[QuoteResult]:
+        if self._cache is None:
+            return await self._fetch(payload)
+        results = self._cache.get(self._base_url, payload)
+        if results is None:
+            results = await self._fetch(payload)
+            self._cache.put(self._base_url, payload, results)
+        return results
+
+    async def _fetch(self, payload: dict[str, Any]) -> list[QuoteResult]:
+        body = json.dumps(payload).encode("utf-8")
+        head = f"{self._head}Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+
+        last_error: Exception | None = None
+        for attempt in range(self._max_retries):
+            retry = attempt + 1 < self._max_retries
+            try:
+                status, headers, raw = await self._limited_post(head, body)
+            except (OSError, TimeoutError, asyncio.IncompleteReadError) as exc:
+                last_error = exc
+                if retry:
+                    await asyncio.sleep(self._retry_backoff_s * (2**attempt))
+                    continue
+                raise SuperFreteError(str(exc) or type(exc).__name__) from exc
+
+            if status >= 400:
+                if status in RETRY_STATUSES and retry:
+                    retry_after = parse_retry_after(headers.get("retry-after"))
+                    await asyncio.sleep(
+                        retry_delay(
+                            self._retry_backoff_s,
+                            attempt,
+                            retry_after,
+                            limited=self._limiter is not None,
+                        )
+                    )
+                    continue
+                detail = raw.decode("utf-8", errors="replace")
+                raise SuperFreteError(f"HTTP {status} from SuperFrete: {detail}")
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except json.JSONDecodeError as exc:
+                last_error = exc
+                if retry:
+                    await asyncio.sleep(self._retry_backoff_s * (2**attempt))
+                    continue
+                raise SuperFreteError(str(exc)) from exc
+            return parse_calculator_response(data)
+
+        raise SuperFreteError(str(last_error) if last_error else "unknown error")
+
+    async def _limited_post(self, head: bytes, body: bytes) -> _Reply:
+        """_post on a free connection, holding a limiter slot while in flight.
+
+        Only the exchange itself is timed, not the wait for a connection.
+        """
+        limiter = self._limiter
+        ticket = await limiter.acquire_async() if limiter else 0
+        status: int | None = None
+        retry_after: float | None = None
+        try:
+            async with self._slots:
+                status, headers, raw = await asyncio.wait_for(
+                    self._post(head, body), self._timeout_s
+                )
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            return status, headers, raw
+        finally:
+            if limiter:
+                limiter.release(ticket, status, retry_after)
+
+    async def _post(self, head: bytes, body: bytes) -> _Reply:
+        """Send on an idle connection (or a new one); the caller holds a slot."""
+        while self._idle:
+            connection = self._idle.pop()
+            try:
+                result = await connection.post(head, body)
+            except _StaleConnectionError:
+                # The server dropped the idle connection before reading the
+                # request; it is safe to send it on the next one.
+                connection.close()
+                continue
+            except BaseException:
+                connection.close()
+                raise
+            self._release(connection)
+            return result
+
+        connection = await self._connect()
+        try:
+            result = await connection.post(head, body)
+        except BaseException:
+            connection.close()
+            raise
+        self._release(connection)
+        return result
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl
+        )
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    def _release(self, connection: _Connection) -> None:
+        if connection.reusable:
+            self._idle.append(connection)
+        else:
+            connection.close()
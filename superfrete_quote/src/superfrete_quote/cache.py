@@ -0,0 +1,130 @@
+"""SQLite cache of calculator responses, keyed by a hash of the request payload.
+
+Prices for one origin, destination, package and insurance value rarely change
+within a day, so both clients look a payload up here before calling the API.
+Only parsed successful responses are stored. ttl_s only filters reads, so a
+short-TTL run does not throw away entries a later run may reuse; rows older
+than MAX_AGE_S are purged and the oldest are evicted beyond max_entries.
+Database errors (e.g. another run holding the lock) count as a miss or a
+skipped write, never as a failed quote.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from superfrete_quote.client import QuoteResult
+
+DEFAULT_TTL_S = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 50_000
+MAX_AGE_S = 30 * 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    key TEXT PRIMARY KEY,
+    stored_at REAL NOT NULL,
+    results TEXT NOT NULL
+)
+"""
+
+
+def default_cache_path() -> Path:
+    """$XDG_CACHE_HOME/superfrete-quote/quotes.sqlite3 (~/.cache by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "superfrete-quote" / "quotes.sqlite3"
+
+
+def cache_key(base_url: str, payload: dict[str, Any]) -> str:
+    """SHA-256 of the payload as canonical JSON, scoped to the API base URL."""
+    canonical = json.dumps(
+        [base_url.rstrip("/"), payload], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class QuoteCache:
+    """Thread-safe store of QuoteResult lists; counts hits and misses."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be > 0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Shared by the run's worker threads; every use holds self._lock.
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db:
+            self._db.execute(_SCHEMA)
+            self._db.execute(
+                "DELETE FROM quotes WHERE stored_at <= ?", (clock() - MAX_AGE_S,)
+            )
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> QuoteCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def get(self, base_url: str, payload: dict[str, Any]) -> list[QuoteResult] | None:
+        key = cache_key(base_url, payload)
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT results FROM quotes WHERE key = ? AND stored_at > ?",
+                    (key, self._clock() - self._ttl_s),
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return [QuoteResult(**fields) for fields in json.loads(row[0])]
+
+    def put(
+        self, base_url: str, payload: dict[str, Any], results: list[QuoteResult]
+    ) -> None:
+        key = cache_key(base_url, payload)
+        raw = json.dumps([dataclasses.asdict(result) for result in results])
+        with self._lock:
+            try:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO quotes VALUES (?, ?, ?)",
+                        (key, self._clock(), raw),
+                    )
+                    # Keep the newest max_entries rows.
+                    self._db.execute(
+                        "DELETE FROM quotes WHERE key IN (SELECT key FROM quotes "
+                        "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                        (self._max_entries,),
+                    )
+            except sqlite3.Error:
+                pass
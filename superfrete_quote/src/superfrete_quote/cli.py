@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import sqlite3
 import sys
 from pathlib import Path
 
+from superfrete_quote.async_client import AsyncSuperFreteClient
+from superfrete_quote.cache import DEFAULT_TTL_S, QuoteCache, default_cache_path
 from superfrete_quote.client import SuperFreteClient
-from superfrete_quote.config import load_config
+from superfrete_quote.config import AppConfig, load_config
 from superfrete_quote.csv_export import write_quotes_csv
-from superfrete_quote.quote import run_quotes
+from superfrete_quote.quote import QuoteRunResult, run_quotes, run_quotes_async
+from superfrete_quote.ratelimit import AimdLimit, RateLimiter
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -34,11 +39,92 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path("quotes.csv"),
         help="Output CSV path (default: quotes.csv)",
     )
+    parser.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=1,
+        help="Quotes requested in parallel (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the asyncio client: --concurrency keep-alive connections "
+        "instead of one new connection per quote",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="One call per destination for products with the same package "
+        "dimensions, weight and insurance value",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Maximum requests per second across all workers (default: no cap)",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Start below --concurrency and adjust calls in flight: grow while "
+        "requests succeed, halve on 429/503",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL_S,
+        metavar="SECONDS",
+        help="Reuse cached quotes younger than this (default: 86400, one day)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Request every quote; do not read or write {default_cache_path()}",
+    )
     return parser
 
 
+def _build_limiter(args: argparse.Namespace) -> RateLimiter:
+    concurrency = None
+    if args.adaptive:
+        concurrency = AimdLimit(min(4, args.concurrency), maximum=args.concurrency)
+    return RateLimiter(args.rate, concurrency=concurrency)
+
+
+async def _run_async(
+    config: AppConfig,
+    args: argparse.Namespace,
+    limiter: RateLimiter,
+    cache: QuoteCache | None,
+) -> QuoteRunResult:
+    async with AsyncSuperFreteClient(
+        base_url=config.api.base_url,
+        token=config.api.token,
+        user_agent=config.api.user_agent,
+        max_connections=args.concurrency,
+        limiter=limiter,
+        cache=cache,
+    ) as client:
+        return await run_quotes_async(
+            config,
+            client,
+            progress=sys.stderr,
+            concurrency=args.concurrency,
+            batch=args.batch,
+        )
+
+
 def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate must be > 0")
+    if args.cache_ttl <= 0:
+        parser.error("--cache-ttl must be > 0")
     try:
         config = load_config(args.config)
     except (OSError, ValueError, TypeError) as exc:
@@ -53,21 +139,54 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 2
 
-    client = SuperFreteClient(
-        base_url=config.api.base_url,
-        token=config.api.token,
-        user_agent=config.api.user_agent,
-    )
-
     print(
         f"Quoting {len(config.products)} products × "
         f"{len(config.destinations)} destinations "
-        f"(output_currency={config.quote.output_currency})...",
+        f"(output_currency={config.quote.output_currency}, "
+        f"concurrency={args.concurrency})...",
         file=sys.stderr,
     )
-    result = run_quotes(config, client, progress=sys.stderr)
+    limiter = _build_limiter(args)
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = QuoteCache(default_cache_path(), ttl_s=args.cache_ttl)
+        except (OSError, sqlite3.Error) as exc:
+            print(f"cache disabled: {exc}", file=sys.stderr)
+    try:
+        if args.use_async:
+            result = asyncio.run(_run_async(config, args, limiter, cache))
+        else:
+            client = SuperFreteClient(
+                base_url=config.api.base_url,
+                token=config.api.token,
+                user_agent=config.api.user_agent,
+                limiter=limiter,
+                cache=cache,
+            )
+            result = run_quotes(
+                config,
+                client,
+                progress=sys.stderr,
+                concurrency=args.concurrency,
+                batch=args.batch,
+            )
+    finally:
+        if cache is not None:
+            cache.close()
     write_quotes_csv(args.output, result.rows, config.products)
     print(f"Wrote {args.output}", file=sys.stderr)
+    if cache is not None:
+        print(
+            f"Cache: {cache.hits} hit(s), {cache.misses} miss(es) ({cache.path}).",
+            file=sys.stderr,
+        )
+    if limiter.concurrency is not None:
+        print(
+            f"Adaptive concurrency ended at {limiter.concurrency.limit} "
+            f"({limiter.concurrency.throttled} throttled response(s)).",
+            file=sys.stderr,
+        )
 
     if result.failure_count:
         print(
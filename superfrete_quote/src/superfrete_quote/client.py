@@ -7,7 +7,12 @@ import time
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from superfrete_quote.ratelimit import RateLimiter, parse_retry_after
+
+if TYPE_CHECKING:
+    from superfrete_quote.cache import QuoteCache
 
 
 @dataclass(frozen=True)
@@ -29,6 +34,29 @@ class SuperFreteError(Exception):
     """Raised when the SuperFrete API call or response cannot be used."""
 
 
+# Statuses retried with exponential backoff (by both clients).
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_delay(
+    backoff_s: float, attempt: int, retry_after: float | None, *, limited: bool
+) -> float:
+    """Sleep before retrying; a Retry-After header beats exponential backoff."""
+    if retry_after is None:
+        return backoff_s * (2**attempt)
+    # A RateLimiter has already paused every worker for Retry-After.
+    return 0.0 if limited else retry_after
+
+
+def request_headers(token: str, user_agent: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "User-Agent": user_agent,
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+
 class SuperFreteClient:
     def __init__(
         self,
@@ -39,6 +67,8 @@ class SuperFreteClient:
         timeout_s: float = 30.0,
         max_retries: int = 3,
         retry_backoff_s: float = 1.0,
+        limiter: RateLimiter | None = None,
+        cache: QuoteCache | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._token = token
@@ -46,35 +76,46 @@ class SuperFreteClient:
         self._timeout_s = timeout_s
         self._max_retries = max_retries
         self._retry_backoff_s = retry_backoff_s
+        self._limiter = limiter
+        self._cache = cache
 
     def calculate(self, payload: dict[str, Any]) -> list[QuoteResult]:
+        """Quotes for payload, from the cache when it holds a fresh answer."""
+        if self._cache is None:
+            return self._fetch(payload)
+        results = self._cache.get(self._base_url, payload)
+        if results is None:
+            results = self._fetch(payload)
+            self._cache.put(self._base_url, payload, results)
+        return results
+
+    def _fetch(self, payload: dict[str, Any]) -> list[QuoteResult]:
         url = f"{self._base_url}/calculator"
         body = json.dumps(payload).encode("utf-8")
         request = urllib.request.Request(
             url,
             data=body,
             method="POST",
-            headers={
-                "Authorization": f"Bearer {self._token}",
-                "User-Agent": self._user_agent,
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
+            headers=request_headers(self._token, self._user_agent),
         )
 
         last_error: Exception | None = None
         for attempt in range(self._max_retries):
             try:
-                with urllib.request.urlopen(
-                    request, timeout=self._timeout_s
-                ) as response:
-                    raw = response.read().decode("utf-8")
-                    data = json.loads(raw)
+                data = json.loads(self._open(request))
                 return parse_calculator_response(data)
             except urllib.error.HTTPError as exc:
                 last_error = exc
-                if exc.code in {429, 500, 502, 503, 504} and attempt + 1 < self._max_retries:
-                    time.sleep(self._retry_backoff_s * (2**attempt))
+                if exc.code in RETRY_STATUSES and attempt + 1 < self._max_retries:
+                    retry_after = parse_retry_after(exc.headers.get("Retry-After"))
+                    time.sleep(
+                        retry_delay(
+                            self._retry_backoff_s,
+                            attempt,
+                            retry_after,
+                            limited=self._limiter is not None,
+                        )
+                    )
                     continue
                 detail = exc.read().decode("utf-8", errors="replace")
                 raise SuperFreteError(
@@ -89,6 +130,24 @@ class SuperFreteClient:
 
         raise SuperFreteError(str(last_error) if last_error else "unknown error")
 
+    def _open(self, request: urllib.request.Request) -> str:
+        """POST request, holding a limiter slot while it is in flight."""
+        limiter = self._limiter
+        ticket = limiter.acquire() if limiter else 0
+        status: int | None = None
+        retry_after: float | None = None
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout_s) as response:
+                status = response.status
+                return response.read().decode("utf-8")
+        except urllib.error.HTTPError as exc:
+            status = exc.code
+            retry_after = parse_retry_after(exc.headers.get("Retry-After"))
+            raise
+        finally:
+            if limiter:
+                limiter.release(ticket, status, retry_after)
+
 
 def parse_calculator_response(data: Any) -> list[QuoteResult]:
     """Return all usable quotes from a calculator response (one per service)."""
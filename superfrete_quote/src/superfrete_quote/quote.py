@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import TextIO
+from typing import TYPE_CHECKING, Any, TextIO
 
 from superfrete_quote.client import QuoteResult, SuperFreteClient, SuperFreteError
 from superfrete_quote.config import (
@@ -19,6 +22,9 @@ from superfrete_quote.products import (
     resolve_insurance_value_brl,
 )
 
+if TYPE_CHECKING:
+    from superfrete_quote.async_client import AsyncSuperFreteClient
+
 
 @dataclass
 class DestinationRow:
@@ -37,38 +43,120 @@ class QuoteRunResult:
     failure_count: int
 
 
+@dataclass(frozen=True)
+class _Job:
+    """One calculator call, shared by products whose payloads are identical."""
+
+    destination_index: int
+    destination: DestinationConfig
+    products: tuple[ProductConfig, ...]
+
+    @property
+    def label(self) -> str:
+        keys = "+".join(product.key for product in self.products)
+        return f"{self.destination.label} — {keys}"
+
+
 def run_quotes(
     config: AppConfig,
     client: SuperFreteClient,
     *,
     progress: TextIO | None = None,
+    concurrency: int = 1,
+    batch: bool = False,
 ) -> QuoteRunResult:
+    """Quote every destination × product pair and pivot them into CSV rows.
+
+    With concurrency > 1 the calls run on a thread pool of that size; progress
+    lines are written as calls finish (by this thread only), and rows keep the
+    same destination / service order as a sequential run. With batch=True,
+    products that produce the same calculator payload for a destination (same
+    package shape and insurance) share one call.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
     progress = progress or sys.stderr
-    rows: list[DestinationRow] = []
-    failure_count = 0
-    total = len(config.destinations) * len(config.products)
-    done = 0
+    jobs = _jobs(config, batch=batch)
+    if concurrency == 1:
+        outcomes = _quote_sequential(config, client, jobs, progress)
+    else:
+        outcomes = _quote_concurrent(config, client, jobs, progress, concurrency)
+    return _build_run_result(config, jobs, outcomes)
 
-    for destination in config.destinations:
-        # product key → list of quotes OR a call-level error string
-        by_product: dict[str, list[QuoteResult] | str] = {}
 
-        for product in config.products:
-            done += 1
-            progress.write(
-                f"[{done}/{total}] {destination.label} — {product.key}...\n"
-            )
-            progress.flush()
+async def run_quotes_async(
+    config: AppConfig,
+    client: AsyncSuperFreteClient,
+    *,
+    progress: TextIO | None = None,
+    concurrency: int = 4,
+    batch: bool = False,
+) -> QuoteRunResult:
+    """run_quotes over an AsyncSuperFreteClient, up to concurrency calls at once.
+
+    Progress is reported as calls finish; rows come out in sequential order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    progress = progress or sys.stderr
+    jobs = _jobs(config, batch=batch)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def quote(index: int) -> tuple[int, list[QuoteResult] | str]:
+        job = jobs[index]
+        async with slots:
             try:
-                by_product[product.key] = _quote_one(
-                    config, client, destination, product
-                )
+                payload = _build_payload(config, job.destination, job.products[0])
+                return index, await client.calculate(payload)
             except SuperFreteError as exc:
-                error_text = str(exc)
-                by_product[product.key] = error_text
-                progress.write(f"  error: {error_text}\n")
-                progress.flush()
+                return index, str(exc)
+
+    outcomes: list[list[QuoteResult] | str] = [""] * len(jobs)
+    tasks = [asyncio.ensure_future(quote(index)) for index in range(len(jobs))]
+    try:
+        for done, finished in enumerate(asyncio.as_completed(tasks), start=1):
+            index, outcome = await finished
+            outcomes[index] = outcome
+            progress.write(_finished_line(done, jobs, index, outcome))
+            progress.flush()
+    finally:
+        for task in tasks:
+            task.cancel()
+    return _build_run_result(config, jobs, outcomes)
+
+
+def _jobs(config: AppConfig, *, batch: bool) -> list[_Job]:
+    """Calls to make, by destination; one per product unless batching."""
+    jobs: list[_Job] = []
+    for index, destination in enumerate(config.destinations):
+        groups: dict[str, list[ProductConfig]] = {}
+        for product in config.products:
+            key = product.key
+            if batch:
+                payload = _build_payload(config, destination, product)
+                key = json.dumps(payload, sort_keys=True)
+            groups.setdefault(key, []).append(product)
+        jobs.extend(_Job(index, destination, tuple(group)) for group in groups.values())
+    return jobs
+
 
+def _build_run_result(
+    config: AppConfig,
+    jobs: list[_Job],
+    outcomes: list[list[QuoteResult] | str],
+) -> QuoteRunResult:
+    """Fan per-call outcomes out to their products and pivot rows per destination."""
+    # Per destination: product key → list of quotes OR a call-level error string
+    by_destination: list[dict[str, list[QuoteResult] | str]] = [
+        {} for _ in config.destinations
+    ]
+    for job, outcome in zip(jobs, outcomes):
+        for product in job.products:
+            by_destination[job.destination_index][product.key] = outcome
+
+    rows: list[DestinationRow] = []
+    failure_count = 0
+    for destination, by_product in zip(config.destinations, by_destination):
         dest_rows, dest_failures = build_rows_for_destination(
             destination=destination,
             products=config.products,
@@ -81,6 +169,67 @@ def run_quotes(
     return QuoteRunResult(rows=rows, failure_count=failure_count)
 
 
+def _finished_line(
+    done: int,
+    jobs: list[_Job],
+    index: int,
+    outcome: list[QuoteResult] | str,
+) -> str:
+    """Progress for one finished call, written in one piece so lines never mix."""
+    line = f"[{done}/{len(jobs)}] {jobs[index].label}\n"
+    if isinstance(outcome, str):
+        line += f"  error: {outcome}\n"
+    return line
+
+
+def _quote_sequential(
+    config: AppConfig,
+    client: SuperFreteClient,
+    jobs: list[_Job],
+    progress: TextIO,
+) -> list[list[QuoteResult] | str]:
+    outcomes: list[list[QuoteResult] | str] = []
+    for done, job in enumerate(jobs, start=1):
+        progress.write(f"[{done}/{len(jobs)}] {job.label}...\n")
+        progress.flush()
+        try:
+            outcomes.append(_quote_one(config, client, job))
+        except SuperFreteError as exc:
+            outcomes.append(str(exc))
+            progress.write(f"  error: {exc}\n")
+            progress.flush()
+    return outcomes
+
+
+def _quote_concurrent(
+    config: AppConfig,
+    client: SuperFreteClient,
+    jobs: list[_Job],
+    progress: TextIO,
+    concurrency: int,
+) -> list[list[QuoteResult] | str]:
+    """Run _quote_one over a thread pool; outcomes come back in jobs order."""
+    outcomes: list[list[QuoteResult] | str] = [""] * len(jobs)
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {
+            pool.submit(_quote_one, config, client, job): index
+            for index, job in enumerate(jobs)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                outcomes[index] = future.result()
+            except SuperFreteError as exc:
+                outcomes[index] = str(exc)
+            # Written by this thread only, one write per finished call.
+            progress.write(_finished_line(done, jobs, index, outcomes[index]))
+            progress.flush()
+    finally:
+        pool.shutdown(cancel_futures=True)
+    return outcomes
+
+
 def build_rows_for_destination(
     *,
     destination: DestinationConfig,
@@ -143,13 +292,18 @@ def build_rows_for_destination(
 
 
 def _quote_one(
+    config: AppConfig, client: SuperFreteClient, job: _Job
+) -> list[QuoteResult]:
+    return client.calculate(_build_payload(config, job.destination, job.products[0]))
+
+
+def _build_payload(
     config: AppConfig,
-    client: SuperFreteClient,
     destination: DestinationConfig,
     product: ProductConfig,
-) -> list[QuoteResult]:
+) -> dict[str, Any]:
     insurance = resolve_insurance_value_brl(product, config.quote)
-    payload = build_calculator_payload(
+    return build_calculator_payload(
         from_postal_code=config.quote.from_postal_code,
         to_postal_code=destination.postal_code,
         services=config.quote.services,
@@ -157,7 +311,6 @@ def _quote_one(
         insurance_value_brl=insurance,
         use_insurance_value=config.quote.use_insurance_value,
     )
-    return client.calculate(payload)
 
 
 def _parse_requested_service_ids(services: str) -> list[str]:
@@ -0,0 +1,195 @@
+"""Client-side request pacing shared by every worker of a quote run.
+
+TokenBucket caps the request rate and can be paused for a server's
+Retry-After; AimdLimit caps calls in flight, adding one slot per `limit`
+successful responses and halving on 429/503 (once per window of overlapping
+calls), so concurrency settles just under the level the API tolerates.
+RateLimiter combines both for SuperFreteClient and AsyncSuperFreteClient.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import math
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+# Responses that mean "slow down" to the adaptive limit.
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(
+    value: str | None, *, now: datetime | None = None
+) -> float | None:
+    """Seconds to wait from a Retry-After header (delay or HTTP-date), else None."""
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers sleep for the delay reserve() returns.
+
+    rate_per_s=None means no rate cap: only pause() delays requests.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float | None,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_s is not None and rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self._rate = rate_per_s
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        # Refill time; in the future while paused.
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token now; return how long to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            if self._rate is None:
+                return max(0.0, self._last - now)
+            if now > self._last:
+                refill = (now - self._last) * self._rate
+                self._tokens = min(self._burst, self._tokens + refill)
+                self._last = now
+            self._tokens -= 1
+            return self._last - now + max(0.0, -self._tokens) / self._rate
+
+    def pause(self, seconds: float) -> None:
+        """Grant no token for seconds (Retry-After); one request may go then."""
+        with self._lock:
+            self._last = max(self._last, self._clock() + seconds)
+            self._tokens = min(self._tokens, 1.0)
+
+
+class AimdLimit:
+    """Additive-increase / multiplicative-decrease cap on calls in flight.
+
+    acquire() (threads) or acquire_async() (one event loop) waits for a free
+    slot and returns a ticket for release(). Only a throttled call acquired
+    after the latest decrease shrinks the limit again, so a burst of 429s from
+    calls that were already in flight counts as one signal.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease: float = 0.5,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("need 1 <= minimum <= initial <= maximum")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._decrease = decrease
+        self._in_flight = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._waiters: list[asyncio.Future[None]] = []
+        self.throttled = 0
+
+    @property
+    def limit(self) -> int:
+        return math.floor(self._limit)
+
+    def acquire(self) -> int:
+        with self._changed:
+            while self._in_flight >= self.limit:
+                self._changed.wait()
+            self._in_flight += 1
+            return self._generation
+
+    async def acquire_async(self) -> int:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return self._generation
+                waiter = loop.create_future()
+                self._waiters.append(waiter)
+            await waiter
+
+    def release(self, ticket: int, status: int | None) -> None:
+        """Return a slot; status None (network error) leaves the limit as is."""
+        with self._changed:
+            self._in_flight -= 1
+            if status in OVERLOAD_STATUSES:
+                self.throttled += 1
+                if ticket == self._generation:
+                    self._limit = max(self._minimum, self._limit * self._decrease)
+                    self._generation += 1
+            elif status is not None:
+                self._limit = min(self._maximum, self._limit + 1 / self._limit)
+            self._changed.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """One TokenBucket plus an optional AimdLimit, shared by all workers."""
+
+    def __init__(
+        self,
+        rate_per_s: float | None = None,
+        *,
+        burst: int = 1,
+        concurrency: AimdLimit | None = None,
+    ) -> None:
+        self.bucket = TokenBucket(rate_per_s, burst=burst)
+        self.concurrency = concurrency
+
+    def acquire(self) -> int:
+        """Block until a call may start; pass the result to release()."""
+        ticket = self.concurrency.acquire() if self.concurrency else 0
+        time.sleep(self.bucket.reserve())
+        return ticket
+
+    async def acquire_async(self) -> int:
+        ticket = await self.concurrency.acquire_async() if self.concurrency else 0
+        await asyncio.sleep(self.bucket.reserve())
+        return ticket
+
+    def release(
+        self, ticket: int, status: int | None, retry_after: float | None = None
+    ) -> None:
+        """Record a finished call; Retry-After pauses every worker."""
+        if retry_after is not None:
+            self.bucket.pause(retry_after)
+        if self.concurrency is not None:
+            self.concurrency.release(ticket, status)
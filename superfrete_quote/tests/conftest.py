@@ -0,0 +1,90 @@
+"""Shared fixtures: a local keep-alive stub of the SuperFrete calculator."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Prices by destination CEP; a few CEPs script failures."""
+
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.loads(body)
+        cep = payload["to"]["postal_code"]
+        with self.server.lock:
+            self.server.requests.append((self.path, self.client_address, cep))
+            attempts = sum(1 for *_, seen in self.server.requests if seen == cep)
+        if self.headers["Authorization"] != "Bearer secret":
+            self._reply(401, {"message": "bad token"})
+        elif cep == "42900000" and attempts == 1:
+            self._reply(429, {"message": "slow down"})
+        elif cep == "40000000":
+            self._reply(400, {"message": "invalid CEP"})
+        elif cep == "50000000":
+            self._reply(503, {"message": "down"})
+        elif cep == "88000000":
+            self.wfile.write(b"garbage\r\n\r\n")
+            self.close_connection = True
+        else:
+            if cep == "77000000":
+                time.sleep(0.1)
+            quote = {
+                "id": 31,
+                "name": "Express",
+                "price": int(cep[:2]) + payload["package"]["weight"],
+                "delivery_time": 2,
+                "company": {"name": "Loggi"},
+            }
+            self._reply(200, [quote], close=cep == "99000000")
+
+    def _reply(self, status: int, data: object, *, close: bool = False) -> None:
+        raw = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, tuple[str, int], str]] = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api/v0"
+
+    def connections(self) -> int:
+        return len({address for _, address, _ in self.requests})
+
+
+@pytest.fixture
+def stub() -> Iterator[StubServer]:
+    server = StubServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,139 @@
+"""Async client tests against a local keep-alive stub of the calculator."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+
+import pytest
+
+from superfrete_quote.async_client import AsyncSuperFreteClient
+from superfrete_quote.client import SuperFreteClient, SuperFreteError
+from superfrete_quote.config import ApiConfig, AppConfig, DestinationConfig
+from superfrete_quote.quote import run_quotes, run_quotes_async
+
+from tests.conftest import StubServer
+from tests.test_quote import PRODUCTS, QUOTE_CFG
+
+
+def _client(stub: StubServer, **kwargs: object) -> AsyncSuperFreteClient:
+    options = {"token": "secret", "user_agent": "test", "retry_backoff_s": 0.0}
+    return AsyncSuperFreteClient(base_url=stub.base_url, **{**options, **kwargs})
+
+
+def _payload(cep: str) -> dict[str, object]:
+    return {"to": {"postal_code": cep}, "package": {"weight": 1.0}}
+
+
+def test_async_client_reuses_one_connection(stub: StubServer) -> None:
+    async def run() -> list[float]:
+        async with _client(stub, max_connections=1) as client:
+            quotes = [await client.calculate(_payload("01001000")) for _ in range(5)]
+        return [result[0].price for result in quotes]
+
+    assert asyncio.run(run()) == [2.0] * 5
+    assert stub.connections() == 1
+    assert {path for path, *_ in stub.requests} == {"/api/v0/calculator"}
+
+
+def test_async_client_bounds_connections(stub: StubServer) -> None:
+    async def run() -> int:
+        async with _client(stub, max_connections=3) as client:
+            ceps = [f"{index:02d}000000" for index in range(1, 31)]
+            await asyncio.gather(*(client.calculate(_payload(cep)) for cep in ceps))
+            return client.connections_opened
+
+    assert asyncio.run(run()) <= 3
+    assert len(stub.requests) == 30
+    assert stub.connections() <= 3
+
+
+def test_async_client_retries_429(stub: StubServer) -> None:
+    async def run() -> float:
+        async with _client(stub) as client:
+            return (await client.calculate(_payload("42900000")))[0].price
+
+    assert asyncio.run(run()) == 43.0
+    assert len(stub.requests) == 2
+
+
+def test_async_client_raises_on_client_error_without_retry(
+    stub: StubServer,
+) -> None:
+    async def run() -> None:
+        async with _client(stub) as client:
+            await client.calculate(_payload("40000000"))
+
+    with pytest.raises(SuperFreteError, match="HTTP 400 from SuperFrete"):
+        asyncio.run(run())
+    assert len(stub.requests) == 1
+
+
+def test_async_client_gives_up_after_max_retries(stub: StubServer) -> None:
+    async def run() -> None:
+        async with _client(stub, max_retries=3) as client:
+            await client.calculate(_payload("50000000"))
+
+    with pytest.raises(SuperFreteError, match="HTTP 503"):
+        asyncio.run(run())
+    assert len(stub.requests) == 3
+
+
+def test_async_client_surfaces_malformed_response_without_resending(
+    stub: StubServer,
+) -> None:
+    async def run() -> None:
+        async with _client(stub) as client:
+            await client.calculate(_payload("88000000"))
+
+    with pytest.raises(SuperFreteError, match="malformed status line"):
+        asyncio.run(run())
+    assert len(stub.requests) == 1
+
+
+def test_async_client_timeout_excludes_wait_for_a_connection(
+    stub: StubServer,
+) -> None:
+    async def run() -> list[list[object]]:
+        async with _client(stub, max_connections=1, timeout_s=0.25) as client:
+            calls = [client.calculate(_payload("77000000")) for _ in range(6)]
+            return await asyncio.gather(*calls)
+
+    assert len(asyncio.run(run())) == 6
+    assert len(stub.requests) == 6
+
+
+def test_async_client_reconnects_after_server_closes(stub: StubServer) -> None:
+    async def run() -> int:
+        async with _client(stub, max_connections=1) as client:
+            for cep in ("99000000", "01001000", "99000000", "01001000"):
+                await client.calculate(_payload(cep))
+            return client.connections_opened
+
+    assert asyncio.run(run()) == 3
+
+
+def test_run_quotes_async_matches_sync_client(stub: StubServer) -> None:
+    config = AppConfig(
+        api=ApiConfig(base_url=stub.base_url, token="secret", user_agent="test"),
+        quote=QUOTE_CFG,
+        products=PRODUCTS,
+        destinations=tuple(
+            DestinationConfig(uf="SP", name=f"City {cep}", postal_code=cep)
+            for cep in ("01001000", "40000000", "20040020", "69900970")
+        ),
+    )
+    sync_client = SuperFreteClient(
+        base_url=stub.base_url, token="secret", user_agent="test"
+    )
+    expected = run_quotes(config, sync_client, progress=io.StringIO())
+
+    async def run() -> object:
+        async with _client(stub, max_connections=2) as client:
+            return await run_quotes_async(
+                config, client, progress=io.StringIO(), concurrency=2
+            )
+
+    result = asyncio.run(run())
+    assert result == expected
+    assert result.failure_count == 2
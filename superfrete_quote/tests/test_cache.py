@@ -0,0 +1,138 @@
+"""SQLite quote cache."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+
+from superfrete_quote.async_client import AsyncSuperFreteClient
+from superfrete_quote.cache import QuoteCache, cache_key
+from superfrete_quote.client import QuoteResult, SuperFreteClient
+from superfrete_quote.config import ApiConfig, AppConfig, DestinationConfig
+from superfrete_quote.quote import run_quotes
+
+from tests.conftest import StubServer
+from tests.test_quote import PRODUCTS, QUOTE_CFG
+
+URL = "https://api.example/api/v0"
+PAYLOAD = {"to": {"postal_code": "01001000"}, "package": {"weight": 1.0}}
+RESULTS = [
+    QuoteResult(price=10.5, carrier_service="Correios / PAC", transit_days=None),
+    QuoteResult(price=20.0, carrier_service="Loggi", transit_days=2, service_id=31),
+]
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_ignores_key_order_but_not_values() -> None:
+    reordered = {"package": {"weight": 1.0}, "to": {"postal_code": "01001000"}}
+    assert cache_key(URL, PAYLOAD) == cache_key(URL + "/", reordered)
+    assert cache_key(URL, PAYLOAD) != cache_key("https://sandbox.example", PAYLOAD)
+    other = {**PAYLOAD, "package": {"weight": 2.0}}
+    assert cache_key(URL, PAYLOAD) != cache_key(URL, other)
+
+
+def test_cache_round_trips_and_persists(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "quotes.sqlite3"
+    with QuoteCache(path) as cache:
+        assert cache.get(URL, PAYLOAD) is None
+        cache.put(URL, PAYLOAD, RESULTS)
+    with QuoteCache(path) as cache:
+        assert cache.get(URL, PAYLOAD) == RESULTS
+        assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_expires_entries(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    with QuoteCache(tmp_path / "q.db", ttl_s=60, clock=clock) as cache:
+        cache.put(URL, PAYLOAD, RESULTS)
+        clock.now += 59
+        assert cache.get(URL, PAYLOAD) == RESULTS
+        clock.now += 1
+        assert cache.get(URL, PAYLOAD) is None
+
+
+def test_short_ttl_run_keeps_entries_for_longer_ttl_runs(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    with QuoteCache(tmp_path / "q.db", clock=clock) as cache:
+        cache.put(URL, PAYLOAD, RESULTS)
+    clock.now += 120
+    with QuoteCache(tmp_path / "q.db", ttl_s=60, clock=clock) as cache:
+        assert cache.get(URL, PAYLOAD) is None
+    with QuoteCache(tmp_path / "q.db", clock=clock) as cache:
+        assert cache.get(URL, PAYLOAD) == RESULTS
+
+
+def test_cache_database_errors_are_misses(tmp_path: Path) -> None:
+    cache = QuoteCache(tmp_path / "q.db")
+    cache.close()
+    cache.put(URL, PAYLOAD, RESULTS)
+    assert cache.get(URL, PAYLOAD) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_cache_evicts_oldest_beyond_max_entries(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    payloads = [{"to": {"postal_code": f"{n:08d}"}} for n in range(4)]
+    with QuoteCache(tmp_path / "q.db", max_entries=3, clock=clock) as cache:
+        for payload in payloads:
+            cache.put(URL, payload, RESULTS)
+            clock.now += 1
+        assert cache.get(URL, payloads[0]) is None
+        assert all(cache.get(URL, p) == RESULTS for p in payloads[1:])
+
+
+def test_run_quotes_second_run_hits_cache(tmp_path: Path, stub: StubServer) -> None:
+    config = AppConfig(
+        api=ApiConfig(base_url=stub.base_url, token="secret", user_agent="test"),
+        quote=QUOTE_CFG,
+        products=PRODUCTS[:1],
+        destinations=tuple(
+            DestinationConfig(uf="SP", name=f"City {cep}", postal_code=cep)
+            for cep in ("01001000", "40000000", "20040020")
+        ),
+    )
+    with QuoteCache(tmp_path / "q.db") as cache:
+        client = SuperFreteClient(
+            base_url=stub.base_url, token="secret", user_agent="test", cache=cache
+        )
+        first = run_quotes(config, client, progress=io.StringIO())
+        second = run_quotes(config, client, progress=io.StringIO())
+
+    assert second == first
+    # The failed (HTTP 400) quote is not cached, so only it is requested again.
+    assert [cep for *_, cep in stub.requests] == [
+        "01001000",
+        "40000000",
+        "20040020",
+        "40000000",
+    ]
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_async_client_reads_and_fills_cache(tmp_path: Path, stub: StubServer) -> None:
+    async def run(cache: QuoteCache) -> list[list[QuoteResult]]:
+        async with AsyncSuperFreteClient(
+            base_url=stub.base_url, token="secret", user_agent="test", cache=cache
+        ) as client:
+            return [await client.calculate(PAYLOAD) for _ in range(3)]
+
+    with QuoteCache(tmp_path / "q.db") as cache:
+        quotes = asyncio.run(run(cache))
+    assert quotes[0] == quotes[1] == quotes[2]
+    assert len(stub.requests) == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_rejects_bad_limits(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="ttl_s"):
+        QuoteCache(tmp_path / "q.db", ttl_s=0)
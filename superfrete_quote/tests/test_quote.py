@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import io
+import threading
+import time
+from dataclasses import replace
+from typing import Any
+
 import pytest
 
-from superfrete_quote.client import QuoteResult
-from superfrete_quote.config import DestinationConfig, ProductConfig, QuoteConfig
+from superfrete_quote.client import QuoteResult, SuperFreteError
+from superfrete_quote.config import (
+    ApiConfig,
+    AppConfig,
+    DestinationConfig,
+    ProductConfig,
+    QuoteConfig,
+)
 from superfrete_quote.quote import (
     _ordered_service_keys,
     _pick_meta_quote,
     build_rows_for_destination,
+    run_quotes,
 )
 
 
@@ -160,3 +173,92 @@ def test_build_rows_writes_error_when_service_missing_for_product() -> None:
     assert failures >= 1
     pac_row = next(r for r in rows if r.service_key == "1")
     assert pac_row.prices_by_key["managed"] == "no quote for service 1"
+
+
+DESTINATIONS = tuple(
+    DestinationConfig(uf=uf, name=uf, postal_code=f"{index:05d}000")
+    for index, uf in enumerate(("AC", "AL", "AP", "AM", "BA", "CE"), start=1)
+)
+
+APP_CFG = AppConfig(
+    api=ApiConfig(base_url="http://test", token="t", user_agent="test"),
+    quote=QUOTE_CFG,
+    products=PRODUCTS,
+    destinations=DESTINATIONS,
+)
+
+
+class _FakeClient:
+    """Prices by postal code; earlier destinations answer slowest."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def calculate(self, payload: dict[str, Any]) -> list[QuoteResult]:
+        postal_code = payload["to"]["postal_code"]
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02 / int(postal_code[:5]))
+        with self._lock:
+            self.in_flight -= 1
+        if postal_code.startswith("00003"):
+            raise SuperFreteError("HTTP 500 from SuperFrete: boom")
+        return [
+            QuoteResult(
+                price=float(postal_code[:5]),
+                carrier_service="Loggi / Express",
+                transit_days=2,
+                service_id=31,
+            )
+        ]
+
+
+def test_run_quotes_concurrent_matches_sequential_rows() -> None:
+    sequential = run_quotes(APP_CFG, _FakeClient(), progress=io.StringIO())
+    client = _FakeClient()
+    concurrent = run_quotes(APP_CFG, client, progress=io.StringIO(), concurrency=4)
+    assert client.max_in_flight > 1
+    assert concurrent.rows == sequential.rows
+    assert concurrent.failure_count == sequential.failure_count == 2
+    ufs = [row.destination.uf for row in concurrent.rows]
+    assert ufs == ["AC", "AL", "AP", "AM", "BA", "CE"]
+
+
+def test_run_quotes_concurrent_progress_counts_every_call() -> None:
+    progress = io.StringIO()
+    run_quotes(APP_CFG, _FakeClient(), progress=progress, concurrency=3)
+    lines = progress.getvalue().splitlines()
+    counters = [line.split("]")[0] for line in lines if line.startswith("[")]
+    assert counters == [f"[{done}/12" for done in range(1, 13)]
+    errors = [line for line in lines if line.startswith("  error:")]
+    assert len(errors) == 2
+
+
+def test_run_quotes_rejects_zero_concurrency() -> None:
+    with pytest.raises(ValueError):
+        run_quotes(APP_CFG, _FakeClient(), progress=io.StringIO(), concurrency=0)
+
+
+def test_run_quotes_batch_shares_calls_between_identical_packages() -> None:
+    heavy = ProductConfig(
+        key="heavy",
+        label="Heavy",
+        length_cm=1,
+        width_cm=1,
+        height_cm=1,
+        weight_kg=9,
+        insurance_value_brl=100,
+    )
+    config = replace(APP_CFG, products=(*PRODUCTS, heavy))
+    expected = run_quotes(config, _FakeClient(), progress=io.StringIO())
+    client = _FakeClient()
+    progress = io.StringIO()
+    batched = run_quotes(config, client, progress=progress, batch=True)
+    assert client.calls == 2 * len(config.destinations)
+    assert batched == expected
+    assert "[1/12] AC (AC) — managed+light..." in progress.getvalue()
@@ -0,0 +1,171 @@
+"""Rate limiter and adaptive concurrency tests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from superfrete_quote import client as client_module
+from superfrete_quote.client import SuperFreteClient
+from superfrete_quote.ratelimit import (
+    AimdLimit,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_spends_burst_then_spaces_requests() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(10.0, burst=2, clock=clock)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    clock.now += 1.0
+    assert bucket.reserve() == pytest.approx(0.0)
+
+
+def test_token_bucket_pause_delays_every_caller() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(None, clock=clock)
+    assert bucket.reserve() == 0.0
+    bucket.pause(3.0)
+    assert [bucket.reserve(), bucket.reserve()] == [3.0, 3.0]
+    clock.now += 3.0
+    assert bucket.reserve() == 0.0
+
+
+def test_parse_retry_after() -> None:
+    now = datetime(2024, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 01 May 2024 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("Wed, 01 May 2024 11:00:00 GMT", now=now) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_aimd_grows_on_success_and_halves_once_per_window() -> None:
+    limit = AimdLimit(4, maximum=8)
+    for _ in range(5):
+        limit.release(limit.acquire(), 200)
+    assert limit.limit == 5
+
+    tickets = [limit.acquire() for _ in range(4)]
+    for ticket in tickets:
+        limit.release(ticket, 429)
+    assert limit.limit == 2
+    assert limit.throttled == 4
+
+    limit.release(limit.acquire(), 503)
+    assert limit.limit == 1
+    limit.release(limit.acquire(), None)
+    assert limit.limit == 1
+
+
+def test_aimd_bounds_threads_in_flight() -> None:
+    limit = AimdLimit(3, maximum=3)
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def work() -> None:
+        nonlocal in_flight, peak
+        ticket = limit.acquire()
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        limit.release(ticket, 200)
+
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 3
+
+
+def test_aimd_bounds_tasks_in_flight() -> None:
+    limiter = RateLimiter(concurrency=AimdLimit(2, maximum=2))
+    in_flight = peak = 0
+
+    async def work() -> None:
+        nonlocal in_flight, peak
+        ticket = await limiter.acquire_async()
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        limiter.release(ticket, 200)
+
+    async def run() -> None:
+        await asyncio.gather(*(work() for _ in range(10)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answers 429 with Retry-After to the first request, then a quote."""
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.hits += 1  # type: ignore[attr-defined]
+        if self.server.hits == 1:  # type: ignore[attr-defined]
+            raw = b'{"message": "slow down"}'
+            self.send_response(429)
+            self.send_header("Retry-After", "2")
+        else:
+            raw = b'[{"id": 1, "name": "PAC", "price": 10.0}]'
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_client_honours_retry_after(
+    monkeypatch: pytest.MonkeyPatch, shared: bool
+) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+    server.hits = 0  # type: ignore[attr-defined]
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    sleeps: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    limiter = RateLimiter() if shared else None
+    try:
+        client = SuperFreteClient(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            token="secret",
+            user_agent="test",
+            limiter=limiter,
+        )
+        assert client.calculate({})[0].price == 10.0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if shared:
+        # The retry itself waits 0s; the paused bucket delays the next call.
+        assert sleeps == [0.0, 0.0, pytest.approx(2.0, abs=0.1)]
+    else:
+        assert sleeps == [2.0]